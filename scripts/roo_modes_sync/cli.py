@@ -10,16 +10,19 @@ Provides a user-friendly interface for synchronizing Roo modes:
 """
 
 import argparse
+import copy
+import functools
 import os
 import sys
 import logging
 from pathlib import Path
-# typing imports removed as they're not used in this file
+from typing import Any
 
 # Handle both direct execution and module imports
 try:
     from .core.sync import ModeSync
     from .core.backup import BackupManager, BackupError
+    from .core.yaml_loaders import SafeLoader
     from .exceptions import SyncError
     from .mcp import run_mcp_server
 except ImportError:
@@ -32,14 +35,13 @@ except ImportError:
     
     from core.sync import ModeSync
     from core.backup import BackupManager, BackupError
+    from core.yaml_loaders import SafeLoader
     from exceptions import SyncError
     from mcp import run_mcp_server
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured in main(), not at import, so importing the CLI (as
+# the test suite does) leaves the root logger untouched
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logger = logging.getLogger("roo_modes_cli")
 
 
@@ -68,6 +70,26 @@ def get_default_modes_dir() -> Path:
     return modes_dir
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_strategy_config(content: str) -> Any:
+    """
+    Parse the text of a strategy configuration file.
+    
+    Results are memoized on the content itself, so an edited file is always
+    parsed again whatever its modification time. Callers must treat the
+    returned object as read-only.
+    
+    Args:
+        content: Configuration file text
+        
+    Returns:
+        Parsed YAML content
+    """
+    import yaml
+    
+    return yaml.load(content, Loader=SafeLoader)
+
+
 def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
     """
     Parse strategy argument which can be either a strategy name or a config file path.
@@ -91,7 +113,7 @@ def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
         
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = _parse_strategy_config(f.read())
             
             if not isinstance(config, dict):
                 raise SyncError(f"Invalid configuration file format: {config_path}")
@@ -101,8 +123,9 @@ def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
             if not strategy_name:
                 raise SyncError(f"No 'strategy' field found in configuration file: {config_path}")
             
-            # Extract all other fields as options (excluding 'strategy')
-            options = {k: v for k, v in config.items() if k != 'strategy'}
+            # Extract all other fields as options (excluding 'strategy'); deep-copied
+            # so nested values such as mode_groups are not shared with the memo
+            options = copy.deepcopy({k: v for k, v in config.items() if k != 'strategy'})
             
             logger.info(f"Loaded strategy '{strategy_name}' from configuration file: {config_path}")
             return strategy_name, options
@@ -464,12 +487,12 @@ def list_backups(args: argparse.Namespace) -> int:
         return 1
 
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entry point.
+    Build the command line argument parser.
     
     Returns:
-        Exit code (0 for success, non-zero for failure)
+        Configured argument parser with all subcommands
     """
     # Create main parser
     parser = argparse.ArgumentParser(
@@ -622,8 +645,21 @@ def main() -> int:
     )
     list_backups_parser.set_defaults(func=list_backups)
     
+    return parser
+
+
+def main() -> int:
+    """
+    Main CLI entry point.
+    
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    # Set up logging
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    
     # Parse arguments
-    args = parser.parse_args()
+    args = build_parser().parse_args()
     
     # Run command function
     return args.func(args)
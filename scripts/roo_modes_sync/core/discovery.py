@@ -9,11 +9,18 @@ Provides functionality for discovering and categorizing mode YAML files:
 - Robust path handling
 """
 
+import os
 import re
+import hashlib
 import logging
 from pathlib import Path
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from .yaml_loaders import SafeLoader as _SafeLoader
+except ImportError:
+    from yaml_loaders import SafeLoader as _SafeLoader
 
 # Try relative imports first, fall back to absolute imports
 try:
@@ -26,6 +33,9 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Slugs of the core workflow modes, matched by exact name
+CORE_MODE_SLUGS = ('code', 'architect', 'debug', 'ask', 'orchestrator', 'docs')
+
 class ModeDiscovery:
     """Handles dynamic discovery and categorization of mode files."""
     
@@ -43,10 +53,15 @@ class ModeDiscovery:
         self.recursive = recursive
         # Cache for slug-to-relative-path mapping for recursive search
         self._slug_to_path_cache = {}
+        # Full mode file paths from the same scan, so lookups never rebuild them
+        self._slug_to_file_cache: Dict[str, Path] = {}
+        # Last discovery result, keyed by the scanned files' (path, content digest)
+        self._discovery_cache_key = None
+        self._discovery_cache = None
         
         # Define category patterns for mode slugs
         self.category_patterns = {
-            'core': [r'^(code|architect|debug|ask|orchestrator|docs)$'],
+            'core': [rf"^({'|'.join(CORE_MODE_SLUGS)})$"],
             'enhanced': [r'.*-enhanced$', r'.*-plus$'],
             'specialized': [
                 r'.*-maintenance$',
@@ -56,6 +71,15 @@ class ModeDiscovery:
             ]
         }
         
+        # Precompiled classifier: core modes are a hashed lookup, the other
+        # categories one combined regex each, tried in category order
+        self._core_slugs = frozenset(CORE_MODE_SLUGS)
+        self._category_matchers = [
+            (category, re.compile('|'.join(f'(?:{pattern})' for pattern in patterns)).match)
+            for category, patterns in self.category_patterns.items()
+            if category != 'core'
+        ]
+        
         logger.debug(f"Initialized ModeDiscovery with directory: {self.modes_dir}, recursive: {self.recursive}")
     
     def _get_yaml_files(self) -> List[Path]:
@@ -65,31 +89,85 @@ class ModeDiscovery:
         Returns:
             List of Path objects for YAML files
         """
+        return [yaml_file for yaml_file, _ in self._scan_yaml_files()]
+    
+    def _scan_yaml_files(self) -> List[Tuple[Path, Path]]:
+        """
+        Collect YAML files in a single os.scandir pass.
+        
+        Directory entries carry their file type, so files are classified
+        without an extra stat per path and the relative path is built while
+        walking instead of through Path.relative_to().
+        
+        Returns:
+            List of (absolute path, path relative to modes_dir) tuples
+        """
         if not self.modes_dir.exists() or not self.modes_dir.is_dir():
             return []
             
-        try:
-            if self.recursive:
-                # Use recursive glob to find YAML files in subdirectories
-                yaml_files = list(self.modes_dir.rglob("*.yaml"))
-                logger.debug(f"Found {len(yaml_files)} YAML files recursively in {self.modes_dir}")
-            else:
-                # Use non-recursive glob to find YAML files only in root directory
-                yaml_files = list(self.modes_dir.glob("*.yaml"))
-                logger.debug(f"Found {len(yaml_files)} YAML files non-recursively in {self.modes_dir}")
+        yaml_files = []
+        pending = [(os.fspath(self.modes_dir), '')]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Like rglob(), never descend through directory symlinks,
+                        # which also keeps symlink cycles out of the walk
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                pending.append((entry.path, prefix + entry.name + os.sep))
+                        elif entry.name.endswith('.yaml') and entry.is_file():
+                            yaml_files.append((Path(entry.path), Path(prefix + entry.name)))
+            except OSError as e:
+                # Skip only the unreadable directory; the rest of the tree is still scanned
+                logger.warning(f"Error accessing directory {directory}: {e}")
+        
+        logger.debug(
+            f"Found {len(yaml_files)} YAML files "
+            f"{'recursively' if self.recursive else 'non-recursively'} in {self.modes_dir}"
+        )
+        return yaml_files
+    
+    @staticmethod
+    def _file_digest(yaml_file: Path) -> Optional[bytes]:
+        """
+        Hash a mode file's content for the discovery memo.
+        
+        Args:
+            yaml_file: Path to the YAML file
             
-            return yaml_files
-        except Exception as e:
-            logger.error(f"Error accessing modes directory {self.modes_dir}: {str(e)}")
-            return []
+        Returns:
+            blake2b digest of the file bytes, or None if it cannot be read
+        """
+        try:
+            with open(yaml_file, 'rb') as f:
+                return hashlib.blake2b(f.read(), digest_size=16).digest()
+        except OSError:
+            return None
     
     def discover_all_modes(self) -> Dict[str, List[str]]:
         """
         Discover and categorize all YAML mode files.
         
+        The result is memoized: when no mode file was added, removed or
+        modified since the previous call (same paths and content digests),
+        the files are read but not parsed again.
+        
         Returns:
             Dict with categories as keys and lists of mode slugs as values
         """
+        # Get all YAML files using the appropriate search method
+        yaml_files = self._scan_yaml_files()
+        
+        cache_key = tuple(
+            (str(relative_path), self._file_digest(yaml_file))
+            for yaml_file, relative_path in yaml_files
+        )
+        if yaml_files and cache_key == self._discovery_cache_key:
+            logger.debug(f"Mode files unchanged in {self.modes_dir}, reusing discovery result")
+            return {category: list(modes) for category, modes in self._discovery_cache.items()}
+        
         categorized_modes = {
             'core': [],
             'enhanced': [],
@@ -99,9 +177,10 @@ class ModeDiscovery:
         
         # Clear cache for fresh discovery
         self._slug_to_path_cache = {}
+        self._slug_to_file_cache = {}
+        self._discovery_cache_key = None
+        self._discovery_cache = None
         
-        # Get all YAML files using the appropriate search method
-        yaml_files = self._get_yaml_files()
         if not yaml_files:
             if not self.modes_dir.exists():
                 logger.warning(f"Modes directory does not exist: {self.modes_dir}")
@@ -112,21 +191,17 @@ class ModeDiscovery:
             return categorized_modes
         
         # Process each YAML file
-        for yaml_file in yaml_files:
+        for yaml_file, relative_path in yaml_files:
             mode_slug = yaml_file.stem
             
             # Store the relative path from modes_dir for this slug
-            try:
-                relative_path = yaml_file.relative_to(self.modes_dir)
-                self._slug_to_path_cache[mode_slug] = relative_path
-                logger.debug(f"Cached path mapping: {mode_slug} -> {relative_path}")
-            except ValueError:
-                # Fallback if relative_to fails
-                self._slug_to_path_cache[mode_slug] = Path(f"{mode_slug}.yaml")
-                logger.warning(f"Could not compute relative path for {yaml_file}, using fallback")
+            self._slug_to_path_cache[mode_slug] = relative_path
+            self._slug_to_file_cache[mode_slug] = yaml_file
+            logger.debug(f"Cached path mapping: {mode_slug} -> {relative_path}")
             
-            # Skip if not a valid YAML file that can be loaded
-            if not self._is_valid_mode_file(yaml_file):
+            # Skip if not a valid YAML file that can be loaded; the scan
+            # already established that the path is a regular file
+            if not self._has_valid_mode_structure(yaml_file):
                 logger.warning(f"Skipping invalid mode file: {yaml_file}")
                 continue
             
@@ -139,6 +214,9 @@ class ModeDiscovery:
         for category in categorized_modes:
             categorized_modes[category].sort()
         
+        self._discovery_cache_key = cache_key
+        self._discovery_cache = {category: list(modes) for category, modes in categorized_modes.items()}
+        
         # Log discovery results
         total_modes = sum(len(modes) for modes in categorized_modes.values())
         logger.info(f"Discovered {total_modes} valid modes across {len(categorized_modes)} categories")
@@ -154,10 +232,12 @@ class ModeDiscovery:
         Returns:
             Category name ('core', 'enhanced', 'specialized', or 'discovered')
         """
-        for category, patterns in self.category_patterns.items():
-            for pattern in patterns:
-                if re.match(pattern, mode_slug):
-                    return category
+        if mode_slug in self._core_slugs:
+            return 'core'
+        
+        for category, match in self._category_matchers:
+            if match(mode_slug):
+                return category
         
         return 'discovered'
     
@@ -168,16 +248,28 @@ class ModeDiscovery:
         Args:
             yaml_file: Path to the YAML file
             
+        Returns:
+            True if valid, False otherwise
+        """
+        if not yaml_file.exists() or not yaml_file.is_file():
+            logger.debug(f"Mode file does not exist or is not a file: {yaml_file}")
+            return False
+        
+        return self._has_valid_mode_structure(yaml_file)
+    
+    def _has_valid_mode_structure(self, yaml_file: Path) -> bool:
+        """
+        Load a mode file and check its basic structure.
+        
+        Args:
+            yaml_file: Path to an existing YAML file
+            
         Returns:
             True if valid, False otherwise
         """
         try:
-            if not yaml_file.exists() or not yaml_file.is_file():
-                logger.debug(f"Mode file does not exist or is not a file: {yaml_file}")
-                return False
-                
             with open(yaml_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
                 
             # Check if config is None or not a dictionary
             if config is None or not isinstance(config, dict):
@@ -264,15 +356,20 @@ class ModeDiscovery:
             
         name_lower = name.lower()
         
-        for yaml_file in self.modes_dir.glob("*.yaml"):
+        # One readdir pass; entries already know whether they are files
+        with os.scandir(self.modes_dir) as entries:
+            yaml_files = [entry.path for entry in entries
+                          if entry.name.endswith('.yaml') and entry.is_file()]
+        
+        for yaml_file in yaml_files:
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_SafeLoader)
                     
                 if (config and isinstance(config, dict) and 
                     'name' in config and isinstance(config['name'], str) and
                     name_lower in config['name'].lower()):
-                    return yaml_file.stem
+                    return os.path.basename(yaml_file)[:-len('.yaml')]
                     
             except Exception:
                 # Skip files with errors
@@ -292,6 +389,24 @@ class ModeDiscovery:
         """
         return self._slug_to_path_cache.get(mode_slug)
     
+    def get_mode_file_path(self, mode_slug: str) -> Path:
+        """
+        Get the mode file path for a slug.
+        
+        Discovered modes use the path recorded by the last scan; other slugs
+        fall back to <slug>.yaml directly under modes_dir.
+        
+        Args:
+            mode_slug: The mode slug to get the path for
+            
+        Returns:
+            Path to the mode file (which may not exist)
+        """
+        mode_file = self._slug_to_file_cache.get(mode_slug)
+        if mode_file is None:
+            mode_file = self.modes_dir / f"{mode_slug}.yaml"
+        return mode_file
+    
     def get_mode_info(self, mode_slug: str) -> Optional[Dict[str, Any]]:
         """
         Get information about a specific mode.
@@ -302,19 +417,14 @@ class ModeDiscovery:
         Returns:
             Dictionary with mode information if found, None otherwise
         """
-        # Try to use cached path first, fallback to simple path construction
-        relative_path = self.get_mode_relative_path(mode_slug)
-        if relative_path:
-            mode_file = self.modes_dir / relative_path
-        else:
-            mode_file = self.modes_dir / f"{mode_slug}.yaml"
+        mode_file = self.get_mode_file_path(mode_slug)
         
         if not mode_file.exists() or not mode_file.is_file():
             return None
             
         try:
             with open(mode_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_SafeLoader)
                 
             if not self._is_valid_mode_file(mode_file):
                 return None
@@ -12,6 +12,11 @@ from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 
+try:
+    from .yaml_loaders import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+except ImportError:
+    from yaml_loaders import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 class GlobalConfigFixer:
     """Fixes complex group structures in global Roo configuration files."""
@@ -46,18 +51,15 @@ class GlobalConfigFixer:
             if not isinstance(groups, list):
                 continue
                 
-            has_complex_groups = False
-            for group in groups:
-                if isinstance(group, dict):
-                    # Check if it has the problematic fileRegex/description structure
-                    for group_name, group_config in group.items():
-                        if isinstance(group_config, dict) and (
-                            'fileRegex' in group_config or 'description' in group_config
-                        ):
-                            has_complex_groups = True
-                            break
-                if has_complex_groups:
-                    break
+            # Check for the problematic fileRegex/description structure; any()
+            # stops at the first match without an explicit loop and flag
+            has_complex_groups = any(
+                isinstance(group_config, dict) and (
+                    'fileRegex' in group_config or 'description' in group_config
+                )
+                for group in groups if isinstance(group, dict)
+                for group_config in group.values()
+            )
             
             if has_complex_groups and mode_slug not in problematic_modes:
                 problematic_modes.append(mode_slug)
@@ -229,7 +231,7 @@ class GlobalConfigFixer:
             raise FileNotFoundError(f"Global config file not found: {config_path}")
         
         with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_SafeLoader)
     
     def save_global_config(self, config_data: Dict[str, Any], config_path: Path, 
                           preserve_as_comments: bool = False, 
@@ -259,10 +261,10 @@ class GlobalConfigFixer:
                             f.write(f"#   - Stripped description for '{group_name}': {detail['description']}\n")
                 
                 f.write("\n")
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False, indent=2)
+                yaml.dump(config_data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, indent=2)
         else:
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False, indent=2)
+                yaml.dump(config_data, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False, indent=2)
     
     def fix_global_config_file(self, config_path: Path, create_backup: bool = True) -> Dict[str, Any]:
         """
@@ -9,12 +9,21 @@ Provides functionality for synchronizing mode configurations:
 - MCP server interface support
 """
 
+import copy
+import hashlib
 import yaml
 import shutil
 import os
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from .yaml_loaders import SafeLoader as _SafeLoader
+except ImportError:
+    from yaml_loaders import SafeLoader as _SafeLoader
 
 
 class CustomYAMLDumper(yaml.SafeDumper):
@@ -70,6 +79,19 @@ class ModeSync:
     ENV_CONFIG_PATH = "ROO_MODES_CONFIG"
     ENV_VALIDATION_LEVEL = "ROO_MODES_VALIDATION_LEVEL"
     
+    # Below this many modes create_global_config reads files one by one; the
+    # thread pool used to prefetch them costs more than it saves
+    PARALLEL_READ_MIN_FILES = 16
+    
+    # Maximum number of emitted config documents kept by write_config
+    EMIT_CACHE_SIZE = 32
+    
+    # Keys that mark a complex group in an existing config
+    _COMPLEX_GROUP_KEYS = frozenset({'fileRegex', 'description'})
+    
+    # Scalar types whose repr() identifies the value and its type exactly
+    _EMIT_KEY_SCALARS = frozenset({str, int, float, bool, type(None)})
+    
     def __init__(self, modes_dir: Optional[Path] = None, recursive: bool = True):
         """
         Initialize with modes directory path.
@@ -121,6 +143,17 @@ class ModeSync:
             "collect_warnings": True,
             "validation_level": None  # Use validator's default
         }
+        
+        # Validated mode configs keyed by file, with the (content digest,
+        # validation settings) stamp they were produced under; see load_mode_config
+        self._load_cache: Dict[Path, Tuple[tuple, Dict[str, Any]]] = {}
+        # Emitted YAML keyed by the repr of the fixed config; see _emit_config_yaml
+        self._emit_cache: "OrderedDict[str, str]" = OrderedDict()
+    
+    def clear_cache(self) -> None:
+        """Forget all memoized mode configurations and emitted documents."""
+        self._load_cache.clear()
+        self._emit_cache.clear()
     
     def set_options(self, options: Dict[str, Any]) -> None:
         """
@@ -231,12 +264,133 @@ class ModeSync:
             logger.error(error_msg)
             raise SyncError(error_msg)
         
-    def load_mode_config(self, slug: str) -> Dict[str, Any]:
+    def _get_mode_file(self, slug: str) -> Path:
+        """
+        Resolve the YAML file for a mode slug.
+        
+        Args:
+            slug: Mode slug to resolve
+            
+        Returns:
+            Path to the mode file (which may not exist)
+        """
+        # Discovery keeps the full path of every scanned file, so this is a dict
+        # lookup; slugs it has not seen fall back to <slug>.yaml
+        return self.discovery.get_mode_file_path(slug)
+    
+    def _prefetch_mode_files(self, slugs: List[str]) -> Dict[str, str]:
+        """
+        Read the files for many modes concurrently.
+        
+        Only the file reads run in the thread pool; parsing and validation
+        stay in load_mode_config. Files that cannot be read are left out so
+        that load_mode_config reports the error the usual way.
+        
+        Args:
+            slugs: Mode slugs whose files should be read
+            
+        Returns:
+            Dictionary mapping slug to file content
+        """
+        if len(slugs) < self.PARALLEL_READ_MIN_FILES:
+            return {}
+        
+        def read(slug: str) -> Optional[str]:
+            try:
+                return self._get_mode_file(slug).read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                return None
+        
+        with ThreadPoolExecutor() as executor:
+            contents = executor.map(read, slugs)
+            return {slug: content for slug, content in zip(slugs, contents) if content is not None}
+    
+    def _finalize_mode_config(self, config: Any, slug: str, source_name: str) -> Dict[str, Any]:
+        """
+        Validate a parsed mode configuration and turn it into its sync form.
+        
+        Args:
+            config: Parsed mode configuration
+            slug: Mode slug (for log and error messages)
+            source_name: File name reported in validation messages
+            
+        Returns:
+            Validated configuration with development metadata stripped
+            
+        Raises:
+            SyncError: If validation collected errors and continuing is disabled
+            ModeValidationError: If validation fails without warning collection
+        """
+        # Validate the configuration
+        if self.options.get("collect_warnings", False):
+            result = self.validator.validate_mode_config(
+                config, 
+                source_name,
+                collect_warnings=True
+            )
+        
+            if not result.valid:
+                error_msgs = [w["message"] for w in result.warnings if w["level"] == "error"]
+                if error_msgs:
+                    error_msg = f"Validation errors in {slug}:\n" + "\n".join(error_msgs)
+                    logger.error(error_msg)
+                    if not self.options.get("continue_on_validation_error", False):
+                        raise SyncError(error_msg)
+        
+            # Log warnings
+            for warning in result.warnings:
+                if warning["level"] != "error":
+                    logger.warning(f"{slug}: {warning['message']}")
+        else:
+            # Standard validation without warning collection
+            self.validator.validate_mode_config(config, source_name)
+        
+        # Strip development metadata to create clean Roo-compatible config
+        config = self.validator.strip_development_metadata(config)
+        
+        # Ensure source is set to 'global' for sync output
+        config['source'] = 'global'
+        
+        return config
+    
+    def validate_mode_dict(self, config: Dict[str, Any], slug: str) -> Dict[str, Any]:
+        """
+        Validate an in-memory mode configuration the way load_mode_config does.
+        
+        Runs the same validation, metadata stripping and source tagging as
+        loading the mode from disk, without writing or parsing a file.
+        
+        Args:
+            config: Mode configuration dictionary
+            slug: Mode slug (for log and error messages)
+            
+        Returns:
+            Validated mode configuration dictionary
+            
+        Raises:
+            SyncError: If the configuration fails validation
+        """
+        try:
+            return self._finalize_mode_config(config, slug, f"{slug}.yaml")
+        except SyncError:
+            raise
+        except Exception as e:
+            error_msg = f"Error validating {slug}: {e}"
+            logger.error(error_msg)
+            raise SyncError(error_msg)
+    
+    def load_mode_config(self, slug: str, content: Optional[str] = None) -> Dict[str, Any]:
         """
         Load and validate a mode configuration.
         
+        Results are memoized per file. A later call returns a copy of the
+        cached config without re-parsing or re-validating as long as the
+        file's content and the validation settings are unchanged; validation
+        warnings are therefore only logged on the first load.
+        
         Args:
             slug: Mode slug to load
+            content: Already-read file content; when None the mode file is read
             
         Returns:
             Validated mode configuration dictionary
@@ -244,54 +398,39 @@ class ModeSync:
         Raises:
             SyncError: If the mode file does not exist or fails validation
         """
-        # Try to get the relative path from discovery cache first
-        relative_path = self.discovery.get_mode_relative_path(slug)
-        if relative_path:
-            mode_file = self.modes_dir / relative_path
-            logger.debug(f"Using cached path for {slug}: {relative_path}")
-        else:
-            # Fallback to simple path construction for backward compatibility
-            mode_file = self.modes_dir / f"{slug}.yaml"
-            logger.debug(f"Using fallback path for {slug}: {mode_file}")
+        mode_file = self._get_mode_file(slug)
         
-        if not mode_file.exists():
-            error_msg = f"Mode file not found: {mode_file}"
-            logger.error(error_msg)
-            raise SyncError(error_msg)
+        if content is None:
+            try:
+                with open(mode_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except FileNotFoundError:
+                error_msg = f"Mode file not found: {mode_file}"
+                logger.error(error_msg)
+                raise SyncError(error_msg)
+            except (OSError, UnicodeDecodeError) as e:
+                error_msg = f"Error loading {slug}: {e}"
+                logger.error(error_msg)
+                raise SyncError(error_msg)
+        
+        # Key on the content rather than mtime/size, which an edit can leave
+        # unchanged (restored timestamps, coarse mtime, same-length rewrites)
+        stamp = (
+            hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest(),
+            self.validator.validation_level,
+            self.options.get("collect_warnings", False),
+            self.options.get("continue_on_validation_error", False),
+        )
+        cached = self._load_cache.get(mode_file)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"Using memoized config for {slug}")
+            return copy.deepcopy(cached[1])
             
         try:
-            with open(mode_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                
-            # Validate the configuration
-            if self.options.get("collect_warnings", False):
-                result = self.validator.validate_mode_config(
-                    config, 
-                    str(mode_file),
-                    collect_warnings=True
-                )
-                
-                if not result.valid:
-                    error_msgs = [w["message"] for w in result.warnings if w["level"] == "error"]
-                    if error_msgs:
-                        error_msg = f"Validation errors in {slug}:\n" + "\n".join(error_msgs)
-                        logger.error(error_msg)
-                        if not self.options.get("continue_on_validation_error", False):
-                            raise SyncError(error_msg)
-                
-                # Log warnings
-                for warning in result.warnings:
-                    if warning["level"] != "error":
-                        logger.warning(f"{slug}: {warning['message']}")
-            else:
-                # Standard validation without warning collection
-                self.validator.validate_mode_config(config, str(mode_file))
-                
-            # Strip development metadata to create clean Roo-compatible config
-            config = self.validator.strip_development_metadata(config)
+            config = yaml.load(content, Loader=_SafeLoader)
+            config = self._finalize_mode_config(config, slug, str(mode_file))
             
-            # Ensure source is set to 'global' for sync output
-            config['source'] = 'global'
+            self._load_cache[mode_file] = (stamp, copy.deepcopy(config))
             
             logger.debug(f"Successfully loaded and validated mode: {slug}")
             return config
@@ -350,10 +489,11 @@ class ModeSync:
         success_count = 0
         failure_count = 0
         
-        # Load modes in the specified order
+        # Read large mode sets concurrently, then load modes in the specified order
+        prefetched = self._prefetch_mode_files(ordered_mode_slugs)
         for mode_slug in ordered_mode_slugs:
             try:
-                mode_config = self.load_mode_config(mode_slug)
+                mode_config = self.load_mode_config(mode_slug, prefetched.get(mode_slug))
                 config['customModes'].append(mode_config)
                 success_count += 1
             except SyncError as e:
@@ -376,20 +516,21 @@ class ModeSync:
         Returns:
             Formatted string
         """
-        if '\n' in text or len(text) > 80:
-            # Use literal scalar syntax for multiline text
-            prefix = ' ' * indent
-            # Escape any problematic characters and ensure proper line breaks
-            escaped_text = text.strip()
-            # Split into lines and indent each one
-            lines = escaped_text.split('\n')
-            formatted_lines = [f"{prefix}{line}" for line in lines]
-            return f"|-\n" + '\n'.join(formatted_lines)
-        else:
-            # Single line - always quote to avoid YAML parsing issues
-            # Escape any double quotes in the text
+        if len(text) <= 80 and '\n' not in text:
+            # Single line - always quote to avoid YAML parsing issues. Most names
+            # and descriptions have no double quotes, so skip the escaping copy
+            if '"' not in text:
+                return f'"{text}"'
             escaped_text = text.replace('"', '\\"')
             return f'"{escaped_text}"'
+        
+        # Use literal scalar syntax for multiline text
+        prefix = ' ' * indent
+        # Escape any problematic characters and ensure proper line breaks
+        escaped_text = text.strip()
+        # Split into lines and indent each one
+        lines = escaped_text.split('\n')
+        return "|-\n" + '\n'.join([f"{prefix}{line}" for line in lines])
     
     def backup_existing_config(self) -> bool:
         """
@@ -457,9 +598,23 @@ class ModeSync:
             }
         
         try:
-            # Load existing config
+            # Parse the existing config once into a node tree. Complex groups need a
+            # fileRegex or description key, so a tree without one is settled
+            # without constructing any Python objects; otherwise the config is
+            # built from the same tree
             with open(config_path, 'r', encoding='utf-8') as f:
-                existing_config = yaml.safe_load(f)
+                loader = _SafeLoader(f)
+                try:
+                    node = loader.get_single_node()
+                    if node is None or not self._has_complex_group_key(node):
+                        return {
+                            'has_complex_groups': False,
+                            'stripped_information': {},
+                            'warning_messages': []
+                        }
+                    existing_config = loader.construct_document(node)
+                finally:
+                    loader.dispose()
             
             if not existing_config or 'customModes' not in existing_config:
                 return {
@@ -488,6 +643,35 @@ class ModeSync:
                 'warning_messages': []
             }
     
+    @classmethod
+    def _has_complex_group_key(cls, node: yaml.Node) -> bool:
+        """
+        Check whether a composed YAML tree has a fileRegex or description key.
+        
+        Args:
+            node: Root node of the composed document
+            
+        Returns:
+            True at the first mapping key naming a complex group property
+        """
+        seen = set()
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            # Aliases share their anchor's node, so each node is visited once
+            # and recursive aliases cannot loop
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if isinstance(node, yaml.MappingNode):
+                for key_node, value_node in node.value:
+                    if isinstance(key_node, yaml.ScalarNode) and key_node.value in cls._COMPLEX_GROUP_KEYS:
+                        return True
+                    pending.append(value_node)
+            elif isinstance(node, yaml.SequenceNode):
+                pending.extend(node.value)
+        return False
+    
     def write_config(self, config: Dict[str, Any]) -> bool:
         """
         Write the configuration to the config file with proper formatting.
@@ -528,10 +712,9 @@ class ModeSync:
             # Ensure the parent directory exists
             config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Use custom YAML dumper for proper formatting and escaping with custom indentation
+            yaml_text = self._emit_config_yaml(fixed_config)
             with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(fixed_config, f, Dumper=CustomYAMLDumper, default_flow_style=False,
-                         allow_unicode=True, sort_keys=False, width=float('inf'), indent=2)
+                f.write(yaml_text)
             
             logger.info(f"Wrote configuration to {config_path}")
             return True
@@ -541,6 +724,70 @@ class ModeSync:
             logger.error(error_msg)
             raise SyncError(error_msg)
     
+    def _emit_config_yaml(self, config: Dict[str, Any]) -> str:
+        """
+        Serialize a configuration to YAML, reusing the text for an unchanged config.
+        
+        See _emit_cache_key for which configs are cached; the rest are always emitted.
+        
+        Args:
+            config: Configuration dictionary, already stripped of complex groups
+            
+        Returns:
+            YAML document text
+        """
+        cache_key = self._emit_cache_key(config)
+        
+        if cache_key is not None and cache_key in self._emit_cache:
+            self._emit_cache.move_to_end(cache_key)
+            return self._emit_cache[cache_key]
+        
+        # Use custom YAML dumper for proper formatting and escaping with custom indentation
+        yaml_text = yaml.dump(config, Dumper=CustomYAMLDumper, default_flow_style=False,
+                              allow_unicode=True, sort_keys=False, width=float('inf'), indent=2)
+        
+        if cache_key is not None:
+            self._emit_cache[cache_key] = yaml_text
+            if len(self._emit_cache) > self.EMIT_CACHE_SIZE:
+                self._emit_cache.popitem(last=False)
+        
+        return yaml_text
+    
+    @classmethod
+    def _emit_cache_key(cls, config: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the emit cache key for a configuration.
+        
+        The key is repr(config), which keeps key order (and so the emitted
+        order) and tells 1 from '1', 1.0 and True. It is only used when the
+        config is a tree of plain dicts, lists and scalars, where repr
+        reflects the full content.
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            Cache key, or None if the config cannot be keyed safely
+        """
+        seen = set()
+        pending = [config]
+        while pending:
+            value = pending.pop()
+            value_type = type(value)
+            if value_type is dict or value_type is list:
+                # Shared or self-referencing containers are emitted as anchors
+                if id(value) in seen:
+                    return None
+                seen.add(id(value))
+                if value_type is dict:
+                    pending.extend(value.keys())
+                    pending.extend(value.values())
+                else:
+                    pending.extend(value)
+            elif value_type not in cls._EMIT_KEY_SCALARS:
+                return None
+        return repr(config)
+    
     def write_global_config(self, config: Dict[str, Any]) -> bool:
         """
         Write the configuration to the global config file.
@@ -3,11 +3,44 @@
 Mode configuration validation functionality.
 """
 
+import os
 import re
+import sys
 import enum
-import yaml
+import hashlib
+import functools
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Union, Optional
+from typing import Callable, Dict, Any, List, Tuple, Union, Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml() -> Any:
+    """Import PyYAML on first use so importing this module stays cheap."""
+    import yaml
+    return yaml
+
+
+@functools.lru_cache(maxsize=None)
+def _safe_loader() -> Any:
+    """Return the shared safe loader, importing PyYAML on first use."""
+    try:
+        from .yaml_loaders import SafeLoader
+    except ImportError:
+        from yaml_loaders import SafeLoader
+    return SafeLoader
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_file_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a group's fileRegex, memoized per pattern string.
+    
+    Modes tend to share a handful of fileRegex values, so each is compiled
+    once per process. Invalid patterns raise re.error and are not cached.
+    """
+    return re.compile(pattern)
 
 
 class ValidationLevel(enum.Enum):
@@ -17,41 +50,312 @@ class ValidationLevel(enum.Enum):
     STRICT = 3      # Strict validation, reject any deviation from schema
 
 
+class ValidationErrorCode(enum.IntEnum):
+    """Machine-readable codes for mode validation failures."""
+    MISSING_REQUIRED = 1
+    UNEXPECTED_FIELD = 2
+    INVALID_TYPE = 3
+    EMPTY_FIELD = 4
+    INVALID_SLUG = 5
+    GROUPS_NOT_ARRAY = 6
+    EMPTY_GROUPS = 7
+    INVALID_GROUP = 8
+    INVALID_GROUP_ITEM = 9
+    INVALID_COMPLEX_GROUP = 10
+    MISSING_FILE_REGEX = 11
+    INVALID_FILE_REGEX = 12
+    UNEXPECTED_GROUP_PROPERTY = 13
+    EXTENDED_SCHEMA = 14
+
+
+# Error message templates keyed by name: (code, template).
+# Messages are only formatted when an error or warning is actually rendered.
+_MESSAGE_TEMPLATES: Dict[str, Tuple[ValidationErrorCode, str]] = {
+    'missing_required': (
+        ValidationErrorCode.MISSING_REQUIRED,
+        "Missing required fields in {filename}: {fields}"),
+    'unexpected_fields': (
+        ValidationErrorCode.UNEXPECTED_FIELD,
+        "Unexpected properties in {filename}: {fields}"),
+    'not_a_string': (
+        ValidationErrorCode.INVALID_TYPE,
+        "Field '{field}' in {filename} must be a string, got {type_name}"),
+    'empty_string': (
+        ValidationErrorCode.EMPTY_FIELD,
+        "Field '{field}' in {filename} cannot be empty"),
+    'invalid_slug': (
+        ValidationErrorCode.INVALID_SLUG,
+        "Invalid slug format in {filename}: {slug}. "
+        "Slugs must be lowercase alphanumeric with hyphens."),
+    'groups_not_array': (
+        ValidationErrorCode.GROUPS_NOT_ARRAY,
+        "Field 'groups' in {filename} must be an array"),
+    'empty_groups': (
+        ValidationErrorCode.EMPTY_GROUPS,
+        "Groups array in {filename} cannot be empty"),
+    'invalid_group_item': (
+        ValidationErrorCode.INVALID_GROUP_ITEM,
+        "Invalid group item in {filename}: {item}. Must be a string, array, or object."),
+    'invalid_group': (
+        ValidationErrorCode.INVALID_GROUP,
+        "Invalid group name in {filename}: '{group}'. Valid simple groups are: {valid}"),
+    'complex_array_length': (
+        ValidationErrorCode.INVALID_COMPLEX_GROUP,
+        "Complex group in {filename} must have exactly 2 items, got {count}"),
+    'complex_array_not_edit': (
+        ValidationErrorCode.INVALID_COMPLEX_GROUP,
+        "First item in complex group must be 'edit', got '{item}'"),
+    'complex_array_config_type': (
+        ValidationErrorCode.INVALID_COMPLEX_GROUP,
+        "Second item in complex group must be an object, got {type_name}"),
+    'complex_array_missing_regex': (
+        ValidationErrorCode.MISSING_FILE_REGEX,
+        "Complex group config must have 'fileRegex' property in {filename}"),
+    'file_regex_type': (
+        ValidationErrorCode.INVALID_FILE_REGEX,
+        "'fileRegex' must be a string in {filename}, got {type_name}"),
+    'file_regex_invalid': (
+        ValidationErrorCode.INVALID_FILE_REGEX,
+        "Invalid regex pattern '{pattern}' in {filename}"),
+    'complex_array_unexpected': (
+        ValidationErrorCode.UNEXPECTED_GROUP_PROPERTY,
+        "Unexpected properties in complex group config in {filename}: {props}"),
+    'complex_object_keys': (
+        ValidationErrorCode.INVALID_COMPLEX_GROUP,
+        "Complex group in {filename} must have exactly one key, got {count} keys: {keys}"),
+    'complex_object_group': (
+        ValidationErrorCode.INVALID_GROUP,
+        "Invalid group name '{group}' in complex group in {filename}. "
+        "Valid group names are: {valid}"),
+    'complex_object_config_type': (
+        ValidationErrorCode.INVALID_COMPLEX_GROUP,
+        "Complex group config for '{group}' must be an object in {filename}, got {type_name}"),
+    'complex_object_missing_regex': (
+        ValidationErrorCode.MISSING_FILE_REGEX,
+        "Complex group config for '{group}' must have 'fileRegex' property in {filename}"),
+    'complex_object_unexpected': (
+        ValidationErrorCode.UNEXPECTED_GROUP_PROPERTY,
+        "Unexpected properties in complex group config for '{group}' in {filename}: {props}"),
+    'extended_type': (
+        ValidationErrorCode.EXTENDED_SCHEMA,
+        "Property '{prop}' in {filename} must be {type_desc}"),
+    'extended_required': (
+        ValidationErrorCode.EXTENDED_SCHEMA,
+        "Missing required fields in '{prop}' in {filename}: {fields}"),
+}
+
+# Structured error detail: (template name, template fields)
+ErrorDetail = Tuple[str, Dict[str, Any]]
+
+
+def format_error_detail(detail: ErrorDetail) -> str:
+    """
+    Render a structured error detail as a message.
+    
+    Args:
+        detail: (template name, template fields) pair
+        
+    Returns:
+        Formatted error message
+    """
+    key, fields = detail
+    return _MESSAGE_TEMPLATES[key][1].format(**fields)
+
+
+def _add_detail(result: 'ValidationResult', detail: ErrorDetail, level: str = "warning") -> None:
+    """Record a structured error detail on a ValidationResult with its code and field."""
+    key, fields = detail
+    result.add_warning(format_error_detail(detail), level,
+                       code=_MESSAGE_TEMPLATES[key][0], field=fields.get('field'))
+
+
+class _StopValidation(Exception):
+    """Internal signal used by the is_valid() fast path to stop at the first error."""
+
+
+def _stop_on_error(detail: ErrorDetail) -> None:
+    raise _StopValidation
+
+
+def _ignore_warning(detail: ErrorDetail) -> None:
+    pass
+
+
+# Extended schema 'type' keywords mapped to (Python type, description for messages)
+_EXTENDED_SCHEMA_TYPES = {
+    'object': (dict, 'an object'),
+    'array': (list, 'an array'),
+    'string': (str, 'a string'),
+}
+
+# Compiled form of one extended schema property:
+# (property name, expected Python type or None, type description, required sub-fields)
+_CompiledProperty = Tuple[str, Optional[type], str, Tuple[str, ...]]
+
+
+class _Warning(Mapping):
+    """
+    A single validation warning.
+    
+    A read-only mapping with the 'level' and 'message' keys of the dictionaries
+    previously stored in ValidationResult.warnings, so lookups, ``in``, items(),
+    dict(w) and equality with such dictionaries keep working. Use to_dict() for
+    a plain dictionary (e.g. for JSON).
+    """
+    
+    __slots__ = ('level', 'message', 'field', 'code')
+    
+    _KEYS = ('level', 'message')
+    
+    def __init__(self, level: str, message: str, field: Optional[str] = None,
+                 code: Optional[ValidationErrorCode] = None):
+        """
+        Initialize a warning.
+        
+        Args:
+            level: Warning level ('info', 'warning', 'error')
+            message: Warning message
+            field: Config field the warning refers to, if any
+            code: Validation error code, if any
+        """
+        self.level = sys.intern(level)
+        self.message = message
+        self.field = field
+        self.code = code
+    
+    def __getitem__(self, key: str) -> str:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Return the warning as a plain {'level': ..., 'message': ...} dictionary."""
+        return {'level': self.level, 'message': self.message}
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Warning):
+            return (self.level, self.message, self.field, self.code) == \
+                   (other.level, other.message, other.field, other.code)
+        if isinstance(other, Mapping):
+            return dict(other) == self.to_dict()
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
 class ValidationResult:
     """Result of a validation operation, including warnings."""
     
-    def __init__(self, valid: bool, warnings: Optional[List[Dict[str, str]]] = None):
+    __slots__ = ('valid', 'warnings', 'codes', '_str_cache')
+    
+    def __init__(self, valid: bool, warnings: Optional[List[Union[_Warning, Dict[str, str]]]] = None):
         """
         Initialize validation result.
         
         Args:
             valid: Whether validation passed
-            warnings: List of warning dictionaries, each with 'level' and 'message'
+            warnings: List of warnings, each with 'level' and 'message'
         """
         self.valid = valid
         self.warnings = warnings or []
+        # Codes of all coded warnings, for O(1) checks without scanning messages
+        self.codes = {w.code for w in self.warnings
+                      if isinstance(w, _Warning) and w.code is not None}
+        # (valid, warning count, text) of the last __str__ call
+        self._str_cache: Optional[Tuple[bool, int, str]] = None
     
-    def add_warning(self, message: str, level: str = "warning"):
+    def add_warning(self, message: str, level: str = "warning",
+                    code: Optional[ValidationErrorCode] = None, field: Optional[str] = None):
         """
         Add a warning to the validation result.
         
         Args:
             message: Warning message
             level: Warning level ('info', 'warning', 'error')
+            code: Validation error code, if any
+            field: Config field the warning refers to, if any
+        """
+        self.warnings.append(_Warning(level, message, field, code))
+        if code is not None:
+            self.codes.add(code)
+    
+    def has(self, code: ValidationErrorCode) -> bool:
         """
-        self.warnings.append({
-            'level': level,
-            'message': message
-        })
+        Check whether any warning with the given code was recorded.
+        
+        Args:
+            code: Validation error code
+            
+        Returns:
+            True if a warning with that code is present
+        """
+        return code in self.codes
     
     def __str__(self):
         """String representation of validation result."""
-        return f"ValidationResult(valid={self.valid}, {len(self.warnings)} warnings)"
+        count = len(self.warnings)
+        cached = self._str_cache
+        # valid and warnings are public, so check the cached text still describes them
+        if cached is None or cached[0] != self.valid or cached[1] != count:
+            cached = (self.valid, count, f"ValidationResult(valid={self.valid}, {count} warnings)")
+            self._str_cache = cached
+        return cached[2]
 
 
 class ModeValidationError(Exception):
-    """Error raised when mode validation fails."""
-    pass
+    """
+    Error raised when mode validation fails.
+    
+    Carries structured error details; the message is only formatted when the
+    error is rendered with str().
+    """
+    
+    def __init__(self, message: Optional[str] = None,
+                 details: Optional[List[ErrorDetail]] = None):
+        """
+        Initialize validation error.
+        
+        Args:
+            message: Preformatted message (optional when details are given)
+            details: List of (template name, template fields) pairs
+        """
+        super().__init__(message)
+        self.details = list(details or [])
+        self._message = message
+    
+    @classmethod
+    def from_template(cls, key: str, **fields: Any) -> 'ModeValidationError':
+        """
+        Create an error for a single message template.
+        
+        Args:
+            key: Template name in the message template table
+            **fields: Values for the template placeholders
+            
+        Returns:
+            ModeValidationError instance
+        """
+        return cls(details=[(key, fields)])
+    
+    @property
+    def codes(self) -> List[ValidationErrorCode]:
+        """Error codes for all details carried by this error."""
+        return [_MESSAGE_TEMPLATES[key][0] for key, _ in self.details]
+    
+    def __str__(self):
+        """Formatted error message, one line per detail."""
+        if self._message is None:
+            self._message = "\n".join(format_error_detail(detail) for detail in self.details)
+        return self._message
 
 
 class YAMLStructureError(Exception):
@@ -64,19 +368,41 @@ class ModeValidator:
     
     # Define constants for validation
     REQUIRED_FIELDS = ['slug', 'name', 'roleDefinition', 'groups']
+    _REQUIRED = frozenset(REQUIRED_FIELDS)
     OPTIONAL_FIELDS = ['whenToUse', 'customInstructions']
     VALID_TOP_LEVEL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
     VALID_SIMPLE_GROUPS = ['read', 'edit', 'browser', 'command', 'mcp']
+    # Set form for O(1) membership checks; the list keeps message ordering
+    _VALID_GROUPS = frozenset(VALID_SIMPLE_GROUPS)
     SLUG_PATTERN = r'^[a-z0-9]+(-[a-z0-9]+)*$'
+    # Compiled once; matched with fullmatch so a trailing newline is rejected too
+    _SLUG_RE = re.compile(SLUG_PATTERN)
+    # Properties allowed in a complex group's config object
+    _FILE_REGEX_KEYS = frozenset({'fileRegex', 'description'})
     
     # Development metadata fields that are allowed but stripped during sync
     DEVELOPMENT_METADATA_FIELDS = ['source', 'model']
     ENHANCED_VALID_TOP_LEVEL_FIELDS = VALID_TOP_LEVEL_FIELDS + DEVELOPMENT_METADATA_FIELDS
+    _ENHANCED_VALID_FIELDS = frozenset(ENHANCED_VALID_TOP_LEVEL_FIELDS)
+    
+    # Maximum number of compiled extension combinations kept in memory
+    COMPILED_SCHEMA_CACHE_SIZE = 128
+    # Maximum number of validate_mode_file results kept in memory
+    RESULT_CACHE_SIZE = 1024
+    
+    # Below this many files validate_directory stays in-process; pool start-up costs more
+    PARALLEL_MIN_FILES = 16
     
     def __init__(self):
         """Initialize the validator with default settings."""
         self.validation_level = ValidationLevel.NORMAL
         self.extended_schemas = {}
+        # Compiled extended schemas keyed by the requested extension names
+        self._compiled_cache: "OrderedDict[Tuple[str, ...], List[Tuple[_CompiledProperty, ...]]]" = OrderedDict()
+        # validate_mode_file results keyed by a digest of the file bytes and settings
+        self._result_cache: "OrderedDict[bytes, Union[bool, ValidationResult]]" = OrderedDict()
+        # Bumped whenever a schema is registered so stale results never match
+        self._schema_generation = 0
     
     def set_validation_level(self, level: ValidationLevel):
         """
@@ -96,6 +422,80 @@ class ModeValidator:
             schema: Schema dictionary defining additional validation rules
         """
         self.extended_schemas[name] = schema
+        self._invalidate_schema_caches()
+    
+    def unregister_extended_schema(self, name: str) -> bool:
+        """
+        Remove a previously registered extended validation schema.
+        
+        Args:
+            name: Name of the extension schema
+            
+        Returns:
+            True if a schema was removed, False if none was registered under that name
+        """
+        if self.extended_schemas.pop(name, None) is None:
+            return False
+        self._invalidate_schema_caches()
+        return True
+    
+    def clear_cache(self) -> None:
+        """Forget all cached validate_mode_file results and compiled extended schemas."""
+        self._result_cache.clear()
+        self._compiled_cache.clear()
+    
+    def _invalidate_schema_caches(self) -> None:
+        """Drop compiled schemas and cached results that may depend on changed schemas."""
+        # Any compiled combination may include the changed schema
+        self._compiled_cache.clear()
+        self._schema_generation += 1
+    
+    def _get_compiled_extensions(self, extensions: List[str]) -> List[Tuple[_CompiledProperty, ...]]:
+        """
+        Get compiled extended schemas for a list of extension names.
+        
+        Compiled schemas are cached per extension combination so repeated
+        validations do not re-walk the schema dictionaries.
+        
+        Args:
+            extensions: List of extension schema names
+            
+        Returns:
+            List of compiled schemas, one per registered extension
+        """
+        key = tuple(extensions)
+        compiled = self._compiled_cache.get(key)
+        if compiled is not None:
+            self._compiled_cache.move_to_end(key)
+            return compiled
+        
+        compiled = [
+            self._compile_extended_schema(self.extended_schemas[extension])
+            for extension in extensions
+            if extension in self.extended_schemas
+        ]
+        self._compiled_cache[key] = compiled
+        if len(self._compiled_cache) > self.COMPILED_SCHEMA_CACHE_SIZE:
+            self._compiled_cache.popitem(last=False)
+        return compiled
+    
+    @staticmethod
+    def _compile_extended_schema(schema: Dict[str, Any]) -> Tuple[_CompiledProperty, ...]:
+        """
+        Compile an extended schema into a flat tuple of property checks.
+        
+        Args:
+            schema: Extended schema dictionary
+            
+        Returns:
+            Tuple of compiled property checks
+        """
+        compiled = []
+        for prop_name, prop_schema in schema.get('properties', {}).items():
+            expected_type, type_desc = _EXTENDED_SCHEMA_TYPES.get(prop_schema.get('type'), (None, ''))
+            required = tuple(prop_schema.get('required', ()))
+            compiled.append((prop_name, expected_type, type_desc, required))
+        return tuple(compiled)
     
     def validate_mode_config(self, config: Dict[str, Any], filename: str, 
                             collect_warnings: bool = False,
@@ -114,99 +514,41 @@ class ModeValidator:
             If collect_warnings is True: ValidationResult object
             
         Raises:
-            ModeValidationError: If validation fails
+            ModeValidationError: If validation fails (at STRICT level without
+                collect_warnings, only the first error is reported)
         """
-        result = ValidationResult(valid=True)
-        validation_errors = []
-        
-        # Check for required fields (always strict)
-        missing_fields = [field for field in self.REQUIRED_FIELDS if field not in config]
-        if missing_fields:
-            error_msg = f"Missing required fields in {filename}: {', '.join(missing_fields)}"
-            if collect_warnings:
-                result.valid = False
-                result.add_warning(error_msg, "error")
-                return result
-            else:
-                raise ModeValidationError(error_msg)
-        
-        # Check for unexpected top-level properties (using enhanced list that includes dev metadata)
-        unexpected_fields = [field for field in config if field not in self.ENHANCED_VALID_TOP_LEVEL_FIELDS]
-        if unexpected_fields:
-            error_msg = f"Unexpected properties in {filename}: {', '.join(unexpected_fields)}"
-            if self.validation_level == ValidationLevel.STRICT:
-                validation_errors.append(error_msg)
-            else:
-                # For non-strict levels, this is a warning
-                result.add_warning(error_msg)
+        # Without warning collection only errors matter, so valid configs take the
+        # is_valid fast path; the full pass below only runs to report failures
+        if not collect_warnings and self.is_valid(config, filename, extensions):
+            return True
         
-        # Validate string fields are strings and not empty
-        for field in ['slug', 'name', 'roleDefinition']:
-            try:
-                self._validate_string_field(config, field, filename)
-            except ModeValidationError as e:
-                validation_errors.append(str(e))
+        result = ValidationResult(valid=True)
+        validation_errors: List[ErrorDetail] = []
         
-        # Validate optional string fields if present
-        for field in ['whenToUse', 'customInstructions']:
-            if field in config:
-                try:
-                    self._validate_string_field(config, field, filename)
-                except ModeValidationError as e:
-                    validation_errors.append(str(e))
-        
-        # Validate slug format
-        if 'slug' in config and isinstance(config['slug'], str):
-            if not re.match(self.SLUG_PATTERN, config['slug']):
-                error_msg = (
-                    f"Invalid slug format in {filename}: {config['slug']}. "
-                    f"Slugs must be lowercase alphanumeric with hyphens."
-                )
-                
-                if self.validation_level == ValidationLevel.PERMISSIVE:
-                    result.add_warning(error_msg)
-                else:
-                    validation_errors.append(error_msg)
+        def add_warning(detail: ErrorDetail) -> None:
+            _add_detail(result, detail)
         
-        # Validate groups
-        if 'groups' in config:
-            # First check if groups is an array
-            if not isinstance(config['groups'], list):
-                error_msg = f"Field 'groups' in {filename} must be an array"
-                if collect_warnings:
-                    result.valid = False
-                    result.add_warning(error_msg, "error")
-                else:
-                    raise ModeValidationError(error_msg)
-            else:
-                try:
-                    self._validate_groups(config['groups'], filename)
-                except ModeValidationError as e:
-                    if (self.validation_level == ValidationLevel.PERMISSIVE and
-                        'cannot be empty' not in str(e)):  # Empty groups always invalid
-                        result.add_warning(str(e))
-                    else:
-                        validation_errors.append(str(e))
+        if self.validation_level == ValidationLevel.STRICT and not collect_warnings:
+            # Strict callers only get an exception, so stop at the first error
+            def add_error(detail: ErrorDetail) -> None:
+                validation_errors.append(detail)
+                raise _StopValidation
+        else:
+            add_error = validation_errors.append
         
-        # Apply extended schemas if specified
-        if extensions:
-            for extension in extensions:
-                if extension in self.extended_schemas:
-                    schema = self.extended_schemas[extension]
-                    try:
-                        self._validate_against_extended_schema(config, schema, filename)
-                    except ModeValidationError as e:
-                        validation_errors.append(str(e))
+        try:
+            self._check_mode_config(config, filename, extensions, add_error, add_warning)
+        except _StopValidation:
+            pass
         
         # If there are validation errors, raise exception or add to result
         if validation_errors:
-            error_msg = "\n".join(validation_errors)
             if collect_warnings:
                 result.valid = False
-                for error in validation_errors:
-                    result.add_warning(error, "error")
+                for detail in validation_errors:
+                    _add_detail(result, detail, "error")
             else:
-                raise ModeValidationError(error_msg)
+                raise ModeValidationError(details=validation_errors)
         
         # Return appropriate result
         if collect_warnings:
@@ -214,27 +556,158 @@ class ModeValidator:
         else:
             return True
     
-    def _validate_string_field(self, config: Dict[str, Any], field: str, filename: str) -> None:
+    def is_valid(self, config: Dict[str, Any], filename: str = "<config>",
+                 extensions: Optional[List[str]] = None) -> bool:
+        """
+        Check whether a mode configuration is valid.
+        
+        Fast path for callers that only need a yes/no answer: stops at the first
+        error and never builds a ValidationResult or formats any messages.
+        
+        Args:
+            config: Mode configuration dictionary
+            filename: Source filename (only used in error details)
+            extensions: List of extension schemas to apply
+            
+        Returns:
+            True if the configuration would pass validate_mode_config
+        """
+        if not isinstance(config, dict):
+            return False
+        
+        try:
+            self._check_mode_config(config, filename, extensions,
+                                    _stop_on_error, _ignore_warning)
+        except _StopValidation:
+            return False
+        return True
+    
+    def _check_mode_config(self, config: Dict[str, Any], filename: str,
+                           extensions: Optional[List[str]],
+                           on_error: Callable[[ErrorDetail], None],
+                           on_warning: Callable[[ErrorDetail], None]) -> None:
         """
-        Validate that a field is a non-empty string.
+        Run all mode configuration checks, reporting findings through callbacks.
         
         Args:
             config: Mode configuration dictionary
-            field: Field name to validate
             filename: Source filename (for error messages)
+            extensions: List of extension schemas to apply
+            on_error: Called with each error detail
+            on_warning: Called with each warning detail
+        """
+        # Check for required fields (always strict); nothing else is checked without them.
+        # A config that is not a mapping (e.g. a top-level YAML list) has none of them
+        missing = self._REQUIRED - config.keys() if isinstance(config, dict) else self._REQUIRED
+        if missing:
+            # Report in declaration order so messages stay stable
+            missing_fields = [field for field in self.REQUIRED_FIELDS if field in missing]
+            on_error(('missing_required', {'filename': filename, 'fields': ', '.join(missing_fields)}))
+            return
         
-        Raises:
-            ModeValidationError: If validation fails
+        # Single pass over the config, dispatching each field to its check
+        handlers = self._FIELD_HANDLERS
+        unexpected_fields = []
+        for field, value in config.items():
+            handler = handlers.get(field)
+            if handler is not None:
+                handler(self, field, value, filename, on_error, on_warning)
+            elif field not in self._ENHANCED_VALID_FIELDS:
+                unexpected_fields.append(field)
+        
+        # Report unexpected top-level properties (using enhanced list that includes dev metadata)
+        if unexpected_fields:
+            detail = ('unexpected_fields', {'filename': filename, 'fields': ', '.join(unexpected_fields)})
+            if self.validation_level == ValidationLevel.STRICT:
+                on_error(detail)
+            else:
+                # For non-strict levels, this is a warning
+                on_warning(detail)
+        
+        # Apply extended schemas if specified
+        if extensions:
+            for compiled_schema in self._get_compiled_extensions(extensions):
+                try:
+                    self._validate_against_extended_schema(config, compiled_schema, filename)
+                except ModeValidationError as e:
+                    on_error(e.details[0])
+    
+    def _check_string_field(self, field: str, value: Any, filename: str,
+                            on_error: Callable[[ErrorDetail], None],
+                            on_warning: Callable[[ErrorDetail], None]) -> None:
         """
-        value = config.get(field)
+        Check that a field is a non-empty string.
         
+        Args:
+            field: Field name being checked
+            value: Field value
+            filename: Source filename (for error messages)
+            on_error: Called with each error detail
+            on_warning: Called with each warning detail
+        """
         if not isinstance(value, str):
-            raise ModeValidationError(
-                f"Field '{field}' in {filename} must be a string, got {type(value).__name__}"
-            )
+            on_error(('not_a_string', {'field': field, 'filename': filename,
+                                       'type_name': type(value).__name__}))
+        elif value == "":
+            on_error(('empty_string', {'field': field, 'filename': filename}))
+    
+    def _check_slug_field(self, field: str, value: Any, filename: str,
+                          on_error: Callable[[ErrorDetail], None],
+                          on_warning: Callable[[ErrorDetail], None]) -> None:
+        """
+        Check that the slug is a non-empty string in the expected format.
+        
+        Args:
+            field: Field name being checked
+            value: Field value
+            filename: Source filename (for error messages)
+            on_error: Called with each error detail
+            on_warning: Called with each warning detail
+        """
+        self._check_string_field(field, value, filename, on_error, on_warning)
+        if isinstance(value, str) and self._SLUG_RE.fullmatch(value) is None:
+            detail = ('invalid_slug', {'filename': filename, 'slug': value})
+            if self.validation_level == ValidationLevel.PERMISSIVE:
+                on_warning(detail)
+            else:
+                on_error(detail)
+    
+    def _check_groups_field(self, field: str, value: Any, filename: str,
+                            on_error: Callable[[ErrorDetail], None],
+                            on_warning: Callable[[ErrorDetail], None]) -> None:
+        """
+        Check the groups configuration.
         
-        if value == "":
-            raise ModeValidationError(f"Field '{field}' in {filename} cannot be empty")
+        Args:
+            field: Field name being checked
+            value: Field value
+            filename: Source filename (for error messages)
+            on_error: Called with each error detail
+            on_warning: Called with each warning detail
+        """
+        if not isinstance(value, list):
+            on_error(('groups_not_array', {'filename': filename}))
+            return
+        
+        try:
+            self._validate_groups(value, filename)
+        except ModeValidationError as e:
+            if (self.validation_level == ValidationLevel.PERMISSIVE and
+                ValidationErrorCode.EMPTY_GROUPS not in e.codes):  # Empty groups always invalid
+                on_warning(e.details[0])
+            else:
+                on_error(e.details[0])
+    
+    # Per-field checks used by the single pass in _check_mode_config. Built once when
+    # the class is defined, so validators do not each bind their own handler table.
+    _FIELD_HANDLERS = {
+        'slug': _check_slug_field,
+        'name': _check_string_field,
+        'roleDefinition': _check_string_field,
+        'whenToUse': _check_string_field,
+        'customInstructions': _check_string_field,
+        'groups': _check_groups_field,
+    }
     
     def _validate_groups(self, groups: List, filename: str) -> None:
         """
@@ -249,20 +722,22 @@ class ModeValidator:
         """
         
         if not groups:
-            raise ModeValidationError(f"Groups array in {filename} cannot be empty")
+            raise ModeValidationError.from_template('empty_groups', filename=filename)
         
-        # Validate each group item
+        # Validate each group item; valid simple names (the common case) are a
+        # single set lookup with no further calls
+        valid_groups = self._VALID_GROUPS
         for group_item in groups:
             if isinstance(group_item, str):
-                self._validate_simple_group(group_item, filename)
+                if group_item not in valid_groups:
+                    self._validate_simple_group(group_item, filename)
             elif isinstance(group_item, list):
                 self._validate_complex_group_array(group_item, filename)
             elif isinstance(group_item, dict):
                 self._validate_complex_group_object(group_item, filename)
             else:
-                raise ModeValidationError(
-                    f"Invalid group item in {filename}: {group_item}. "
-                    f"Must be a string, array, or object."
+                raise ModeValidationError.from_template(
+                    'invalid_group_item', filename=filename, item=group_item
                 )
     
     def _validate_simple_group(self, group_name: str, filename: str) -> None:
@@ -276,10 +751,10 @@ class ModeValidator:
         Raises:
             ModeValidationError: If validation fails
         """
-        if group_name not in self.VALID_SIMPLE_GROUPS:
-            raise ModeValidationError(
-                f"Invalid group name in {filename}: '{group_name}'. "
-                f"Valid simple groups are: {', '.join(self.VALID_SIMPLE_GROUPS)}"
+        if group_name not in self._VALID_GROUPS:
+            raise ModeValidationError.from_template(
+                'invalid_group', filename=filename, group=group_name,
+                valid=', '.join(self.VALID_SIMPLE_GROUPS)
             )
     
     def _validate_complex_group_array(self, complex_group: List, filename: str) -> None:
@@ -295,52 +770,51 @@ class ModeValidator:
         """
         # Must have exactly 2 items
         if len(complex_group) != 2:
-            raise ModeValidationError(
-                f"Complex group in {filename} must have exactly 2 items, got {len(complex_group)}"
+            raise ModeValidationError.from_template(
+                'complex_array_length', filename=filename, count=len(complex_group)
             )
         
         # First item must be 'edit'
         if complex_group[0] != 'edit':
-            raise ModeValidationError(
-                f"First item in complex group must be 'edit', got '{complex_group[0]}'"
+            raise ModeValidationError.from_template(
+                'complex_array_not_edit', item=complex_group[0]
             )
         
         # Second item must be an object
         if not isinstance(complex_group[1], dict):
-            raise ModeValidationError(
-                f"Second item in complex group must be an object, got {type(complex_group[1]).__name__}"
+            raise ModeValidationError.from_template(
+                'complex_array_config_type', type_name=type(complex_group[1]).__name__
             )
         
         # Must have fileRegex property
         config_obj = complex_group[1]
         if 'fileRegex' not in config_obj:
-            raise ModeValidationError(
-                f"Complex group config must have 'fileRegex' property in {filename}"
+            raise ModeValidationError.from_template(
+                'complex_array_missing_regex', filename=filename
             )
         
         # fileRegex must be a valid regex
         file_regex = config_obj['fileRegex']
         if not isinstance(file_regex, str):
-            raise ModeValidationError(
-                f"'fileRegex' must be a string in {filename}, got {type(file_regex).__name__}"
+            raise ModeValidationError.from_template(
+                'file_regex_type', filename=filename, type_name=type(file_regex).__name__
             )
         
         # Check that the regex is valid
         try:
-            re.compile(file_regex)
+            _compile_file_regex(file_regex)
         except re.error:
-            raise ModeValidationError(
-                f"Invalid regex pattern '{file_regex}' in {filename}"
+            raise ModeValidationError.from_template(
+                'file_regex_invalid', pattern=file_regex, filename=filename
             )
         
         # Check for unexpected properties
-        valid_config_props = ['fileRegex', 'description']
-        unexpected_props = [prop for prop in config_obj if prop not in valid_config_props]
+        unexpected_props = [prop for prop in config_obj if prop not in self._FILE_REGEX_KEYS]
         if unexpected_props:
             if self.validation_level == ValidationLevel.STRICT:
-                raise ModeValidationError(
-                    f"Unexpected properties in complex group config in {filename}: "
-                    f"{', '.join(unexpected_props)}"
+                raise ModeValidationError.from_template(
+                    'complex_array_unexpected', filename=filename,
+                    props=', '.join(unexpected_props)
                 )
             # Otherwise, we'll let it pass (NORMAL or PERMISSIVE levels)
     
@@ -359,8 +833,9 @@ class ModeValidator:
         """
         # Must have exactly one key
         if len(complex_group) != 1:
-            raise ModeValidationError(
-                f"Complex group in {filename} must have exactly one key, got {len(complex_group)} keys: {list(complex_group.keys())}"
+            raise ModeValidationError.from_template(
+                'complex_object_keys', filename=filename, count=len(complex_group),
+                keys=list(complex_group.keys())
             )
         
         # Get the group name (the key) and config (the value)
@@ -368,91 +843,85 @@ class ModeValidator:
         group_config = complex_group[group_name]
         
         # Group name must be valid
-        if group_name not in self.VALID_SIMPLE_GROUPS:
-            raise ModeValidationError(
-                f"Invalid group name '{group_name}' in complex group in {filename}. "
-                f"Valid group names are: {', '.join(self.VALID_SIMPLE_GROUPS)}"
+        if group_name not in self._VALID_GROUPS:
+            raise ModeValidationError.from_template(
+                'complex_object_group', group=group_name, filename=filename,
+                valid=', '.join(self.VALID_SIMPLE_GROUPS)
             )
         
         # Group config must be an object
         if not isinstance(group_config, dict):
-            raise ModeValidationError(
-                f"Complex group config for '{group_name}' must be an object in {filename}, got {type(group_config).__name__}"
+            raise ModeValidationError.from_template(
+                'complex_object_config_type', group=group_name, filename=filename,
+                type_name=type(group_config).__name__
             )
         
         # Must have fileRegex property
         if 'fileRegex' not in group_config:
-            raise ModeValidationError(
-                f"Complex group config for '{group_name}' must have 'fileRegex' property in {filename}"
+            raise ModeValidationError.from_template(
+                'complex_object_missing_regex', group=group_name, filename=filename
             )
         
         # fileRegex must be a valid regex string
         file_regex = group_config['fileRegex']
         if not isinstance(file_regex, str):
-            raise ModeValidationError(
-                f"'fileRegex' must be a string in {filename}, got {type(file_regex).__name__}"
+            raise ModeValidationError.from_template(
+                'file_regex_type', filename=filename, type_name=type(file_regex).__name__
             )
         
         # Check that the regex is valid
         try:
-            re.compile(file_regex)
+            _compile_file_regex(file_regex)
         except re.error:
-            raise ModeValidationError(
-                f"Invalid regex pattern '{file_regex}' in {filename}"
+            raise ModeValidationError.from_template(
+                'file_regex_invalid', pattern=file_regex, filename=filename
             )
         
         # Check for unexpected properties
-        valid_config_props = ['fileRegex', 'description']
-        unexpected_props = [prop for prop in group_config if prop not in valid_config_props]
+        unexpected_props = [prop for prop in group_config if prop not in self._FILE_REGEX_KEYS]
         if unexpected_props:
             if self.validation_level == ValidationLevel.STRICT:
-                raise ModeValidationError(
-                    f"Unexpected properties in complex group config for '{group_name}' in {filename}: "
-                    f"{', '.join(unexpected_props)}"
+                raise ModeValidationError.from_template(
+                    'complex_object_unexpected', group=group_name, filename=filename,
+                    props=', '.join(unexpected_props)
                 )
             # Otherwise, we'll let it pass (NORMAL or PERMISSIVE levels)
     
-    def _validate_against_extended_schema(self, config: Dict[str, Any], schema: Dict[str, Any], filename: str) -> None:
+    def _validate_against_extended_schema(self, config: Dict[str, Any],
+                                          compiled_schema: Tuple[_CompiledProperty, ...],
+                                          filename: str) -> None:
         """
-        Validate a config against an extended schema.
+        Validate a config against a compiled extended schema.
         
         Args:
             config: Mode configuration dictionary
-            schema: Extended schema dictionary
+            compiled_schema: Extended schema compiled by _compile_extended_schema
             filename: Source filename (for error messages)
             
         Raises:
             ModeValidationError: If validation fails
         """
         # Simple implementation - can be expanded with a full JSON Schema validator
-        if 'properties' in schema:
-            for prop_name, prop_schema in schema['properties'].items():
-                # Check if the property is present
-                if prop_name in config:
-                    # Check type
-                    if 'type' in prop_schema:
-                        expected_type = prop_schema['type']
-                        if expected_type == 'object' and not isinstance(config[prop_name], dict):
-                            raise ModeValidationError(
-                                f"Property '{prop_name}' in {filename} must be an object"
-                            )
-                        elif expected_type == 'array' and not isinstance(config[prop_name], list):
-                            raise ModeValidationError(
-                                f"Property '{prop_name}' in {filename} must be an array"
-                            )
-                        elif expected_type == 'string' and not isinstance(config[prop_name], str):
-                            raise ModeValidationError(
-                                f"Property '{prop_name}' in {filename} must be a string"
-                            )
-                    
-                    # Check required sub-properties for objects
-                    if isinstance(config[prop_name], dict) and 'required' in prop_schema:
-                        obj = config[prop_name]
-                        missing = [field for field in prop_schema['required'] if field not in obj]
-                        if missing:
-                            raise ModeValidationError(
-                                f"Missing required fields in '{prop_name}' in {filename}: {', '.join(missing)}"
-                            )
+        for prop_name, expected_type, type_desc, required in compiled_schema:
+            # Check if the property is present
+            if prop_name not in config:
+                continue
+            value = config[prop_name]
+            
+            # Check type
+            if expected_type is not None and not isinstance(value, expected_type):
+                raise ModeValidationError.from_template(
+                    'extended_type', prop=prop_name, filename=filename, type_desc=type_desc
+                )
+            
+            # Check required sub-properties for objects
+            if required and isinstance(value, dict):
+                missing = [field for field in required if field not in value]
+                if missing:
+                    raise ModeValidationError.from_template(
+                        'extended_required', prop=prop_name, filename=filename,
+                        fields=', '.join(missing)
+                    )
     
     def get_development_metadata_fields(self) -> List[str]:
         """
@@ -528,8 +997,8 @@ class ModeValidator:
             
             # Parse YAML
             try:
-                parsed_yaml = yaml.safe_load(content)
-            except yaml.YAMLError as e:
+                parsed_yaml = _yaml().load(content, Loader=_safe_loader())
+            except _yaml().YAMLError as e:
                 error_msg = f"YAML parsing error in {file_path}: {str(e)}"
                 if collect_warnings:
                     result.valid = False
@@ -611,7 +1080,7 @@ class ModeValidator:
                     )
                 else:
                     group_name = list(group_item.keys())[0]
-                    if group_name not in self.VALID_SIMPLE_GROUPS:
+                    if group_name not in self._VALID_GROUPS:
                         issues.append(
                             f"Invalid group name '{group_name}' in complex group at groups[{i}]"
                         )
@@ -649,6 +1118,59 @@ class ModeValidator:
             YAMLStructureError: If YAML structure validation fails
             ModeValidationError: If mode configuration validation fails
         """
+        cache_key = self._result_cache_key(file_path, collect_warnings, extensions)
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            cached = self._result_cache[cache_key]
+            if isinstance(cached, ValidationResult):
+                # Hand out a copy so callers cannot mutate the cached entry
+                return ValidationResult(valid=cached.valid, warnings=list(cached.warnings))
+            return cached
+        
+        result = self._validate_mode_file_uncached(file_path, collect_warnings, extensions)
+        
+        if cache_key is not None:
+            self._result_cache[cache_key] = (
+                ValidationResult(valid=result.valid, warnings=list(result.warnings))
+                if isinstance(result, ValidationResult) else result
+            )
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return result
+    
+    def _result_cache_key(self, file_path: str, collect_warnings: bool,
+                          extensions: Optional[List[str]]) -> Optional[bytes]:
+        """
+        Build the validate_mode_file cache key for a file.
+        
+        The key is a digest of the file contents together with everything else that
+        affects the outcome: the path (which appears in messages), validation level,
+        result form, requested extensions and the schema generation.
+        
+        Args:
+            file_path: Path to the mode file
+            collect_warnings: Whether a ValidationResult is requested
+            extensions: List of extension schemas to apply
+            
+        Returns:
+            Cache key, or None if the file cannot be read
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except (IOError, OSError):
+            return None
+        
+        digest = hashlib.blake2b(content, digest_size=16)
+        settings = (str(file_path), self.validation_level.value, collect_warnings,
+                    tuple(extensions or ()), self._schema_generation)
+        digest.update(repr(settings).encode('utf-8'))
+        return digest.digest()
+    
+    def _validate_mode_file_uncached(self, file_path: str, collect_warnings: bool,
+                                     extensions: Optional[List[str]]) -> Union[bool, ValidationResult]:
+        """Validate a mode file without consulting the result cache (see validate_mode_file)."""
         # First validate YAML structure
         yaml_result = self.validate_yaml_structure(file_path, collect_warnings=collect_warnings)
         
@@ -663,7 +1185,7 @@ class ModeValidator:
         # If YAML structure is valid, load and validate mode configuration
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                parsed_yaml = yaml.safe_load(f)
+                parsed_yaml = _yaml().load(f, Loader=_safe_loader())
             
             # Validate mode configuration
             filename = Path(file_path).name
@@ -692,11 +1214,67 @@ class ModeValidator:
                 return result
             else:
                 raise YAMLStructureError(error_msg)
-        except yaml.YAMLError as e:
+        except _yaml().YAMLError as e:
             error_msg = f"YAML parsing error in {file_path}: {str(e)}"
             if collect_warnings:
                 result = ValidationResult(valid=False)
                 result.add_warning(error_msg, "error")
                 return result
             else:
-                raise YAMLStructureError(error_msg)
\ No newline at end of file
+                raise YAMLStructureError(error_msg)
+    
+    def validate_directory(self, directory: Union[str, Path],
+                           extensions: Optional[List[str]] = None,
+                           workers: Optional[int] = None) -> Dict[Path, ValidationResult]:
+        """
+        Validate every mode file in a directory, in parallel for large directories.
+        
+        Files are sharded across a process pool whose workers each build one validator
+        with this validator's level and extended schemas. Small directories, or
+        workers=1, are validated in-process so the result cache is used.
+        
+        Args:
+            directory: Directory containing mode YAML files
+            extensions: List of extension schemas to apply
+            workers: Maximum number of worker processes (default: CPU count)
+            
+        Returns:
+            Mapping of file path to ValidationResult, in sorted path order
+        """
+        # A single scandir pass; entries already know whether they are files
+        try:
+            with os.scandir(directory) as entries:
+                files = sorted(Path(entry.path) for entry in entries
+                               if entry.name.endswith('.yaml') and entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            files = []
+        
+        if workers == 1 or len(files) < self.PARALLEL_MIN_FILES:
+            return {
+                path: self.validate_mode_file(str(path), collect_warnings=True, extensions=extensions)
+                for path in files
+            }
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.validation_level, self.extended_schemas)) as executor:
+            results = executor.map(_validate_in_worker, [str(path) for path in files],
+                                   [extensions] * len(files), chunksize=8)
+            return dict(zip(files, results))
+
+
+# Per-process validator used by validate_directory workers
+_WORKER_VALIDATOR: Optional[ModeValidator] = None
+
+
+def _init_worker(level: ValidationLevel, extended_schemas: Dict[str, Dict[str, Any]]) -> None:
+    """Create the worker's validator once, mirroring the parent's settings."""
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = ModeValidator()
+    _WORKER_VALIDATOR.set_validation_level(level)
+    for name, schema in extended_schemas.items():
+        _WORKER_VALIDATOR.register_extended_schema(name, schema)
+
+
+def _validate_in_worker(file_path: str, extensions: Optional[List[str]]) -> ValidationResult:
+    """Validate one mode file with the worker's validator."""
+    return _WORKER_VALIDATOR.validate_mode_file(file_path, collect_warnings=True, extensions=extensions)
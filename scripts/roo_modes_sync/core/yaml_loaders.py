@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+YAML loader/dumper selection shared by the core modules.
+
+Exposes ``SafeLoader`` and ``SafeDumper``: the libyaml (C) classes when
+PyYAML was built with them, the pure-Python safe classes otherwise.
+"""
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader
+    from yaml import SafeDumper
+
+__all__ = ['SafeLoader', 'SafeDumper']
@@ -27,11 +27,7 @@ except ImportError:
     from core.backup import BackupManager, BackupError
     from exceptions import SyncError
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by the entry point (cli.main or __main__ below)
 logger = logging.getLogger("roo_modes_mcp")
 
 
@@ -599,6 +595,12 @@ def run_mcp_server(modes_dir: Path) -> None:
 
 
 if __name__ == "__main__":
+    # Set up logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Default to current directory if not specified
     modes_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
     run_mcp_server(modes_dir)
\ No newline at end of file
@@ -6,13 +6,17 @@ This script runs pytest on the package's test directory, properly setting up the
 to ensure imports work correctly. It can run all tests or specific test files as specified
 by command line arguments.
 
+When pytest-xdist is installed the tests are spread across all CPU cores
+(pytest -n auto --dist loadscope); pass --serial to run them in a single process.
+
 Usage:
-    python run_tests.py [test_file1.py [test_file2.py ...]]
+    python run_tests.py [--serial] [test_file1.py [test_file2.py ...]]
 """
 
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 
@@ -36,7 +40,9 @@ def main():
     print(f"Package directory: {scripts_dir}")
     
     # Get test files to run from command line arguments
-    test_paths = sys.argv[1:] if len(sys.argv) > 1 else []
+    args = sys.argv[1:]
+    serial = "--serial" in args
+    test_paths = [arg for arg in args if arg != "--serial"]
     
     # Construct the pytest command
     pytest_command = ["pytest"]
@@ -55,6 +61,12 @@ def main():
     # Add verbosity flag
     pytest_command.append("-v")
     
+    # Tests are isolated (own temp dirs), so run them on every core when possible.
+    # Sharding by scope keeps each class on one worker, so class-scoped fixtures
+    # are built once instead of once per worker.
+    if not serial and importlib.util.find_spec("xdist") is not None:
+        pytest_command.extend(["-n", "auto", "--dist", "loadscope"])
+    
     # Update Python path for the subprocess
     env = os.environ.copy()
     python_path = [str(scripts_dir)]
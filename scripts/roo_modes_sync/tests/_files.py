@@ -0,0 +1,30 @@
+"""Fixture-file helpers shared by the test modules.
+
+Mode files are written with a single unbuffered ``os.write`` and, for the
+standard valid config, from a string template: formatting a string is far
+cheaper than running PyYAML's emitter for every test file.
+"""
+
+import os
+
+# Standard valid mode file; format with slug and name
+VALID_MODE_YAML = (
+    "slug: {slug}\n"
+    "name: {name}\n"
+    "roleDefinition: Test {slug} role definition\n"
+    "groups:\n"
+    "- read\n"
+    "- edit\n"
+)
+
+
+def write_file(path: str, text: str) -> None:
+    """Write a small fixture file with one unbuffered os.write call."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
+__all__ = ['VALID_MODE_YAML', 'write_file']
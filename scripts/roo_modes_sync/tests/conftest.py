@@ -0,0 +1,39 @@
+"""Shared fixtures for roo_modes_sync tests."""
+
+import pytest
+import yaml
+
+from roo_modes_sync.core.validation import ModeValidator, ValidationLevel
+from roo_modes_sync.core.yaml_loaders import SafeLoader, SafeDumper
+
+
+def pytest_sessionstart(session):
+    """Run one YAML load and dump before any test is collected or timed.
+    
+    The first round trip in a fresh interpreter (or xdist worker) pays
+    one-off first-use costs in PyYAML; doing it here keeps them out of
+    whichever test happens to run first.
+    """
+    yaml.dump(yaml.load("warm-up: [1, 2]\n", Loader=SafeLoader), Dumper=SafeDumper)
+
+
+@pytest.fixture(scope="class")
+def class_modes_dir(tmp_path_factory):
+    """Create one modes directory shared by every test in a class."""
+    return tmp_path_factory.mktemp("modes")
+
+
+@pytest.fixture(scope="session")
+def shared_validator():
+    """Create one validator instance for the whole test session."""
+    return ModeValidator()
+
+
+@pytest.fixture
+def validator(shared_validator):
+    """Provide the shared validator, restoring its default state after each test."""
+    yield shared_validator
+    shared_validator.set_validation_level(ValidationLevel.NORMAL)
+    for name in list(shared_validator.extended_schemas):
+        shared_validator.unregister_extended_schema(name)
+    shared_validator.clear_cache()
@@ -5,6 +5,7 @@ Tests for CLI functionality.
 Tests the command line interface including backup, restore, and list-backups commands.
 """
 
+import argparse
 import pytest
 import tempfile
 import sys
@@ -81,7 +82,6 @@ class TestCLIBackupCommands:
         monkeypatch.setattr(sys, "argv", test_args)
         
         # Create argparse Namespace object
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir=str(temp_project_dir)
@@ -100,7 +100,6 @@ class TestCLIBackupCommands:
     
     def test_backup_files_local_only(self, temp_project_dir, monkeypatch, capsys):
         """Test backing up local files only."""
-        import argparse
         args = argparse.Namespace(
             type="local",
             project_dir=str(temp_project_dir)
@@ -114,7 +113,6 @@ class TestCLIBackupCommands:
     
     def test_backup_files_global_only(self, temp_project_dir, monkeypatch, capsys):
         """Test backing up global files only."""
-        import argparse
         args = argparse.Namespace(
             type="global",
             project_dir=str(temp_project_dir)
@@ -129,7 +127,6 @@ class TestCLIBackupCommands:
     def test_backup_files_no_files(self, monkeypatch, capsys):
         """Test backup when no files exist."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            import argparse
             args = argparse.Namespace(
                 type="all",
                 project_dir=temp_dir
@@ -149,7 +146,6 @@ class TestCLIBackupCommands:
         backup_manager.backup_global_roomodes()
         backup_manager.backup_custom_modes()
         
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir=str(temp_project_dir),
@@ -168,7 +164,6 @@ class TestCLIBackupCommands:
         backup_manager = BackupManager(temp_project_dir)
         backup_path = backup_manager.backup_local_roomodes()
         
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir=str(temp_project_dir),
@@ -183,7 +178,6 @@ class TestCLIBackupCommands:
     
     def test_restore_files_nonexistent_backup(self, temp_project_dir, capsys):
         """Test restoring when no backups exist."""
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir=str(temp_project_dir),
@@ -203,7 +197,6 @@ class TestCLIBackupCommands:
         backup_manager.backup_local_roomodes()
         backup_manager.backup_global_roomodes()
         
-        import argparse
         args = argparse.Namespace(
             project_dir=str(temp_project_dir)
         )
@@ -218,7 +211,6 @@ class TestCLIBackupCommands:
     def test_list_backups_no_files(self, capsys):
         """Test listing backups when no files exist."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            import argparse
             args = argparse.Namespace(
                 project_dir=temp_dir
             )
@@ -254,7 +246,6 @@ source: global
     
     def test_sync_global_dry_run(self, temp_modes_dir, capsys):
         """Test global sync with dry run."""
-        import argparse
         args = argparse.Namespace(
             modes_dir=temp_modes_dir,
             config=None,
@@ -272,7 +263,6 @@ source: global
     def test_sync_local_dry_run(self, temp_modes_dir, capsys):
         """Test local sync with dry run."""
         with tempfile.TemporaryDirectory() as temp_project:
-            import argparse
             args = argparse.Namespace(
                 modes_dir=temp_modes_dir,
                 project_dir=temp_project,
@@ -289,7 +279,6 @@ source: global
     
     def test_list_modes(self, temp_modes_dir, capsys):
         """Test listing modes."""
-        import argparse
         args = argparse.Namespace(
             modes_dir=temp_modes_dir
         )
@@ -389,7 +378,6 @@ class TestCLIErrorHandling:
     
     def test_backup_files_exception_handling(self, capsys):
         """Test backup files with exception."""
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir="/nonexistent/directory"
@@ -403,7 +391,6 @@ class TestCLIErrorHandling:
     
     def test_restore_files_exception_handling(self, capsys):
         """Test restore files with exception."""
-        import argparse
         args = argparse.Namespace(
             type="all",
             project_dir="/nonexistent/directory",
@@ -418,7 +405,6 @@ class TestCLIErrorHandling:
     
     def test_list_backups_exception_handling(self, capsys):
         """Test list backups with exception."""
-        import argparse
         args = argparse.Namespace(
             project_dir="/nonexistent/directory"
         )
@@ -431,7 +417,6 @@ class TestCLIErrorHandling:
     
     def test_sync_global_sync_error(self, capsys):
         """Test sync global with sync error."""
-        import argparse
         args = argparse.Namespace(
             modes_dir=Path("/nonexistent"),
             config=None,
@@ -448,7 +433,6 @@ class TestCLIErrorHandling:
     
     def test_sync_local_sync_error(self, capsys):
         """Test sync local with sync error."""
-        import argparse
         args = argparse.Namespace(
             modes_dir=Path("/nonexistent"),
             project_dir="/nonexistent",
@@ -477,7 +461,6 @@ class TestCLIIntegration:
             roomodes_file.write_text("original content")
             
             # Test backup
-            import argparse
             backup_args = argparse.Namespace(
                 type="local",
                 project_dir=str(project_dir)
@@ -512,7 +495,6 @@ class TestCLIIntegration:
             roomodes_file = project_dir / ".roomodes"
             roomodes_file.write_text("content 1")
             
-            import argparse
             backup_args = argparse.Namespace(
                 type="local",
                 project_dir=str(project_dir)
@@ -5,12 +5,13 @@ Tests for CLI strategy parsing functionality.
 Tests the parse_strategy_argument function and its integration with sync commands.
 """
 
+import json
+import os
 import pytest
 import tempfile
 import sys
-import yaml
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 import argparse
 
 # Add the parent directory to the path for imports
@@ -65,7 +66,7 @@ class TestParseStrategyFileDetection:
                 'strategy': 'groupings',
                 'mode_groups': {'test': ['mode1']}
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
@@ -74,9 +75,6 @@ class TestParseStrategyFileDetection:
     
     def test_detects_windows_path(self):
         """Test detection of Windows-style paths."""
-        # Import yaml at the top of the function
-        import yaml
-        from unittest.mock import patch, mock_open
         
         config_content = {
             'strategy': 'groupings',
@@ -89,7 +87,7 @@ class TestParseStrategyFileDetection:
         
         # Test that the detection logic works (should detect as file path)
         # We'll mock the file existence and content loading
-        mock_content = yaml.dump(config_content)
+        mock_content = json.dumps(config_content)
         with patch('builtins.open', mock_open(read_data=mock_content)):
             with patch('pathlib.Path.exists', return_value=True):
                 strategy_name, options = parse_strategy_argument(windows_style_arg)
@@ -105,10 +103,9 @@ class TestParseStrategyFileDetection:
                 'strategy': 'strategic',
                 'priority_modes': ['important']
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             # Change to temp directory and use just filename
-            import os
             original_cwd = os.getcwd()
             try:
                 os.chdir(temp_dir)
@@ -127,9 +124,8 @@ class TestParseStrategyFileDetection:
                 'strategy': 'alphabetical',
                 'reverse_order': True
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
-            import os
             original_cwd = os.getcwd()
             try:
                 os.chdir(temp_dir)
@@ -156,7 +152,7 @@ class TestParseStrategyFileContent:
                 },
                 'active_group': 'development'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
@@ -182,7 +178,7 @@ class TestParseStrategyFileContent:
                 'fallback_strategy': 'strategic',
                 'group_priorities': ['research_phase', 'development_phase', 'integration_phase']
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
@@ -202,7 +198,7 @@ class TestParseStrategyFileContent:
                 'option1': 'value1',
                 'option2': 'value2'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
@@ -211,6 +207,32 @@ class TestParseStrategyFileContent:
             assert options['option1'] == 'value1'
             assert options['option2'] == 'value2'
 
+    def test_parse_config_sees_edit_with_restored_mtime(self, tmp_path):
+        """Test that a same-size edit is picked up even when the mtime is put back."""
+        config_file = tmp_path / "strategy.yaml"
+        config_file.write_text(json.dumps({'strategy': 'groupings', 'active_group': 'aaaa'}))
+        file_stat = config_file.stat()
+        assert parse_strategy_argument(str(config_file))[1]['active_group'] == 'aaaa'
+
+        config_file.write_text(json.dumps({'strategy': 'groupings', 'active_group': 'bbbb'}))
+        os.utime(config_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+        assert parse_strategy_argument(str(config_file))[1]['active_group'] == 'bbbb'
+
+    def test_parse_config_options_do_not_alias_memo(self, tmp_path):
+        """Test that mutating returned nested options does not leak into later parses."""
+        config_file = tmp_path / "strategy.yaml"
+        config_file.write_text(json.dumps({
+            'strategy': 'groupings',
+            'mode_groups': {'development': ['code', 'debug']}
+        }))
+
+        _, options = parse_strategy_argument(str(config_file))
+        options['mode_groups']['development'].append('ask')
+
+        _, options = parse_strategy_argument(str(config_file))
+        assert options['mode_groups']['development'] == ['code', 'debug']
+
 
 class TestParseStrategyErrorHandling:
     """Test error handling in parse_strategy_argument."""
@@ -253,7 +275,7 @@ class TestParseStrategyErrorHandling:
                 'mode_groups': {'test': ['mode1']},
                 'active_group': 'test'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             with pytest.raises(SyncError) as exc_info:
                 parse_strategy_argument(str(config_file))
@@ -268,7 +290,7 @@ class TestParseStrategyErrorHandling:
                 'strategy': None,
                 'other_option': 'value'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             with pytest.raises(SyncError) as exc_info:
                 parse_strategy_argument(str(config_file))
@@ -299,7 +321,7 @@ class TestParseStrategyLogging:
                 'strategy': 'groupings',
                 'test_option': 'test_value'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             with caplog.at_level('INFO'):
                 parse_strategy_argument(str(config_file))
@@ -376,7 +398,7 @@ source: global
                 'mode_groups': {'test': ['mode1']},
                 'active_group': 'test'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             # Create args
             args = argparse.Namespace(
@@ -422,7 +444,7 @@ source: global
                 },
                 'active_group': 'dev'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             # Create args
             args = argparse.Namespace(
@@ -495,7 +517,7 @@ class TestRealWorldScenarios:
                 },
                 'active_group': 'research_phase'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
@@ -518,10 +540,9 @@ class TestRealWorldScenarios:
                 'mode_groups': {'test': ['mode1']},
                 'active_group': 'test'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             # Change to temp directory and use relative path
-            import os
             original_cwd = os.getcwd()
             try:
                 os.chdir(temp_dir)
@@ -543,7 +564,7 @@ class TestRealWorldScenarios:
                 'no_backup': False,  # This should be overridden by CLI args
                 'custom_option': 'value'
             }
-            config_file.write_text(yaml.dump(config_content))
+            config_file.write_text(json.dumps(config_content))
             
             strategy_name, options = parse_strategy_argument(str(config_file))
             
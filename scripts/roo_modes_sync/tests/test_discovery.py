@@ -1,5 +1,6 @@
 """Test cases for mode discovery functionality."""
 
+import json
 import os
 import yaml
 import pytest
@@ -7,23 +8,35 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from roo_modes_sync.core.discovery import ModeDiscovery
+from roo_modes_sync.core.yaml_loaders import SafeDumper
+from roo_modes_sync.tests._files import VALID_MODE_YAML, write_file
 
 
 class TestModeDiscovery:
     """Test cases for ModeDiscovery class."""
     
     @pytest.fixture
-    def temp_modes_dir(self, tmp_path):
-        """Create a temporary directory for test mode files."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
+    def temp_modes_dir(self, fs):
+        """Create a modes directory on an in-memory filesystem (pyfakefs)."""
+        modes_dir = Path("/fake/modes")
+        fs.create_dir(modes_dir)
         return modes_dir
     
-    def create_mode_file(self, modes_dir: Path, slug: str, config: Dict[str, Any]) -> Path:
+    def create_mode_file(self, modes_dir: Path, slug: str, config: Dict[str, Any]) -> str:
         """Helper to create a mode file in the test directory."""
-        mode_file = modes_dir / f"{slug}.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        mode_file = os.path.join(modes_dir, f"{slug}.yaml")
+        # JSON is valid YAML and json.dumps is far cheaper than PyYAML's emitter
+        write_file(mode_file, json.dumps(config))
+        return mode_file
+        
+    def create_valid_mode_file(self, modes_dir: Path, slug: str, name: Optional[str] = None,
+                               expected_category: Optional[str] = None) -> str:
+        """Helper to write the standard valid mode file without going through PyYAML."""
+        content = VALID_MODE_YAML.format(slug=slug, name=name or f'{slug.title()} Mode')
+        if expected_category:
+            content += f"expected_category: {expected_category}\n"
+        mode_file = os.path.join(modes_dir, f"{slug}.yaml")
+        write_file(mode_file, content)
         return mode_file
         
     def create_valid_mode_config(self, slug: str, expected_category: str = None) -> Dict[str, Any]:
@@ -49,11 +62,11 @@ class TestModeDiscovery:
     def test_discover_all_modes(self, temp_modes_dir):
         """Test that modes are properly discovered and categorized."""
         # Create test mode files
-        self.create_mode_file(temp_modes_dir, "code", self.create_valid_mode_config("code", "core"))
-        self.create_mode_file(temp_modes_dir, "architect", self.create_valid_mode_config("architect", "core"))
-        self.create_mode_file(temp_modes_dir, "code-enhanced", self.create_valid_mode_config("code-enhanced", "enhanced"))
-        self.create_mode_file(temp_modes_dir, "security-auditor", self.create_valid_mode_config("security-auditor", "specialized"))
-        self.create_mode_file(temp_modes_dir, "custom", self.create_valid_mode_config("custom", "discovered"))
+        self.create_valid_mode_file(temp_modes_dir, "code", expected_category="core")
+        self.create_valid_mode_file(temp_modes_dir, "architect", expected_category="core")
+        self.create_valid_mode_file(temp_modes_dir, "code-enhanced", expected_category="enhanced")
+        self.create_valid_mode_file(temp_modes_dir, "security-auditor", expected_category="specialized")
+        self.create_valid_mode_file(temp_modes_dir, "custom", expected_category="discovered")
         
         # Create an invalid mode file
         invalid_file = temp_modes_dir / "invalid.yaml"
@@ -105,6 +118,12 @@ class TestModeDiscovery:
         # Test discovered category (fallback)
         assert discovery.categorize_mode("custom") == "discovered"
         assert discovery.categorize_mode("test") == "discovered"
+        assert discovery.categorize_mode("code-enhanced-draft") == "discovered"
+        
+        # Categories are tried in order: core, enhanced, specialized
+        assert discovery.categorize_mode("docs") == "core"
+        assert discovery.categorize_mode("prompt-enhancer-plus") == "enhanced"
+        assert discovery.categorize_mode("prompt-enhancer-v2") == "specialized"
     
     def test_nonexistent_directory(self, tmp_path):
         """Test that discovery handles non-existent directories gracefully."""
@@ -137,7 +156,7 @@ class TestModeDiscovery:
                 'name': 'Valid Mode',
                 'roleDefinition': 'This is a valid mode',
                 'groups': ['test']
-            }, f)
+            }, f, Dumper=SafeDumper)
         
         # Create an invalid mode file (missing required fields)
         invalid_file = temp_modes_dir / "invalid.yaml"
@@ -146,7 +165,7 @@ class TestModeDiscovery:
                 'slug': 'invalid',
                 'name': 'Invalid Mode'
                 # Missing roleDefinition and groups
-            }, f)
+            }, f, Dumper=SafeDumper)
         
         # Create a corrupt YAML file
         corrupt_file = temp_modes_dir / "corrupt.yaml"
@@ -163,7 +182,77 @@ class TestModeDiscovery:
         
         # Test with non-existent file
         assert discovery._is_valid_mode_file(temp_modes_dir / "nonexistent.yaml") is False
-    
+
+    def test_discover_ignores_directory_symlink_loops(self, tmp_path):
+        """Test that a symlink cycle neither hangs nor empties the scan."""
+        modes_dir = tmp_path / "modes"
+        sub_dir = modes_dir / "sub"
+        sub_dir.mkdir(parents=True)
+        self.create_valid_mode_file(modes_dir, "code")
+        self.create_valid_mode_file(sub_dir, "security-auditor")
+        (sub_dir / "loop").symlink_to("..", target_is_directory=True)
+
+        modes = ModeDiscovery(modes_dir).discover_all_modes()
+
+        assert modes["core"] == ["code"]
+        assert modes["specialized"] == ["security-auditor"]
+
+    def test_discover_nested_modes_caches_relative_paths(self, temp_modes_dir):
+        """Test that the scandir walk records paths relative to the modes directory."""
+        nested_dir = temp_modes_dir / "group" / "sub"
+        nested_dir.mkdir(parents=True)
+        self.create_valid_mode_file(temp_modes_dir, "code")
+        self.create_valid_mode_file(nested_dir, "security-auditor")
+        (nested_dir / "notes.txt").write_text("not a mode", encoding='utf-8')
+
+        discovery = ModeDiscovery(temp_modes_dir)
+        modes = discovery.discover_all_modes()
+
+        assert modes["core"] == ["code"]
+        assert modes["specialized"] == ["security-auditor"]
+        assert discovery.get_mode_relative_path("code") == Path("code.yaml")
+        assert discovery.get_mode_relative_path("security-auditor") == Path("group/sub/security-auditor.yaml")
+        assert discovery.get_mode_file_path("security-auditor") == nested_dir / "security-auditor.yaml"
+        assert discovery.get_mode_file_path("unknown") == temp_modes_dir / "unknown.yaml"
+
+        flat_modes = ModeDiscovery(temp_modes_dir, recursive=False).discover_all_modes()
+        assert flat_modes["specialized"] == []
+
+    def test_discover_all_modes_memoized_until_files_change(self, temp_modes_dir, mocker):
+        """Test that unchanged mode files are not parsed again on repeated discovery."""
+        self.create_valid_mode_file(temp_modes_dir, "code")
+        self.create_valid_mode_file(temp_modes_dir, "custom")
+        discovery = ModeDiscovery(temp_modes_dir)
+        parse_spy = mocker.spy(discovery, "_has_valid_mode_structure")
+
+        first = discovery.discover_all_modes()
+        first["core"].append("mutated")
+        second = discovery.discover_all_modes()
+
+        assert parse_spy.call_count == 2
+        assert second["core"] == ["code"]
+
+        # Rewriting a file with different content invalidates the cached result
+        (temp_modes_dir / "custom.yaml").write_text("slug: custom\n", encoding='utf-8')
+        third = discovery.discover_all_modes()
+
+        assert parse_spy.call_count == 4
+        assert third["discovered"] == []
+
+    def test_discover_all_modes_memo_sees_edit_with_restored_mtime(self, temp_modes_dir):
+        """Test that a same-size edit is picked up even when the mtime is put back."""
+        mode_file = self.create_valid_mode_file(temp_modes_dir, "custom")
+        file_stat = os.stat(mode_file)
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.discover_all_modes()["discovered"] == ["custom"]
+
+        # Same length as the valid file, but not a mapping with the required fields
+        write_file(mode_file, "#" * (file_stat.st_size - 1) + "\n")
+        os.utime(mode_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        assert os.stat(mode_file).st_size == file_stat.st_size
+
+        assert discovery.discover_all_modes()["discovered"] == []
+
     def test_get_category_info(self):
         """Test that category information is provided correctly."""
         discovery = ModeDiscovery(Path("/tmp"))
@@ -193,9 +282,7 @@ class TestModeDiscovery:
         }
         
         for slug, name in modes.items():
-            config = self.create_valid_mode_config(slug)
-            config["name"] = name
-            self.create_mode_file(temp_modes_dir, slug, config)
+            self.create_valid_mode_file(temp_modes_dir, slug, name=name)
         
         discovery = ModeDiscovery(temp_modes_dir)
         
@@ -6,17 +6,14 @@ import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
-from roo_modes_sync.core.validation import ModeValidator, YAMLStructureError
+from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
+from roo_modes_sync.core.validation import YAMLStructureError
+from roo_modes_sync.core.yaml_loaders import SafeDumper
 
 
 class TestGlobalConfigGroupFixes:
     """Test cases for fixing problematic group structures in global Roo configuration."""
     
-    @pytest.fixture
-    def validator(self):
-        """Create a validator instance for testing."""
-        return ModeValidator()
-    
     @pytest.fixture
     def temp_config_file(self, tmp_path):
         """Create a temporary global config file for testing."""
@@ -168,7 +165,7 @@ class TestGlobalConfigGroupFixes:
                 # Write individual mode to temp file for validation
                 temp_mode_file = temp_config_file.parent / f"{mode_name}.yaml"
                 with open(temp_mode_file, 'w') as f:
-                    yaml.dump(mode_config, f)
+                    yaml.dump(mode_config, f, Dumper=SafeDumper)
                 
                 # Validation should detect complex groups as problematic
                 # Note: Current validator might accept these, but we're establishing the test first
@@ -191,7 +188,7 @@ class TestGlobalConfigGroupFixes:
             # Write individual mode to temp file for validation
             temp_mode_file = temp_config_file.parent / f"{mode_name}_fixed.yaml"
             with open(temp_mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+                yaml.dump(mode_config, f, Dumper=SafeDumper)
             
             # Validation should pass for simple groups
             result = validator.validate_yaml_structure(str(temp_mode_file))
@@ -207,7 +204,7 @@ class TestGlobalConfigGroupFixes:
         
         # Write full config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+            yaml.dump(problematic_config, f, Dumper=SafeDumper)
         
         # Function to identify problematic modes
         def identify_problematic_modes(config_data):
@@ -368,7 +365,7 @@ class TestGlobalConfigGroupFixes:
         
         # Write fixed config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(fixed_config, f)
+            yaml.dump(fixed_config, f, Dumper=SafeDumper)
         
         # Validate each mode in the fixed config
         for mode_config in fixed_config['customModes']:
@@ -376,7 +373,7 @@ class TestGlobalConfigGroupFixes:
             # Test both YAML structure and mode config validation
             temp_mode_file = temp_config_file.parent / f"{mode_name}_final.yaml"
             with open(temp_mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+                yaml.dump(mode_config, f, Dumper=SafeDumper)
             
             # YAML structure should pass
             yaml_result = validator.validate_yaml_structure(str(temp_mode_file))
@@ -410,13 +407,12 @@ class TestGlobalConfigGroupFixes:
     
     def test_warning_functionality_for_stripped_information(self, temp_config_file):
         """Test that the fixer generates warnings about information being stripped."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
         
         problematic_config = self.create_problematic_global_config()
         
         # Write config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+            yaml.dump(problematic_config, f, Dumper=SafeDumper)
         
         fixer = GlobalConfigFixer()
         
@@ -445,13 +441,12 @@ class TestGlobalConfigGroupFixes:
         
     def test_fix_with_warnings_returns_stripped_info(self, temp_config_file):
         """Test that the fix operation returns detailed information about what was stripped."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
         
         problematic_config = self.create_problematic_global_config()
         
         # Write config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+            yaml.dump(problematic_config, f, Dumper=SafeDumper)
         
         fixer = GlobalConfigFixer()
         
@@ -482,13 +477,12 @@ class TestGlobalConfigGroupFixes:
         
     def test_warning_message_format(self, temp_config_file):
         """Test that warning messages are properly formatted and informative."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
         
         problematic_config = self.create_problematic_global_config()
         
         # Write config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+            yaml.dump(problematic_config, f, Dumper=SafeDumper)
         
         fixer = GlobalConfigFixer()
         
@@ -513,13 +507,12 @@ class TestGlobalConfigGroupFixes:
         
     def test_preserve_stripped_info_in_comments(self, temp_config_file):
         """Test that stripped information can optionally be preserved as comments."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
         
         problematic_config = self.create_problematic_global_config()
         
         # Write config to temp file
         with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+            yaml.dump(problematic_config, f, Dumper=SafeDumper)
         
         fixer = GlobalConfigFixer()
         
@@ -6,6 +6,8 @@ This tests a new simplified configuration system that allows users to define
 named groups of modes with specific ordering, making configuration much more intuitive.
 """
 
+import json
+import os
 import pytest
 import yaml
 import tempfile
@@ -14,34 +16,45 @@ from typing import Dict, Any, List
 
 from roo_modes_sync.core.sync import ModeSync
 from roo_modes_sync.exceptions import ConfigurationError, SyncError
+from roo_modes_sync.core.yaml_loaders import SafeLoader
+from roo_modes_sync.tests._files import write_file
+
+
+@pytest.fixture(scope="class")
+def grouping_modes_sync(tmp_path_factory):
+    """Create one ModeSync over the grouping test modes, shared by a test class.
+    
+    create_global_config does not modify the instance, so the mode files are
+    written and discovered once per class instead of once per test.
+    """
+    modes_dir = tmp_path_factory.mktemp("modes")
+    
+    # Create test modes that we'll use in groupings
+    test_modes = [
+        {'slug': 'code', 'name': 'Code Mode', 'roleDefinition': 'Code development', 'groups': ['read']},
+        {'slug': 'debug', 'name': 'Debug Mode', 'roleDefinition': 'Bug fixing', 'groups': ['read']},
+        {'slug': 'ask', 'name': 'Ask Mode', 'roleDefinition': 'Questions', 'groups': ['read']},
+        {'slug': 'architect', 'name': 'Architect Mode', 'roleDefinition': 'System design', 'groups': ['read']},
+        {'slug': 'orchestrator', 'name': 'Orchestrator Mode', 'roleDefinition': 'Workflow coordination', 'groups': ['read']},
+        {'slug': 'security-auditor', 'name': 'Security Auditor', 'roleDefinition': 'Security analysis', 'groups': ['read']},
+        {'slug': 'prompt-enhancer', 'name': 'Prompt Enhancer', 'roleDefinition': 'Prompt improvement', 'groups': ['read']},
+    ]
+    
+    modes_dir_str = str(modes_dir)
+    for mode_config in test_modes:
+        mode_file = os.path.join(modes_dir_str, f"{mode_config['slug']}.yaml")
+        write_file(mode_file, json.dumps(mode_config))
+    
+    return ModeSync(modes_dir)
 
 
 class TestModeGroupings:
     """TDD tests for mode groupings feature."""
 
     @pytest.fixture
-    def sync_instance_with_modes(self, tmp_path):
-        """Create a ModeSync instance with test modes."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        # Create test modes that we'll use in groupings
-        test_modes = [
-            {'slug': 'code', 'name': 'Code Mode', 'roleDefinition': 'Code development', 'groups': ['read']},
-            {'slug': 'debug', 'name': 'Debug Mode', 'roleDefinition': 'Bug fixing', 'groups': ['read']},
-            {'slug': 'ask', 'name': 'Ask Mode', 'roleDefinition': 'Questions', 'groups': ['read']},
-            {'slug': 'architect', 'name': 'Architect Mode', 'roleDefinition': 'System design', 'groups': ['read']},
-            {'slug': 'orchestrator', 'name': 'Orchestrator Mode', 'roleDefinition': 'Workflow coordination', 'groups': ['read']},
-            {'slug': 'security-auditor', 'name': 'Security Auditor', 'roleDefinition': 'Security analysis', 'groups': ['read']},
-            {'slug': 'prompt-enhancer', 'name': 'Prompt Enhancer', 'roleDefinition': 'Prompt improvement', 'groups': ['read']},
-        ]
-        
-        for mode_config in test_modes:
-            mode_file = modes_dir / f"{mode_config['slug']}.yaml"
-            with open(mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
-        
-        return ModeSync(modes_dir)
+    def sync_instance_with_modes(self, grouping_modes_sync):
+        """Provide the ModeSync instance shared across this class."""
+        return grouping_modes_sync
 
     def test_groupings_strategy_requires_active_group(self, sync_instance_with_modes):
         """Test that groupings strategy requires active_group or active_groups option."""
@@ -195,9 +208,8 @@ priority_first:
         config_file.write_text(config_content)
         
         # Load the YAML config and test it
-        import yaml
         with open(config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=SafeLoader)
         
         # Extract the groupings-specific options
         groupings_options = {
@@ -269,10 +281,10 @@ class TestModeGroupingsIntegration:
             {'slug': 'architect', 'name': 'Architect Mode', 'roleDefinition': 'System design', 'groups': ['read']},
         ]
         
+        modes_dir_str = str(modes_dir)
         for mode_config in test_modes:
-            mode_file = modes_dir / f"{mode_config['slug']}.yaml"
-            with open(mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+            mode_file = os.path.join(modes_dir_str, f"{mode_config['slug']}.yaml")
+            write_file(mode_file, json.dumps(mode_config))
         
         return ModeSync(modes_dir)
 
@@ -351,7 +363,7 @@ exclude_modes: []
         config_file.write_text(simple_groupings_config)
         
         # This config should be parseable and usable once we implement the feature
-        config_data = yaml.safe_load(config_file.read_text())
+        config_data = yaml.load(config_file.read_text(), Loader=SafeLoader)
         assert config_data['strategy'] == 'groupings'
         assert 'essential' in config_data['mode_groups']
         assert config_data['active_group'] == 'essential'
@@ -13,6 +13,36 @@ from roo_modes_sync.core.ordering import (
 )
 from roo_modes_sync.exceptions import ConfigurationError
 
+# Sample categorized modes are built once at import; the strategies never
+# mutate their input, so every test can share them.
+SAMPLE_MODES = {
+    'core': ['code', 'architect', 'debug'],
+    'enhanced': ['code-enhanced', 'debug-plus'],
+    'specialized': ['security-auditor', 'prompt-enhancer'],
+    'discovered': ['custom-mode']
+}
+
+STRATEGIC_SAMPLE_MODES = {
+    'core': ['code', 'architect', 'debug', 'ask', 'orchestrator'],
+    'enhanced': ['code-enhanced', 'debug-plus'],
+    'specialized': ['security-auditor'],
+    'discovered': ['custom-mode']
+}
+
+ALPHABETICAL_SAMPLE_MODES = {
+    'core': ['code', 'architect', 'debug'],
+    'enhanced': ['debug-plus', 'code-enhanced'],
+    'specialized': ['security-auditor', 'prompt-enhancer'],
+    'discovered': ['custom-mode', 'another-custom-mode']
+}
+
+CATEGORY_SAMPLE_MODES = {
+    'core': ['code', 'architect', 'debug'],
+    'enhanced': ['code-enhanced', 'debug-plus'],
+    'specialized': ['security-auditor'],
+    'discovered': ['custom-mode']
+}
+
 
 class TestOrderingStrategy:
     """Test cases for base OrderingStrategy class."""
@@ -34,13 +64,8 @@ class TestOrderingStrategy:
     
     @pytest.fixture
     def sample_modes(self):
-        """Create sample categorized modes for testing."""
-        return {
-            'core': ['code', 'architect', 'debug'],
-            'enhanced': ['code-enhanced', 'debug-plus'],
-            'specialized': ['security-auditor', 'prompt-enhancer'],
-            'discovered': ['custom-mode']
-        }
+        """Return the shared sample categorized modes (read-only)."""
+        return SAMPLE_MODES
     
     def test_get_all_mode_slugs(self, strategy, sample_modes):
         """Test _get_all_mode_slugs method."""
@@ -127,13 +152,8 @@ class TestStrategicOrderingStrategy:
     
     @pytest.fixture
     def sample_modes(self):
-        """Create sample categorized modes for testing."""
-        return {
-            'core': ['code', 'architect', 'debug', 'ask', 'orchestrator'],
-            'enhanced': ['code-enhanced', 'debug-plus'],
-            'specialized': ['security-auditor'],
-            'discovered': ['custom-mode']
-        }
+        """Return the shared sample categorized modes (read-only)."""
+        return STRATEGIC_SAMPLE_MODES
     
     def test_apply_strategy(self, strategy, sample_modes):
         """Test _apply_strategy method."""
@@ -173,13 +193,8 @@ class TestAlphabeticalOrderingStrategy:
     
     @pytest.fixture
     def sample_modes(self):
-        """Create sample categorized modes for testing."""
-        return {
-            'core': ['code', 'architect', 'debug'],
-            'enhanced': ['debug-plus', 'code-enhanced'],
-            'specialized': ['security-auditor', 'prompt-enhancer'],
-            'discovered': ['custom-mode', 'another-custom-mode']
-        }
+        """Return the shared sample categorized modes (read-only)."""
+        return ALPHABETICAL_SAMPLE_MODES
     
     def test_apply_strategy(self, strategy, sample_modes):
         """Test _apply_strategy method."""
@@ -206,19 +221,19 @@ class TestAlphabeticalOrderingStrategy:
         discovered_start_idx = specialized_end_idx + 1
         
         # Check that core modes come first and are alphabetically sorted
-        assert set(ordered_modes_category[0:core_end_idx + 1]) == set(sample_modes['core'])
+        assert sorted(ordered_modes_category[0:core_end_idx + 1]) == sorted(sample_modes['core'])
         assert ordered_modes_category[0:core_end_idx + 1] == sorted(sample_modes['core'])
         
         # Check that enhanced modes come next and are alphabetically sorted
-        assert set(ordered_modes_category[enhanced_start_idx:enhanced_end_idx + 1]) == set(sample_modes['enhanced'])
+        assert sorted(ordered_modes_category[enhanced_start_idx:enhanced_end_idx + 1]) == sorted(sample_modes['enhanced'])
         assert ordered_modes_category[enhanced_start_idx:enhanced_end_idx + 1] == sorted(sample_modes['enhanced'])
         
         # Check that specialized modes come next and are alphabetically sorted
-        assert set(ordered_modes_category[specialized_start_idx:specialized_end_idx + 1]) == set(sample_modes['specialized'])
+        assert sorted(ordered_modes_category[specialized_start_idx:specialized_end_idx + 1]) == sorted(sample_modes['specialized'])
         assert ordered_modes_category[specialized_start_idx:specialized_end_idx + 1] == sorted(sample_modes['specialized'])
         
         # Check that discovered modes come last and are alphabetically sorted
-        assert set(ordered_modes_category[discovered_start_idx:]) == set(sample_modes['discovered'])
+        assert sorted(ordered_modes_category[discovered_start_idx:]) == sorted(sample_modes['discovered'])
         assert ordered_modes_category[discovered_start_idx:] == sorted(sample_modes['discovered'])
 
 
@@ -232,13 +247,8 @@ class TestCategoryOrderingStrategy:
     
     @pytest.fixture
     def sample_modes(self):
-        """Create sample categorized modes for testing."""
-        return {
-            'core': ['code', 'architect', 'debug'],
-            'enhanced': ['code-enhanced', 'debug-plus'],
-            'specialized': ['security-auditor'],
-            'discovered': ['custom-mode']
-        }
+        """Return the shared sample categorized modes (read-only)."""
+        return CATEGORY_SAMPLE_MODES
     
     def test_apply_strategy_default(self, strategy, sample_modes):
         """Test _apply_strategy method with default options."""
@@ -253,10 +263,10 @@ class TestCategoryOrderingStrategy:
         specialized_end_idx = specialized_start_idx + len(sample_modes['specialized']) - 1
         discovered_start_idx = specialized_end_idx + 1
         
-        assert set(ordered_modes[0:core_end_idx + 1]) == set(sample_modes['core'])
-        assert set(ordered_modes[enhanced_start_idx:enhanced_end_idx + 1]) == set(sample_modes['enhanced'])
-        assert set(ordered_modes[specialized_start_idx:specialized_end_idx + 1]) == set(sample_modes['specialized'])
-        assert set(ordered_modes[discovered_start_idx:]) == set(sample_modes['discovered'])
+        assert sorted(ordered_modes[0:core_end_idx + 1]) == sorted(sample_modes['core'])
+        assert sorted(ordered_modes[enhanced_start_idx:enhanced_end_idx + 1]) == sorted(sample_modes['enhanced'])
+        assert sorted(ordered_modes[specialized_start_idx:specialized_end_idx + 1]) == sorted(sample_modes['specialized'])
+        assert sorted(ordered_modes[discovered_start_idx:]) == sorted(sample_modes['discovered'])
     
     def test_apply_strategy_custom_order(self, strategy, sample_modes):
         """Test _apply_strategy method with custom category order."""
@@ -276,10 +286,10 @@ class TestCategoryOrderingStrategy:
         core_end_idx = core_start_idx + len(sample_modes['core']) - 1
         specialized_start_idx = core_end_idx + 1
         
-        assert set(ordered_modes[0:discovered_end_idx + 1]) == set(sample_modes['discovered'])
-        assert set(ordered_modes[enhanced_start_idx:enhanced_end_idx + 1]) == set(sample_modes['enhanced'])
-        assert set(ordered_modes[core_start_idx:core_end_idx + 1]) == set(sample_modes['core'])
-        assert set(ordered_modes[specialized_start_idx:]) == set(sample_modes['specialized'])
+        assert sorted(ordered_modes[0:discovered_end_idx + 1]) == sorted(sample_modes['discovered'])
+        assert sorted(ordered_modes[enhanced_start_idx:enhanced_end_idx + 1]) == sorted(sample_modes['enhanced'])
+        assert sorted(ordered_modes[core_start_idx:core_end_idx + 1]) == sorted(sample_modes['core'])
+        assert sorted(ordered_modes[specialized_start_idx:]) == sorted(sample_modes['specialized'])
     
     def test_apply_strategy_alphabetical_within(self, strategy, sample_modes):
         """Test _apply_strategy method with alphabetical within-category ordering."""
@@ -315,13 +325,8 @@ class TestCustomOrderingStrategy:
     
     @pytest.fixture
     def sample_modes(self):
-        """Create sample categorized modes for testing."""
-        return {
-            'core': ['code', 'architect', 'debug'],
-            'enhanced': ['code-enhanced', 'debug-plus'],
-            'specialized': ['security-auditor'],
-            'discovered': ['custom-mode']
-        }
+        """Return the shared sample categorized modes (read-only)."""
+        return CATEGORY_SAMPLE_MODES
     
     def test_apply_strategy_with_custom_order(self, strategy, sample_modes):
         """Test _apply_strategy method with custom order."""
@@ -337,7 +342,7 @@ class TestCustomOrderingStrategy:
             assert ordered_modes[i] == mode
         
         # Verify that all modes are included
-        assert set(ordered_modes) == set(strategy._get_all_mode_slugs(sample_modes))
+        assert sorted(ordered_modes) == sorted(strategy._get_all_mode_slugs(sample_modes))
     
     def test_apply_strategy_invalid_modes(self, strategy, sample_modes):
         """Test _apply_strategy method with invalid modes in custom order."""
@@ -354,7 +359,7 @@ class TestCustomOrderingStrategy:
         assert ordered_modes[2] == 'code'
         
         # Verify that all modes are included
-        assert set(ordered_modes) == set(strategy._get_all_mode_slugs(sample_modes))
+        assert sorted(ordered_modes) == sorted(strategy._get_all_mode_slugs(sample_modes))
         
         # Verify that invalid modes are not included
         assert 'not-a-mode' not in ordered_modes
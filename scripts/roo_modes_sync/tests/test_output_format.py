@@ -4,13 +4,12 @@ Test output format matches the required template structure.
 """
 
 import pytest
-import tempfile
-import shutil
 import yaml
 from pathlib import Path
 
 try:
     from ..core.sync import ModeSync
+    from ..core.yaml_loaders import SafeLoader
 except ImportError:
     import sys
     from pathlib import Path
@@ -19,55 +18,23 @@ except ImportError:
     sys.path.insert(0, str(script_dir / "core"))
     
     from core.sync import ModeSync
+    from core.yaml_loaders import SafeLoader
 
 
-class TestOutputFormat:
-    """Test that output format matches the required template structure."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.modes_dir = self.temp_dir / "modes"
-        self.output_dir = self.temp_dir / "output"
-        
-        # Create directories
-        self.modes_dir.mkdir(parents=True)
-        self.output_dir.mkdir(parents=True)
-        
-        # Create test mode files with proper structure
-        self.create_test_mode("security-auditor", "🛡️ Security Auditor", [
-            "Follow this structured approach:",
-            "1. ANALYSIS PHASE:",
-            "   - Review the entire codebase systematically",
-            "   - Focus on critical areas: authentication, data handling",
-            "2. PLANNING PHASE:",
-            "   - For each identified vulnerability:",
-            "     - Explain the exact nature of the security risk"
-        ])
-        
-        self.create_test_mode("debate-opponent", "👎🏽 Debate Opponent", [
-            "You are a debate agent focused on critiquing the Proponent's argument.",
-            "Critique the Proponent's latest argument and provide one counterargument."
-        ])
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-
-    def create_test_mode(self, slug, name, instructions_lines):
-        """Create a test mode file."""
-        mode_file = self.modes_dir / f"{slug}.yaml"
-        
-        # Properly indent instructions for YAML
-        indented_instructions = []
-        for line in instructions_lines:
-            if line.strip():
-                indented_instructions.append(f"  {line}")
-            else:
-                indented_instructions.append("")
-        instructions = "\n".join(indented_instructions)
-        
-        content = f"""slug: {slug}
+def create_test_mode(modes_dir, slug, name, instructions_lines):
+    """Create a test mode file."""
+    mode_file = modes_dir / f"{slug}.yaml"
+    
+    # Properly indent instructions for YAML
+    indented_instructions = []
+    for line in instructions_lines:
+        if line.strip():
+            indented_instructions.append(f"  {line}")
+        else:
+            indented_instructions.append("")
+    instructions = "\n".join(indented_instructions)
+    
+    content = f"""slug: {slug}
 name: {name}
 roleDefinition: Act as an expert {slug.replace('-', ' ')} conducting thorough analysis.
 whenToUse: >-
@@ -78,8 +45,43 @@ groups:
   - read
   - command
 source: global"""
-        
-        mode_file.write_text(content)
+    
+    mode_file.write_text(content)
+
+
+@pytest.fixture(scope="class")
+def output_format_modes_dir(tmp_path_factory):
+    """Write the test mode files once for the whole class; tests only read them."""
+    modes_dir = tmp_path_factory.mktemp("modes")
+    
+    # Create test mode files with proper structure
+    create_test_mode(modes_dir, "security-auditor", "🛡️ Security Auditor", [
+        "Follow this structured approach:",
+        "1. ANALYSIS PHASE:",
+        "   - Review the entire codebase systematically",
+        "   - Focus on critical areas: authentication, data handling",
+        "2. PLANNING PHASE:",
+        "   - For each identified vulnerability:",
+        "     - Explain the exact nature of the security risk"
+    ])
+    
+    create_test_mode(modes_dir, "debate-opponent", "👎🏽 Debate Opponent", [
+        "You are a debate agent focused on critiquing the Proponent's argument.",
+        "Critique the Proponent's latest argument and provide one counterargument."
+    ])
+    
+    return modes_dir
+
+
+class TestOutputFormat:
+    """Test that output format matches the required template structure."""
+
+    @pytest.fixture(autouse=True)
+    def set_up_dirs(self, output_format_modes_dir, tmp_path):
+        """Use the shared modes directory and a fresh output directory per test."""
+        self.modes_dir = output_format_modes_dir
+        self.output_dir = tmp_path / "output"
+        self.output_dir.mkdir()
 
     def test_output_format_structure(self):
         """Test that output format matches required structure."""
@@ -96,7 +98,7 @@ source: global"""
         content = output_file.read_text()
         
         # Parse YAML to verify structure
-        config = yaml.safe_load(content)
+        config = yaml.load(content, Loader=SafeLoader)
         
         # Verify top-level structure
         assert "customModes" in config
@@ -113,7 +115,7 @@ source: global"""
         sync.sync_modes(strategy_name='alphabetical', options={})
         
         # Parse generated file
-        config = yaml.safe_load(output_file.read_text())
+        config = yaml.load(output_file.read_text(), Loader=SafeLoader)
         
         # Check first mode structure
         mode = config["customModes"][0]
@@ -178,7 +180,7 @@ source: global"""
         sync.sync_modes(strategy_name='alphabetical', options={})
         
         # Parse generated file
-        config = yaml.safe_load(output_file.read_text())
+        config = yaml.load(output_file.read_text(), Loader=SafeLoader)
         
         # Check groups formatting
         for mode in config["customModes"]:
@@ -218,7 +220,7 @@ source: global"""
         sync.sync_modes(strategy_name='alphabetical', options={})
         
         # Parse generated file
-        config = yaml.safe_load(output_file.read_text())
+        config = yaml.load(output_file.read_text(), Loader=SafeLoader)
         
         # Check that only expected fields are present
         expected_top_level = {"customModes"}
@@ -245,7 +247,7 @@ source: global"""
         sync.sync_modes(strategy_name='alphabetical', options={})
         
         # Parse generated file
-        config = yaml.safe_load(output_file.read_text())
+        config = yaml.load(output_file.read_text(), Loader=SafeLoader)
         
         # Check ordering
         slugs = [mode["slug"] for mode in config["customModes"]]
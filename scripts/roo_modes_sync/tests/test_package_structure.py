@@ -0,0 +1,21 @@
+"""Test cases for package installation metadata."""
+
+import pytest
+
+
+def test_installed_package():
+    """Test that the installed distribution exposes roo_modes_sync as a top-level package."""
+    from importlib.metadata import distribution, PackageNotFoundError
+    
+    try:
+        dist = distribution("roo-modes-sync")
+    except PackageNotFoundError:
+        pytest.skip("package not installed")
+    
+    top_level = (dist.read_text("top_level.txt") or "").splitlines()
+    if not top_level:
+        pytest.skip("distribution does not record top_level.txt")
+    assert "roo_modes_sync" in top_level
+    
+    import roo_modes_sync
+    assert roo_modes_sync.__name__ == "roo_modes_sync"
@@ -1,5 +1,6 @@
 """Test cases for mode synchronization functionality."""
 
+import json
 import os
 import yaml
 import shutil
@@ -8,19 +9,23 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from unittest.mock import patch, MagicMock
 
-from roo_modes_sync.core.sync import ModeSync
+from roo_modes_sync.core.sync import ModeSync, CustomYAMLDumper
 from roo_modes_sync.exceptions import SyncError, ConfigurationError
+from roo_modes_sync.tests._files import VALID_MODE_YAML, write_file
 
 
 class TestModeSync:
     """Test cases for ModeSync class."""
     
     @pytest.fixture
-    def temp_modes_dir(self, tmp_path):
-        """Create a temporary directory for test mode files."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        return modes_dir
+    def temp_modes_dir(self, class_modes_dir):
+        """Provide the shared modes directory, emptied before each test."""
+        for entry in class_modes_dir.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        return class_modes_dir
     
     @pytest.fixture
     def temp_config_dir(self, tmp_path):
@@ -42,11 +47,17 @@ class TestModeSync:
         sync = ModeSync(temp_modes_dir)
         return sync
     
-    def create_mode_file(self, modes_dir: Path, slug: str, config: Dict[str, Any]) -> Path:
+    def create_mode_file(self, modes_dir: Path, slug: str, config: Dict[str, Any]) -> str:
         """Helper to create a mode file in the test directory."""
-        mode_file = modes_dir / f"{slug}.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        mode_file = os.path.join(modes_dir, f"{slug}.yaml")
+        # JSON is valid YAML and json.dumps is far cheaper than PyYAML's emitter
+        write_file(mode_file, json.dumps(config))
+        return mode_file
+    
+    def create_valid_mode_file(self, modes_dir: Path, slug: str) -> str:
+        """Helper to write the standard valid mode file without going through PyYAML."""
+        mode_file = os.path.join(modes_dir, f"{slug}.yaml")
+        write_file(mode_file, VALID_MODE_YAML.format(slug=slug, name=f'{slug.title()} Mode'))
         return mode_file
     
     def create_valid_mode_config(self, slug: str) -> Dict[str, Any]:
@@ -110,7 +121,60 @@ class TestModeSync:
         
         with pytest.raises(SyncError):
             sync_manager.load_mode_config(slug)
-    
+
+    def test_validate_mode_dict(self, sync_manager):
+        """Test validating an in-memory mode config without touching disk."""
+        config = self.create_valid_mode_config('test-mode')
+        config['model'] = 'some-model'
+
+        validated = sync_manager.validate_mode_dict(config, 'test-mode')
+
+        assert validated['source'] == 'global'
+        assert 'model' not in validated
+        assert config['model'] == 'some-model'
+        assert 'source' not in config
+
+        sync_manager.set_options({'collect_warnings': False})
+        with pytest.raises(SyncError, match="Error validating invalid-mode"):
+            sync_manager.validate_mode_dict({'slug': 'invalid-mode'}, 'invalid-mode')
+
+    def test_load_mode_config_memoized_per_file(self, sync_manager, temp_modes_dir, mocker):
+        """Test that unchanged mode files are not re-parsed or re-validated."""
+        slug = 'test-mode'
+        self.create_valid_mode_file(temp_modes_dir, slug)
+        validate_spy = mocker.spy(sync_manager.validator, 'validate_mode_config')
+
+        first = sync_manager.load_mode_config(slug)
+        first['name'] = 'Mutated by caller'
+        second = sync_manager.load_mode_config(slug)
+
+        assert validate_spy.call_count == 1
+        assert second['name'] == 'Test-Mode Mode'
+
+        # Rewriting the file invalidates the memoized result
+        config = self.create_valid_mode_config(slug)
+        config['name'] = 'Renamed Mode'
+        self.create_mode_file(temp_modes_dir, slug, config)
+        assert sync_manager.load_mode_config(slug)['name'] == 'Renamed Mode'
+        assert validate_spy.call_count == 2
+
+        sync_manager.clear_cache()
+        sync_manager.load_mode_config(slug)
+        assert validate_spy.call_count == 3
+
+    def test_load_mode_config_memo_sees_edit_with_restored_mtime(self, sync_manager, temp_modes_dir):
+        """Test that a same-size edit is picked up even when the mtime is put back."""
+        slug = 'test-mode'
+        mode_file = self.create_valid_mode_file(temp_modes_dir, slug)
+        file_stat = os.stat(mode_file)
+        assert sync_manager.load_mode_config(slug)['name'] == 'Test-Mode Mode'
+
+        write_file(mode_file, VALID_MODE_YAML.format(slug=slug, name='Test-Mode Edit'))
+        os.utime(mode_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        assert os.stat(mode_file).st_size == file_stat.st_size
+
+        assert sync_manager.load_mode_config(slug)['name'] == 'Test-Mode Edit'
+
     def test_create_global_config_strategic(self, sync_manager, temp_modes_dir):
         """Test creating global config with strategic ordering."""
         # Create multiple modes of different categories
@@ -122,11 +186,7 @@ class TestModeSync:
         all_modes = core_modes + enhanced_modes + specialized_modes + discovered_modes
         
         for mode in all_modes:
-            self.create_mode_file(
-                temp_modes_dir, 
-                mode, 
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         config = sync_manager.create_global_config(strategy_name='strategic')
         
@@ -142,11 +202,7 @@ class TestModeSync:
         modes = ['zebra-mode', 'alpha-mode', 'beta-mode']
         
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir, 
-                mode, 
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         config = sync_manager.create_global_config(strategy_name='alphabetical')
         
@@ -155,17 +211,27 @@ class TestModeSync:
         # Alphabetical order should sort alphabetically within categories
         slugs = [mode['slug'] for mode in config['customModes']]
         assert slugs == ['alpha-mode', 'beta-mode', 'zebra-mode']
-    
+
+    def test_create_global_config_prefetches_large_mode_sets(self, sync_manager, temp_modes_dir, monkeypatch):
+        """Test that concurrently prefetched mode files load the same as sequential reads."""
+        modes = ['alpha-mode', 'beta-mode', 'gamma-mode']
+        for mode in modes:
+            self.create_valid_mode_file(temp_modes_dir, mode)
+        self.create_mode_file(temp_modes_dir, 'broken-mode', {'slug': 'broken-mode'})
+
+        sequential = sync_manager.create_global_config(strategy_name='alphabetical')
+        monkeypatch.setattr(ModeSync, 'PARALLEL_READ_MIN_FILES', 2)
+        prefetched = sync_manager.create_global_config(strategy_name='alphabetical')
+
+        assert prefetched == sequential
+        assert [mode['slug'] for mode in prefetched['customModes']] == modes
+
     def test_create_global_config_with_exclusions(self, sync_manager, temp_modes_dir):
         """Test creating global config with mode exclusions."""
         modes = ['mode1', 'mode2', 'mode3']
         
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir, 
-                mode, 
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         options = {'exclude': ['mode2']}
         config = sync_manager.create_global_config(options=options)
@@ -181,11 +247,7 @@ class TestModeSync:
         modes = ['mode1', 'mode2', 'mode3']
         
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir, 
-                mode, 
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         options = {'priority_first': ['mode3', 'mode1']}
         config = sync_manager.create_global_config(options=options)
@@ -199,8 +261,6 @@ class TestModeSync:
     
     def test_yaml_formatting_with_custom_dumper(self, sync_manager):
         """Test YAML formatting with custom dumper for proper indentation."""
-        import yaml
-        from roo_modes_sync.core.sync import CustomYAMLDumper
         
         # Test data structure similar to what we generate
         test_config = {
@@ -275,7 +335,43 @@ class TestModeSync:
             content = f.read()
             assert 'customModes:' in content
             assert 'slug: test-mode' in content
-    
+
+    def test_write_global_config_reuses_emitted_yaml(self, sync_manager, temp_config_dir, mocker):
+        """Test that writing an unchanged config does not run the YAML emitter again."""
+        config_path = temp_config_dir / "custom_modes.yaml"
+        sync_manager.set_global_config_path(config_path)
+        config = {'customModes': [self.create_valid_mode_config('test-mode')]}
+        dump_spy = mocker.spy(yaml, 'dump')
+
+        sync_manager.write_global_config(config)
+        first_content = config_path.read_text(encoding='utf-8')
+        config_path.unlink()
+        sync_manager.write_global_config(config)
+
+        assert dump_spy.call_count == 1
+        assert config_path.read_text(encoding='utf-8') == first_content
+
+        # A changed config is emitted again
+        config['customModes'][0]['name'] = 'Renamed Mode'
+        sync_manager.write_global_config(config)
+        assert dump_spy.call_count == 2
+        assert 'name: Renamed Mode' in config_path.read_text(encoding='utf-8')
+
+    def test_emit_cache_key_preserves_types(self, sync_manager):
+        """Test that configs differing only in scalar types get their own emitted YAML."""
+        assert sync_manager._emit_config_yaml({1: 'a'}) == "1: a\n"
+        assert sync_manager._emit_config_yaml({'1': 'a'}) == "'1': a\n"
+        assert sync_manager._emit_config_yaml({'v': True}) == "v: true\n"
+        assert sync_manager._emit_config_yaml({'v': 1}) == "v: 1\n"
+
+        # Values repr cannot key safely are emitted without touching the cache
+        shared = ['read']
+        assert sync_manager._emit_cache_key({'groups': {'read'}}) is None
+        assert sync_manager._emit_cache_key({'a': shared, 'b': shared}) is None
+        sync_manager.clear_cache()
+        sync_manager._emit_config_yaml({'groups': {'read'}})
+        assert len(sync_manager._emit_cache) == 0
+
     def test_sync_modes(self, sync_manager, temp_modes_dir, temp_config_dir):
         """Test full sync process."""
         config_path = temp_config_dir / "custom_modes.yaml"
@@ -284,11 +380,7 @@ class TestModeSync:
         # Create a few test modes
         modes = ['code', 'debug', 'custom-mode']
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir, 
-                mode, 
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         # Run sync with dry_run first
         success = sync_manager.sync_modes(dry_run=True)
@@ -318,29 +410,30 @@ class TestModeSync:
         success = sync_manager.sync_modes()
         assert success is False
         
-    def test_create_local_mode_directory(self, sync_manager, temp_project_dir):
+    def test_create_local_mode_directory(self, fs):
         """Test creating local mode directory structure."""
-        # Setup
-        sync_manager.set_local_config_path(temp_project_dir)
+        # Setup - only directory structure is asserted, so use pyfakefs' in-memory fs
+        modes_dir = Path("/fake/modes")
+        modes_dir.mkdir(parents=True)
+        project_dir = Path("/fake/project")
+        project_dir.mkdir(parents=True)
+        sync_manager = ModeSync(modes_dir)
+        sync_manager.set_local_config_path(project_dir)
         
         # Test
         created = sync_manager.create_local_mode_directory()
         
         # Verify
         assert created is True
-        assert (temp_project_dir / ModeSync.LOCAL_CONFIG_DIR).exists()
-        assert (temp_project_dir / ModeSync.LOCAL_CONFIG_DIR).is_dir()
+        assert (project_dir / ModeSync.LOCAL_CONFIG_DIR).exists()
+        assert (project_dir / ModeSync.LOCAL_CONFIG_DIR).is_dir()
         
     def test_sync_modes_to_local_target(self, sync_manager, temp_modes_dir, temp_project_dir):
         """Test syncing modes to a local project directory."""
         # Setup
         modes = ['code', 'debug', 'custom-mode']
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir,
-                mode,
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
         
         sync_manager.set_local_config_path(temp_project_dir)
         
@@ -400,11 +493,7 @@ class TestModeSync:
         # Setup
         modes = ['code', 'debug']
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir,
-                mode,
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
             
         # Create MCP request parameters
         params = {
@@ -469,11 +558,7 @@ class TestModeSync:
         # Setup
         modes = ['code', 'debug', 'custom-mode']
         for mode in modes:
-            self.create_mode_file(
-                temp_modes_dir,
-                mode,
-                self.create_valid_mode_config(mode)
-            )
+            self.create_valid_mode_file(temp_modes_dir, mode)
             
         # Test
         status = sync_manager.get_sync_status()
@@ -489,11 +574,7 @@ class TestModeSync:
     def test_sync_modes_with_config_write_error(self, sync_manager, temp_modes_dir, temp_config_dir, monkeypatch):
         """Test sync process with config write error."""
         # Create a valid mode
-        self.create_mode_file(
-            temp_modes_dir,
-            'test-mode',
-            self.create_valid_mode_config('test-mode')
-        )
+        self.create_valid_mode_file(temp_modes_dir, 'test-mode')
         
         # Set global config path
         config_path = temp_config_dir / "custom_modes.yaml"
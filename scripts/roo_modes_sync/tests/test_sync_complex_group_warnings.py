@@ -6,6 +6,8 @@ Tests that the sync script properly detects complex group notation in existing
 global configs and warns about information being stripped during sync.
 """
 
+import sys
+
 import pytest
 import yaml
 import tempfile
@@ -16,11 +18,13 @@ from unittest.mock import patch, MagicMock
 try:
     from ..core.sync import ModeSync
     from ..exceptions import SyncError
+    from ..core.yaml_loaders import SafeLoader, SafeDumper
 except ImportError:
     import sys
     sys.path.append(str(Path(__file__).parent.parent))
     from core.sync import ModeSync
     from exceptions import SyncError
+    from core.yaml_loaders import SafeLoader, SafeDumper
 
 
 class TestSyncComplexGroupWarnings:
@@ -42,7 +46,7 @@ class TestSyncComplexGroupWarnings:
             }
             
             with open(modes_dir / "test-mode.yaml", 'w') as f:
-                yaml.dump(test_mode, f)
+                yaml.dump(test_mode, f, Dumper=SafeDumper)
             
             yield modes_dir
     
@@ -89,7 +93,7 @@ class TestSyncComplexGroupWarnings:
             }
             
             with open(config_path, 'w') as f:
-                yaml.dump(complex_config, f)
+                yaml.dump(complex_config, f, Dumper=SafeDumper)
             
             yield config_path
     
@@ -152,6 +156,71 @@ class TestSyncComplexGroupWarnings:
         assert result['stripped_information'] == {}
         assert result['warning_messages'] == []
     
+    @pytest.fixture
+    def counting_loader(self):
+        """Swap the sync module's loader for one that counts parses and constructions."""
+        sync_module = sys.modules[ModeSync.__module__]
+        
+        class CountingLoader(sync_module._SafeLoader):
+            parses = 0
+            constructions = 0
+            
+            def get_single_node(self):
+                CountingLoader.parses += 1
+                return super().get_single_node()
+            
+            def construct_document(self, node):
+                CountingLoader.constructions += 1
+                return super().construct_document(node)
+        
+        with patch.object(sync_module, '_SafeLoader', CountingLoader):
+            yield CountingLoader
+    
+    def test_check_for_complex_groups_and_warn_skips_construction_for_simple_groups(
+            self, sync_instance, tmp_path, counting_loader):
+        """Test that a config without complex group keys is parsed once and never constructed."""
+        config_path = tmp_path / "custom_modes.yaml"
+        simple_config = {'customModes': [{'slug': 'code', 'name': 'Code', 'groups': ['read', 'edit']}]}
+        with open(config_path, 'w') as f:
+            yaml.dump(simple_config, f, Dumper=SafeDumper)
+        sync_instance.set_global_config_path(config_path)
+        
+        result = sync_instance.check_for_complex_groups_and_warn()
+        
+        assert (counting_loader.parses, counting_loader.constructions) == (1, 0)
+        assert result['has_complex_groups'] is False
+        assert result['warning_messages'] == []
+    
+    def test_check_for_complex_groups_and_warn_parses_complex_config_once(
+            self, sync_instance, temp_global_config_with_complex_groups, counting_loader):
+        """Test that a config with complex groups is built from the single parse."""
+        sync_instance.set_global_config_path(temp_global_config_with_complex_groups)
+        
+        with patch('yaml.load') as mock_load:
+            result = sync_instance.check_for_complex_groups_and_warn()
+        
+        mock_load.assert_not_called()
+        assert (counting_loader.parses, counting_loader.constructions) == (1, 1)
+        assert result['has_complex_groups'] is True
+        assert 'architect' in result['stripped_information']
+    
+    def test_check_for_complex_groups_and_warn_with_recursive_alias(self, sync_instance, tmp_path):
+        """Test that a self-referencing alias in the existing config does not hang the scan."""
+        config_path = tmp_path / "custom_modes.yaml"
+        config_path.write_text(
+            "customModes:\n"
+            "  - slug: code\n"
+            "    name: Code\n"
+            "    groups: &groups [read, *groups]\n",
+            encoding='utf-8'
+        )
+        sync_instance.set_global_config_path(config_path)
+
+        result = sync_instance.check_for_complex_groups_and_warn()
+
+        assert result['has_complex_groups'] is False
+        assert result['warning_messages'] == []
+
     def test_check_for_complex_groups_and_warn_with_nonexistent_config(self, sync_instance):
         """Test that no warnings are generated when config file doesn't exist."""
         # Set a non-existent config path
@@ -281,7 +350,6 @@ class TestSyncComplexGroupWarnings:
 
     def test_write_config_applies_global_config_fixer_transformation(self, sync_instance):
         """Test that write_config method applies GlobalConfigFixer transformation to complex groups."""
-        import tempfile
         
         with tempfile.TemporaryDirectory() as temp_dir:
             config_path = Path(temp_dir) / "test_config.yaml"
@@ -325,7 +393,7 @@ class TestSyncComplexGroupWarnings:
             # Read back the written config and verify transformation was applied
             with open(config_path, 'r') as f:
                 written_content = f.read()
-                written_config = yaml.safe_load(written_content)
+                written_config = yaml.load(written_content, Loader=SafeLoader)
             
             # Verify the complex groups were transformed to simple groups
             architect_mode = None
@@ -359,7 +427,6 @@ class TestSyncComplexGroupWarnings:
 
     def test_write_config_transformation_preserves_non_group_fields(self, sync_instance):
         """Test that GlobalConfigFixer transformation preserves all non-group fields."""
-        import tempfile
         
         with tempfile.TemporaryDirectory() as temp_dir:
             config_path = Path(temp_dir) / "test_config.yaml"
@@ -399,7 +466,7 @@ class TestSyncComplexGroupWarnings:
             
             # Read back and verify all fields preserved except groups are simplified
             with open(config_path, 'r') as f:
-                written_config = yaml.safe_load(f.read())
+                written_config = yaml.load(f.read(), Loader=SafeLoader)
             
             mode = written_config['customModes'][0]
             
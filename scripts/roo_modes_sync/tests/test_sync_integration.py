@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 from roo_modes_sync.core.sync import ModeSync
 from roo_modes_sync.core.validation import ModeValidator
+from roo_modes_sync.core.yaml_loaders import SafeDumper
 
 
 class TestSyncIntegration:
@@ -34,7 +35,7 @@ class TestSyncIntegration:
         
         mode_file = modes_dir / "test-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
@@ -51,13 +52,9 @@ class TestSyncIntegration:
         assert loaded_config['source'] == 'global'  # Should be overwritten
         assert 'model' not in loaded_config  # Should be stripped
     
-    def test_validation_accepts_development_metadata_but_strips_for_output(self, tmp_path):
+    def test_validation_accepts_development_metadata_but_strips_for_output(self):
         """Test that validation accepts development metadata but sync output is clean."""
-        # Create a temporary modes directory
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        # Create a mode file with development metadata
+        # Mode config with development metadata
         mode_config = {
             'slug': 'dev-test',
             'name': 'Development Test Mode',
@@ -68,15 +65,11 @@ class TestSyncIntegration:
             'model': 'claude-sonnet-4'
         }
         
-        mode_file = modes_dir / "dev-test.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
-        
         # Initialize validator
         validator = ModeValidator()
         
-        # Validation should pass (no exceptions raised)
-        result = validator.validate_mode_config(mode_config, str(mode_file), collect_warnings=True)
+        # Validation should pass (no exceptions raised); nothing needs to touch disk
+        result = validator.validate_mode_config(mode_config, "dev-test.yaml", collect_warnings=True)
         assert result.valid
         
         # Check that no warnings about development metadata fields
@@ -112,7 +105,7 @@ class TestSyncIntegration:
             
             mode_file = modes_dir / f"{slug}.yaml"
             with open(mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+                yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
@@ -133,11 +126,7 @@ class TestSyncIntegration:
     
     def test_backward_compatibility_with_existing_modes(self, tmp_path):
         """Test that existing modes without development metadata still work."""
-        # Create modes directory
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        # Create a clean mode file (like template modes)
+        # A clean mode config (like template modes)
         clean_mode_config = {
             'slug': 'clean-mode',
             'name': 'Clean Mode',
@@ -145,16 +134,12 @@ class TestSyncIntegration:
             'groups': ['read']
         }
         
-        mode_file = modes_dir / "clean-mode.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(clean_mode_config, f)
-        
         # Initialize sync system
-        sync = ModeSync(modes_dir)
+        sync = ModeSync(tmp_path / "modes")
         sync.set_options({'collect_warnings': True, 'continue_on_validation_error': False})
         
-        # Load the mode config
-        loaded_config = sync.load_mode_config('clean-mode')
+        # Run the load pipeline on the in-memory config
+        loaded_config = sync.validate_mode_dict(clean_mode_config, 'clean-mode')
         
         # Verify the mode loads correctly and gets source='global' added
         assert loaded_config['slug'] == 'clean-mode'
@@ -166,11 +151,7 @@ class TestSyncIntegration:
     
     def test_unknown_metadata_still_generates_warnings(self, tmp_path):
         """Test that unknown metadata fields (not in development list) still generate warnings."""
-        # Create modes directory
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        # Create a mode file with unknown metadata
+        # Mode config with unknown metadata
         mode_config = {
             'slug': 'unknown-meta',
             'name': 'Unknown Metadata Mode',
@@ -180,17 +161,13 @@ class TestSyncIntegration:
             'unknown_field': 'should cause warning'  # Unknown field
         }
         
-        mode_file = modes_dir / "unknown-meta.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
-        
         # Initialize sync system
-        sync = ModeSync(modes_dir)
+        sync = ModeSync(tmp_path / "modes")
         sync.set_options({'collect_warnings': True, 'continue_on_validation_error': False})
         
-        # Load the mode config - should generate warning about unknown_field
+        # Validate the mode config - should generate warning about unknown_field
         with patch('roo_modes_sync.core.sync.logger') as mock_logger:
-            loaded_config = sync.load_mode_config('unknown-meta')
+            loaded_config = sync.validate_mode_dict(mode_config, 'unknown-meta')
             
             # Check that a warning was logged about the unknown field
             warning_calls = [call for call in mock_logger.warning.call_args_list 
@@ -14,9 +14,11 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 from typing import Dict, Any
 
+from roo_modes_sync.core.backup import BackupError
 from roo_modes_sync.core.sync import ModeSync, CustomYAMLDumper
 from roo_modes_sync.exceptions import SyncError
 from roo_modes_sync.core.validation import ValidationLevel
+from roo_modes_sync.core.yaml_loaders import SafeDumper
 
 
 class TestModeSync_TDD_EnvironmentVariables:
@@ -222,7 +224,7 @@ class TestModeSync_TDD_ModeLoading:
         
         mode_file = tmp_path / "modes" / "test-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         sync_instance.set_options({'collect_warnings': True})
         
@@ -232,13 +234,31 @@ class TestModeSync_TDD_ModeLoading:
             assert result['source'] == 'global'
             mock_logger.warning.assert_called()
 
+    def test_validate_mode_dict_with_validation_warnings_collected(self, sync_instance):
+        """Test validate_mode_dict with warning collection enabled."""
+        mode_config = {
+            'slug': 'test-mode',
+            'name': 'Test Mode',
+            'roleDefinition': 'Test role',
+            'groups': ['read'],
+            'unknown_field': 'should cause warning'
+        }
+        
+        sync_instance.set_options({'collect_warnings': True})
+        
+        with patch('roo_modes_sync.core.sync.logger') as mock_logger:
+            result = sync_instance.validate_mode_dict(mode_config, "test-mode")
+            
+            assert result['source'] == 'global'
+            mock_logger.warning.assert_called()
+
     def test_load_mode_config_validation_error_with_continue_option(self, sync_instance, tmp_path):
         """Test load_mode_config continues on validation error when option is set."""
         invalid_config = {'slug': 'invalid', 'name': 'Invalid Mode'}  # Missing required fields
         
         mode_file = tmp_path / "modes" / "invalid.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(invalid_config, f)
+            yaml.dump(invalid_config, f, Dumper=SafeDumper)
         
         sync_instance.set_options({
             'collect_warnings': True,
@@ -250,6 +270,38 @@ class TestModeSync_TDD_ModeLoading:
             result = sync_instance.load_mode_config("invalid")
             assert result['source'] == 'global'
 
+    def test_validate_mode_dict_validation_error_with_continue_option(self, sync_instance):
+        """Test validate_mode_dict continues on validation error when option is set."""
+        invalid_config = {'slug': 'invalid', 'name': 'Invalid Mode'}  # Missing required fields
+        
+        sync_instance.set_options({
+            'collect_warnings': True,
+            'continue_on_validation_error': True
+        })
+        
+        # Should not raise exception due to continue_on_validation_error=True
+        with patch('roo_modes_sync.core.sync.logger'):
+            result = sync_instance.validate_mode_dict(invalid_config, "invalid")
+            assert result['source'] == 'global'
+
+    def test_load_mode_config_memo_respects_continue_option(self, sync_instance, tmp_path):
+        """Test that a config loaded under continue_on_validation_error is not reused without it."""
+        mode_file = tmp_path / "modes" / "invalid.yaml"
+        with open(mode_file, 'w') as f:
+            yaml.dump({'slug': 'invalid', 'name': 'Invalid Mode'}, f, Dumper=SafeDumper)
+
+        sync_instance.set_options({
+            'collect_warnings': True,
+            'continue_on_validation_error': True
+        })
+        with patch('roo_modes_sync.core.sync.logger'):
+            assert sync_instance.load_mode_config("invalid")['source'] == 'global'
+
+        sync_instance.set_options({'continue_on_validation_error': False})
+        with patch('roo_modes_sync.core.sync.logger'):
+            with pytest.raises(SyncError, match="Missing required fields"):
+                sync_instance.load_mode_config("invalid")
+
     def test_load_mode_config_file_permission_error(self, sync_instance, tmp_path):
         """Test load_mode_config handles file permission errors."""
         mode_file = tmp_path / "modes" / "permission.yaml"
@@ -279,7 +331,7 @@ class TestModeSync_TDD_ConfigGeneration:
             }
             mode_file = modes_dir / f"{slug}.yaml"
             with open(mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+                yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         return ModeSync(modes_dir)
 
@@ -362,7 +414,6 @@ class TestModeSync_TDD_BackupOperations:
         # Mock BackupManager to fail with BackupError, not generic Exception
         with patch.object(sync_instance.backup_manager, 'backup_local_roomodes') as mock_backup:
             # Import BackupError for proper exception type
-            from roo_modes_sync.core.backup import BackupError
             mock_backup.side_effect = BackupError("BackupManager failed")
 
             with patch('roo_modes_sync.core.sync.logger') as mock_logger:
@@ -524,7 +575,7 @@ class TestModeSync_TDD_SyncModes:
         }
         mode_file = modes_dir / "test-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         return ModeSync(modes_dir)
 
@@ -620,7 +671,7 @@ class TestModeSync_TDD_SyncFromDict:
         }
         mode_file = modes_dir / "test-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=SafeDumper)
         
         return ModeSync(modes_dir)
 
@@ -715,6 +766,11 @@ class TestModeSync_TDD_FormatMultilineString:
         
         assert result == '"Short text"'
 
+    def test_format_multiline_string_80_character_boundary(self, sync_instance):
+        """Test that exactly 80 characters is still quoted and 81 is a block scalar."""
+        assert sync_instance.format_multiline_string("A" * 80) == '"' + "A" * 80 + '"'
+        assert sync_instance.format_multiline_string("A" * 81).startswith("|-\n")
+
     def test_format_multiline_string_long_single_line(self, sync_instance):
         """Test format_multiline_string with long single line text."""
         text = "A" * 90  # Longer than 80 characters
@@ -1,16 +1,19 @@
 """Test cases for mode validation functionality."""
 
-import pytest
+import json
 import os
-import yaml
-from pathlib import Path
+import subprocess
+import sys
+
+import pytest
 from typing import Dict, List, Any, Optional
 
 from roo_modes_sync.core.validation import (
-    ModeValidator, 
     ValidationLevel, 
     ValidationResult,
-    ModeValidationError
+    ValidationErrorCode,
+    ModeValidationError,
+    _compile_file_regex
 )
 
 
@@ -18,17 +21,9 @@ class TestModeValidator:
     """Test cases for ModeValidator class."""
     
     @pytest.fixture
-    def validator(self):
-        """Create a validator instance for testing."""
-        return ModeValidator()
-    
-    @pytest.fixture
-    def temp_mode_file(self, tmp_path):
-        """Create a temporary directory and file for test mode files."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        mode_file = modes_dir / "test-mode.yaml"
-        return mode_file
+    def mode_filename(self):
+        """Filename reported in validation messages; validate_mode_config never reads it."""
+        return "test-mode.yaml"
     
     def create_valid_config(self) -> Dict[str, Any]:
         """Helper to create a valid mode configuration."""
@@ -62,51 +57,93 @@ class TestModeValidator:
         result.add_warning("New warning", "info")
         assert len(result.warnings) == 2
         assert result.warnings[-1] == {'level': 'info', 'message': 'New warning'}
+        assert result.warnings[-1].message == 'New warning'
+        assert result.warnings[-1]['level'] == 'info'
+        with pytest.raises(KeyError):
+            result.warnings[-1]['code']
         
         # Test string representation
         assert str(result) == "ValidationResult(valid=True, 2 warnings)"
-    
-    def test_validate_valid_config(self, validator, temp_mode_file):
+
+        # Cached representation follows later changes
+        result.add_warning("Another warning")
+        result.valid = False
+        assert str(result) == "ValidationResult(valid=False, 3 warnings)"
+        assert not hasattr(result, '__dict__')
+
+    def test_validation_warning_is_a_mapping(self):
+        """Test that warnings keep working wherever the old warning dicts did."""
+        result = ValidationResult(valid=True)
+        result.add_warning("Check this", "warning", code=ValidationErrorCode.INVALID_GROUP)
+        warning = result.warnings[0]
+
+        assert 'level' in warning
+        assert 'code' not in warning
+        assert dict(warning) == {'level': 'warning', 'message': 'Check this'}
+        assert list(warning.items()) == [('level', 'warning'), ('message', 'Check this')]
+        assert len(warning) == 2
+        assert warning.get('code', 'none') == 'none'
+        assert json.loads(json.dumps([w.to_dict() for w in result.warnings])) == [
+            {'level': 'warning', 'message': 'Check this'}
+        ]
+
+    def test_validate_valid_config(self, validator, mode_filename):
         """Test validation of a valid configuration."""
         config = self.create_valid_config()
         
         # Test with collect_warnings=False (returns boolean)
-        result = validator.validate_mode_config(config, temp_mode_file.name)
+        result = validator.validate_mode_config(config, mode_filename)
         assert result is True
         
         # Test with collect_warnings=True (returns ValidationResult)
-        result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
         assert isinstance(result, ValidationResult)
         assert result.valid is True
         assert len(result.warnings) == 0
     
-    def test_validate_missing_required_fields(self, validator, temp_mode_file):
+    @pytest.mark.parametrize('field', ['slug', 'name', 'roleDefinition', 'groups'])
+    def test_validate_missing_required_fields(self, validator, mode_filename, field):
         """Test validation fails with missing required fields."""
-        required_fields = ['slug', 'name', 'roleDefinition', 'groups']
+        config = self.create_config_with_missing_field(field)
         
-        for field in required_fields:
-            config = self.create_config_with_missing_field(field)
-            
-            # Test with collect_warnings=False (should raise exception)
-            with pytest.raises(ModeValidationError) as e:
-                validator.validate_mode_config(config, temp_mode_file.name)
-            assert f"Missing required fields" in str(e.value)
-            assert field in str(e.value)
-            
-            # Test with collect_warnings=True (should return invalid result with warnings)
-            result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
-            assert result.valid is False
-            assert len(result.warnings) == 1
-            assert result.warnings[0]['level'] == 'error'
-            assert field in result.warnings[0]['message']
+        # Test with collect_warnings=False (should raise exception)
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert f"Missing required fields" in str(e.value)
+        assert field in str(e.value)
+        
+        # Test with collect_warnings=True (should return invalid result with warnings)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
+        assert result.valid is False
+        assert len(result.warnings) == 1
+        assert result.warnings[0]['level'] == 'error'
+        assert field in result.warnings[0]['message']
     
-    def test_validate_unexpected_fields(self, validator, temp_mode_file):
+    def test_missing_required_fields_keep_declaration_order(self, validator, mode_filename):
+        """Test that several missing fields are reported in REQUIRED_FIELDS order."""
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config({'name': 'Test Mode', 'roleDefinition': 'x'}, mode_filename)
+        assert str(e.value).endswith("slug, groups")
+
+    @pytest.mark.parametrize('config', [['slug', 'name'], 'slug: name'])
+    def test_non_mapping_config_misses_all_required_fields(self, validator, mode_filename, config):
+        """Test that a list or string config reports every required field as missing."""
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert str(e.value).endswith("slug, name, roleDefinition, groups")
+
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
+        assert result.valid is False
+        assert [w['level'] for w in result.warnings] == ['error']
+        assert "Missing required fields" in result.warnings[0]['message']
+
+    def test_validate_unexpected_fields(self, validator, mode_filename):
         """Test validation with unexpected top-level fields."""
         config = self.create_valid_config()
         config['unexpectedField'] = "Some value"
         
         # Test with NORMAL validation level (default)
-        result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
         assert result.valid is True
         assert len(result.warnings) == 1
         assert "unexpectedField" in result.warnings[0]['message']
@@ -114,79 +151,145 @@ class TestModeValidator:
         # Test with STRICT validation level
         validator.set_validation_level(ValidationLevel.STRICT)
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "unexpectedField" in str(e.value)
         
         # Test with PERMISSIVE validation level
         validator.set_validation_level(ValidationLevel.PERMISSIVE)
-        result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
         assert result.valid is True
         assert len(result.warnings) == 1
     
-    def test_validate_string_fields(self, validator, temp_mode_file):
+    @pytest.mark.parametrize('field', ['slug', 'name', 'roleDefinition', 'whenToUse', 'customInstructions'])
+    def test_validate_string_fields(self, validator, mode_filename, field):
         """Test validation of string fields."""
-        string_fields = ['slug', 'name', 'roleDefinition', 'whenToUse', 'customInstructions']
+        # Test with non-string value
+        config = self.create_valid_config()
+        config[field] = 42  # Not a string
         
-        for field in string_fields:
-            # Test with non-string value
-            config = self.create_valid_config()
-            if field not in config:  # Add optional fields if needed
-                config[field] = "Valid string"
-            config[field] = 42  # Not a string
-            
-            with pytest.raises(ModeValidationError) as e:
-                validator.validate_mode_config(config, temp_mode_file.name)
-            assert f"must be a string" in str(e.value)
-            
-            # Test with empty string
-            config = self.create_valid_config()
-            if field not in config:  # Add optional fields if needed
-                config[field] = "Valid string"
-            config[field] = ""
-            
-            with pytest.raises(ModeValidationError) as e:
-                validator.validate_mode_config(config, temp_mode_file.name)
-            assert f"cannot be empty" in str(e.value)
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert f"must be a string" in str(e.value)
+        
+        # Test with empty string
+        config = self.create_valid_config()
+        config[field] = ""
+        
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert f"cannot be empty" in str(e.value)
     
-    def test_validate_slug_format(self, validator, temp_mode_file):
-        """Test validation of slug format."""
-        # Test valid slug formats
-        valid_slugs = ['test-mode', 'code', 'architect-plus', 'test-123']
-        for slug in valid_slugs:
-            config = self.create_valid_config()
-            config['slug'] = slug
-            result = validator.validate_mode_config(config, temp_mode_file.name)
-            assert result is True
+    @pytest.mark.parametrize('slug', ['test-mode', 'code', 'architect-plus', 'test-123'])
+    def test_validate_valid_slug_format(self, validator, mode_filename, slug):
+        """Test validation accepts well-formed slugs."""
+        config = self.create_valid_config()
+        config['slug'] = slug
+        result = validator.validate_mode_config(config, mode_filename)
+        assert result is True
+    
+    @pytest.mark.parametrize('slug', ['Test_Mode', 'code space', 'test_underscore', 'Test', '-leading-hyphen'])
+    def test_validate_invalid_slug_format(self, validator, mode_filename, slug):
+        """Test validation of malformed slugs at NORMAL and PERMISSIVE levels."""
+        config = self.create_valid_config()
+        config['slug'] = slug
         
-        # Test invalid slug formats
-        invalid_slugs = ['Test_Mode', 'code space', 'test_underscore', 'Test', '-leading-hyphen']
+        # With NORMAL validation (default)
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert "Invalid slug format" in str(e.value)
         
-        for slug in invalid_slugs:
-            config = self.create_valid_config()
-            config['slug'] = slug
-            
-            # With NORMAL validation (default)
-            with pytest.raises(ModeValidationError) as e:
-                validator.validate_mode_config(config, temp_mode_file.name)
-            assert "Invalid slug format" in str(e.value)
-            
-            # With PERMISSIVE validation (should be a warning)
-            validator.set_validation_level(ValidationLevel.PERMISSIVE)
-            result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
-            assert result.valid is True
-            assert any("Invalid slug format" in w['message'] for w in result.warnings)
-            
-            # Reset validation level
-            validator.set_validation_level(ValidationLevel.NORMAL)
+        # With PERMISSIVE validation (should be a warning)
+        validator.set_validation_level(ValidationLevel.PERMISSIVE)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
+        assert result.valid is True
+        assert result.has(ValidationErrorCode.INVALID_SLUG)
     
-    def test_validate_groups(self, validator, temp_mode_file):
+    def test_validation_error_codes(self, validator, mode_filename):
+        """Test that validation errors expose structured codes alongside messages."""
+        config = self.create_valid_config()
+        config['slug'] = 'Invalid_Slug'
+        config['groups'] = ['invalid-group']
+        
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        
+        assert e.value.codes == [ValidationErrorCode.INVALID_SLUG, ValidationErrorCode.INVALID_GROUP]
+        message = str(e.value)
+        assert "Invalid slug format" in message
+        assert "Invalid group name" in message
+        assert len(message.splitlines()) == 2
+    
+    def test_all_field_errors_reported_together(self, validator, mode_filename):
+        """Test that slug, name and groups problems all surface from one validation."""
+        config = self.create_valid_config()
+        config['slug'] = 'Bad Slug'
+        config['name'] = ''
+        config['groups'] = 'read'
+        config['extra'] = True
+        
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
+        assert result.valid is False
+        assert result.codes == {
+            ValidationErrorCode.INVALID_SLUG,
+            ValidationErrorCode.EMPTY_FIELD,
+            ValidationErrorCode.GROUPS_NOT_ARRAY,
+            ValidationErrorCode.UNEXPECTED_FIELD,
+        }
+        assert [w.field for w in result.warnings if w.code == ValidationErrorCode.EMPTY_FIELD] == ['name']
+    
+    def test_strict_level_stops_at_first_error(self, validator, mode_filename):
+        """Test that STRICT validation without warnings reports only the first error."""
+        config = self.create_valid_config()
+        config['slug'] = 'Bad Slug'
+        config['groups'] = ['invalid-group']
+        validator.set_validation_level(ValidationLevel.STRICT)
+        
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert e.value.codes == [ValidationErrorCode.INVALID_SLUG]
+        
+        # Collecting warnings still reports everything
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
+        assert result.codes == {ValidationErrorCode.INVALID_SLUG, ValidationErrorCode.INVALID_GROUP}
+    
+    def test_is_valid_fast_path(self, validator):
+        """Test that is_valid agrees with validate_mode_config without raising."""
+        config = self.create_valid_config()
+        assert validator.is_valid(config) is True
+        
+        config['slug'] = 'Invalid_Slug'
+        assert validator.is_valid(config) is False
+        
+        assert validator.is_valid({'slug': 'test-mode'}) is False
+        assert validator.is_valid(['not', 'a', 'dict']) is False
+        
+        # Issues downgraded to warnings do not make a config invalid
+        validator.set_validation_level(ValidationLevel.PERMISSIVE)
+        assert validator.is_valid(config) is True
+    
+    def test_validate_mode_config_two_tier(self, validator, mode_filename, mocker):
+        """Test that valid configs skip the full pass and invalid ones report every error."""
+        check_spy = mocker.spy(validator, "_check_mode_config")
+        assert validator.validate_mode_config(self.create_valid_config(), mode_filename) is True
+        assert check_spy.call_count == 1
+        
+        config = self.create_valid_config()
+        config['slug'] = 'Invalid_Slug'
+        config['groups'] = ['invalid-group']
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename)
+        assert check_spy.call_count == 3
+        assert ValidationErrorCode.INVALID_SLUG in e.value.codes
+        assert ValidationErrorCode.INVALID_GROUP in e.value.codes
+    
+    def test_validate_groups(self, validator, mode_filename):
         """Test validation of groups configuration."""
         # Test with valid simple groups
         valid_simple_groups = [['read'], ['edit'], ['browser'], ['command'], ['mcp'], ['read', 'edit'], ['read', 'command', 'mcp']]
         for groups in valid_simple_groups:
             config = self.create_valid_config()
             config['groups'] = groups
-            result = validator.validate_mode_config(config, temp_mode_file.name)
+            result = validator.validate_mode_config(config, mode_filename)
             assert result is True
         
         # Test with invalid simple group
@@ -194,7 +297,7 @@ class TestModeValidator:
         config['groups'] = ['invalid-group']
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "Invalid group name" in str(e.value)
         
         # Test with empty groups array (should always fail)
@@ -204,7 +307,7 @@ class TestModeValidator:
         # Even with PERMISSIVE validation
         validator.set_validation_level(ValidationLevel.PERMISSIVE)
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "cannot be empty" in str(e.value)
         
         # Test with non-array groups
@@ -212,10 +315,10 @@ class TestModeValidator:
         config['groups'] = "read"  # String instead of array
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "must be an array" in str(e.value)
     
-    def test_validate_complex_groups(self, validator, temp_mode_file):
+    def test_validate_complex_groups(self, validator, mode_filename):
         """Test validation of complex groups configuration."""
         # Valid complex group
         config = self.create_valid_config()
@@ -223,7 +326,7 @@ class TestModeValidator:
             'read',
             ['edit', {'fileRegex': '\.md$', 'description': 'Edit markdown files'}]
         ]
-        result = validator.validate_mode_config(config, temp_mode_file.name)
+        result = validator.validate_mode_config(config, mode_filename)
         assert result is True
         
         # Test invalid complex group (wrong length)
@@ -231,7 +334,7 @@ class TestModeValidator:
         config['groups'] = [['edit', {'fileRegex': '\.md$'}, 'extra-item']]
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "must have exactly 2 items" in str(e.value)
         
         # Test invalid complex group (first item not 'edit')
@@ -239,7 +342,7 @@ class TestModeValidator:
         config['groups'] = [['read', {'fileRegex': '\.md$'}]]
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "First item in complex group must be 'edit'" in str(e.value)
         
         # Test invalid complex group (second item not object)
@@ -247,7 +350,7 @@ class TestModeValidator:
         config['groups'] = [['edit', 'not-an-object']]
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "must be an object" in str(e.value)
         
         # Test invalid complex group (missing fileRegex)
@@ -255,7 +358,7 @@ class TestModeValidator:
         config['groups'] = [['edit', {'description': 'No file regex'}]]
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "must have 'fileRegex' property" in str(e.value)
         
         # Test invalid complex group (invalid regex)
@@ -263,7 +366,7 @@ class TestModeValidator:
         config['groups'] = [['edit', {'fileRegex': '[invalid regex'}]]
         
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "Invalid regex pattern" in str(e.value)
         
         # Test unexpected properties in complex group
@@ -273,16 +376,31 @@ class TestModeValidator:
         ]
         
         # With NORMAL validation (should pass)
-        result = validator.validate_mode_config(config, temp_mode_file.name)
+        result = validator.validate_mode_config(config, mode_filename)
         assert result is True
         
         # With STRICT validation (should fail)
         validator.set_validation_level(ValidationLevel.STRICT)
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "Unexpected properties in complex group" in str(e.value)
     
-    def test_extended_schema_validation(self, validator, temp_mode_file):
+    def test_file_regex_compiled_once_per_pattern(self, validator, mode_filename):
+        """Test that fileRegex patterns are memoized and invalid ones keep failing."""
+        _compile_file_regex.cache_clear()
+        config = self.create_valid_config()
+        config['groups'] = [['edit', {'fileRegex': r'\.py$'}], {'edit': {'fileRegex': r'\.py$'}}]
+        
+        assert validator.validate_mode_config(config, mode_filename) is True
+        assert _compile_file_regex.cache_info().misses == 1
+        assert _compile_file_regex.cache_info().hits == 1
+        
+        config['groups'] = [['edit', {'fileRegex': '[invalid regex'}]]
+        for _ in range(2):
+            with pytest.raises(ModeValidationError, match="Invalid regex pattern"):
+                validator.validate_mode_config(config, mode_filename)
+    
+    def test_extended_schema_validation(self, validator, mode_filename):
         """Test validation with extended schemas."""
         # Register a test extended schema
         test_schema = {
@@ -304,7 +422,7 @@ class TestModeValidator:
         config['extensions'] = {'version': '1.0'}
         
         result = validator.validate_mode_config(
-            config, temp_mode_file.name, extensions=['test-extension']
+            config, mode_filename, extensions=['test-extension']
         )
         assert result is True
         
@@ -312,7 +430,7 @@ class TestModeValidator:
         config['customInstructions'] = 42  # Not a string
         with pytest.raises(ModeValidationError) as e:
             validator.validate_mode_config(
-                config, temp_mode_file.name, extensions=['test-extension']
+                config, mode_filename, extensions=['test-extension']
             )
         assert "must be a string" in str(e.value)
         
@@ -321,27 +439,54 @@ class TestModeValidator:
         config['extensions'] = {}  # Missing required 'version'
         with pytest.raises(ModeValidationError) as e:
             validator.validate_mode_config(
-                config, temp_mode_file.name, extensions=['test-extension']
+                config, mode_filename, extensions=['test-extension']
             )
         assert "Missing required fields" in str(e.value)
         assert "version" in str(e.value)
+    
+    def test_extended_schema_compilation_cache(self, validator, mode_filename):
+        """Test that compiled extended schemas are reused and invalidated on registration."""
+        validator.register_extended_schema('test-extension', {
+            'properties': {'extensions': {'type': 'object'}}
+        })
+        config = self.create_valid_config()
+        config['extensions'] = {'version': '1.0'}
+        
+        validator.validate_mode_config(config, mode_filename, extensions=['test-extension'])
+        compiled = validator._get_compiled_extensions(['test-extension'])
+        assert validator._get_compiled_extensions(['test-extension']) is compiled
+        
+        # Re-registering must drop the stale compiled schema
+        validator.register_extended_schema('test-extension', {
+            'properties': {'extensions': {'type': 'object', 'required': ['author']}}
+        })
+        with pytest.raises(ModeValidationError) as e:
+            validator.validate_mode_config(config, mode_filename, extensions=['test-extension'])
+        assert "author" in str(e.value)
+    
+    def test_unregister_extended_schema(self, validator, mode_filename):
+        """Test that unregistered schemas are released and no longer applied."""
+        validator.register_extended_schema('test-extension', {
+            'properties': {'extensions': {'type': 'object', 'required': ['author']}}
+        })
+        config = self.create_valid_config()
+        config['extensions'] = {'version': '1.0'}
+        with pytest.raises(ModeValidationError):
+            validator.validate_mode_config(config, mode_filename, extensions=['test-extension'])
+        
+        assert validator.unregister_extended_schema('test-extension') is True
+        assert validator.unregister_extended_schema('test-extension') is False
+        assert validator.extended_schemas == {}
+        assert len(validator._compiled_cache) == 0
 
 
 class TestDevelopmentMetadataHandling:
     """Test cases for development metadata handling functionality."""
     
     @pytest.fixture
-    def validator(self):
-        """Create a validator instance for testing."""
-        return ModeValidator()
-    
-    @pytest.fixture
-    def temp_mode_file(self, tmp_path):
-        """Create a temporary directory and file for test mode files."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        mode_file = modes_dir / "test-mode.yaml"
-        return mode_file
+    def mode_filename(self):
+        """Filename reported in validation messages; validate_mode_config never reads it."""
+        return "test-mode.yaml"
     
     def create_valid_config_with_dev_metadata(self) -> Dict[str, Any]:
         """Helper to create a valid mode configuration with development metadata."""
@@ -354,20 +499,20 @@ class TestDevelopmentMetadataHandling:
             'model': 'claude-sonnet-4'  # Development metadata
         }
     
-    def test_validate_mode_with_development_metadata_should_pass(self, validator, temp_mode_file):
+    def test_validate_mode_with_development_metadata_should_pass(self, validator, mode_filename):
         """Test that mode files with development metadata validate successfully."""
         config = self.create_valid_config_with_dev_metadata()
         
         # Should validate successfully with collect_warnings=True
-        result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
         assert isinstance(result, ValidationResult)
         assert result.valid is True
         
         # Should validate successfully as boolean
-        result = validator.validate_mode_config(config, temp_mode_file.name)
+        result = validator.validate_mode_config(config, mode_filename)
         assert result is True
     
-    def test_development_metadata_fields_are_accepted(self, validator, temp_mode_file):
+    def test_development_metadata_fields_are_accepted(self, validator, mode_filename):
         """Test that specific development metadata fields are accepted during validation."""
         config = {
             'slug': 'test-mode',
@@ -388,10 +533,10 @@ class TestDevelopmentMetadataHandling:
             test_config = config.copy()
             test_config[field_name] = field_value
             
-            result = validator.validate_mode_config(test_config, temp_mode_file.name, collect_warnings=True)
+            result = validator.validate_mode_config(test_config, mode_filename, collect_warnings=True)
             assert result.valid is True, f"Validation failed for {field_name}: {field_value}"
     
-    def test_strip_development_metadata_functionality(self, validator, temp_mode_file):
+    def test_strip_development_metadata_functionality(self, validator, mode_filename):
         """Test that development metadata can be stripped from configuration."""
         config_with_metadata = self.create_valid_config_with_dev_metadata()
         
@@ -412,7 +557,7 @@ class TestDevelopmentMetadataHandling:
         assert stripped_config['roleDefinition'] == 'This is a test mode'
         assert stripped_config['groups'] == ['read', 'edit']
     
-    def test_strip_development_metadata_preserves_optional_core_fields(self, validator, temp_mode_file):
+    def test_strip_development_metadata_preserves_optional_core_fields(self, validator, mode_filename):
         """Test that stripping preserves optional core Roo fields."""
         config = self.create_valid_config_with_dev_metadata()
         config['whenToUse'] = 'Use this mode for testing'
@@ -430,7 +575,7 @@ class TestDevelopmentMetadataHandling:
         assert 'source' not in stripped_config
         assert 'model' not in stripped_config
     
-    def test_mixed_valid_invalid_scenarios(self, validator, temp_mode_file):
+    def test_mixed_valid_invalid_scenarios(self, validator, mode_filename):
         """Test scenarios with both valid metadata and invalid core fields."""
         # Test with development metadata but missing required core field
         config = self.create_valid_config_with_dev_metadata()
@@ -438,7 +583,7 @@ class TestDevelopmentMetadataHandling:
         
         # Should still fail validation due to missing core field
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "Missing required fields" in str(e.value)
         assert "slug" in str(e.value)
         
@@ -448,15 +593,15 @@ class TestDevelopmentMetadataHandling:
         
         # Should fail validation due to invalid core field
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(config, temp_mode_file.name)
+            validator.validate_mode_config(config, mode_filename)
         assert "Invalid group name" in str(e.value)
     
-    def test_unknown_metadata_fields_still_generate_warnings(self, validator, temp_mode_file):
+    def test_unknown_metadata_fields_still_generate_warnings(self, validator, mode_filename):
         """Test that unknown fields (not development metadata) still generate warnings."""
         config = self.create_valid_config_with_dev_metadata()
         config['unknownField'] = 'some value'  # This should still be flagged
         
-        result = validator.validate_mode_config(config, temp_mode_file.name, collect_warnings=True)
+        result = validator.validate_mode_config(config, mode_filename, collect_warnings=True)
         assert result.valid is True
         
         # Should have warning for unknown field but not for development metadata
@@ -475,7 +620,7 @@ class TestDevelopmentMetadataHandling:
         expected_fields = {'source', 'model'}
         assert set(dev_fields) == expected_fields
     
-    def test_backward_compatibility_with_existing_validation(self, validator, temp_mode_file):
+    def test_backward_compatibility_with_existing_validation(self, validator, mode_filename):
         """Test that existing validation behavior is preserved for core fields."""
         # Test with standard config (no development metadata)
         standard_config = {
@@ -486,7 +631,7 @@ class TestDevelopmentMetadataHandling:
         }
         
         # Should work exactly as before
-        result = validator.validate_mode_config(standard_config, temp_mode_file.name)
+        result = validator.validate_mode_config(standard_config, mode_filename)
         assert result is True
         
         # Test with invalid standard config
@@ -495,5 +640,18 @@ class TestDevelopmentMetadataHandling:
         
         # Should fail exactly as before
         with pytest.raises(ModeValidationError) as e:
-            validator.validate_mode_config(invalid_config, temp_mode_file.name)
-        assert "Missing required fields" in str(e.value)
\ No newline at end of file
+            validator.validate_mode_config(invalid_config, mode_filename)
+        assert "Missing required fields" in str(e.value)
+
+
+def test_importing_validation_defers_yaml():
+    """Test that PyYAML is only imported once a file actually needs parsing."""
+    code = (
+        "import sys\n"
+        "import roo_modes_sync.core.validation\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                            text=True, check=True, env=env).stdout
+    assert output.strip() == "False"
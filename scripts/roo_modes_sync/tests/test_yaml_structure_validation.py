@@ -3,7 +3,6 @@
 import pytest
 
 from roo_modes_sync.core.validation import (
-    ModeValidator,
     ValidationResult,
     YAMLStructureError
 )
@@ -12,11 +11,6 @@ from roo_modes_sync.core.validation import (
 class TestYAMLStructureValidation:
     """Test cases for YAML structure validation."""
     
-    @pytest.fixture
-    def validator(self):
-        """Create a validator instance for testing."""
-        return ModeValidator()
-    
     @pytest.fixture
     def temp_mode_file(self, tmp_path):
         """Create a temporary directory and file for test mode files."""
@@ -233,6 +227,61 @@ groups:
         with pytest.raises(YAMLStructureError):
             validator.validate_mode_file(str(temp_mode_file))
     
+    def test_validate_mode_file_result_cache(self, validator, temp_mode_file, mocker):
+        """Test that unchanged files reuse cached results and changes invalidate them."""
+        temp_mode_file.write_text(self.create_valid_yaml_content())
+        structure_spy = mocker.spy(validator, 'validate_yaml_structure')
+        
+        first = validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        second = validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        assert first.valid is True and second.valid is True
+        assert structure_spy.call_count == 1
+        
+        # Cached results are copies, so mutating one does not leak into the next
+        second.add_warning("caller-added warning")
+        third = validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        assert third.warnings == first.warnings
+        
+        # Registering a schema invalidates earlier entries
+        validator.register_extended_schema('extra', {'properties': {}})
+        validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        assert structure_spy.call_count == 2
+        
+        # clear_cache() forgets every stored result
+        validator.clear_cache()
+        validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        assert structure_spy.call_count == 3
+        
+        # Changed content is validated afresh
+        temp_mode_file.write_text(self.create_malformed_groups_yaml_content())
+        result = validator.validate_mode_file(str(temp_mode_file), collect_warnings=True)
+        assert result.valid is False
+    
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_validate_directory(self, validator, tmp_path, workers, monkeypatch):
+        """Test directory validation in-process and across a worker pool."""
+        monkeypatch.setattr(validator, 'PARALLEL_MIN_FILES', 2)
+        valid_file = tmp_path / "good-mode.yaml"
+        valid_file.write_text(self.create_valid_yaml_content())
+        invalid_file = tmp_path / "bad-mode.yaml"
+        invalid_file.write_text(self.create_malformed_groups_yaml_content())
+        
+        results = validator.validate_directory(tmp_path, workers=workers)
+        
+        assert list(results) == [invalid_file, valid_file]
+        assert results[valid_file].valid is True
+        assert results[invalid_file].valid is False
+
+    def test_validate_directory_skips_non_files(self, validator, tmp_path):
+        """Test that only regular .yaml files are validated and missing directories yield nothing."""
+        valid_file = tmp_path / "good-mode.yaml"
+        valid_file.write_text(self.create_valid_yaml_content())
+        (tmp_path / "nested.yaml").mkdir()
+        (tmp_path / "notes.txt").write_text("not a mode")
+
+        assert list(validator.validate_directory(tmp_path)) == [valid_file]
+        assert validator.validate_directory(tmp_path / "missing") == {}
+
     def test_yaml_structure_validation_performance(self, validator, temp_mode_file):
         """Test that YAML structure validation is performant for large files."""
         # Create a large valid YAML file
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for the top-level test suite.
+"""
+
+import sys
+from pathlib import Path
+
+# Resolve the package location once per session instead of in every test module.
+# scripts/ makes the fully-qualified roo_modes_sync package importable; the
+# package directory itself serves the older flat imports (core.backup, ...)
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+PKG_ROOT = SCRIPTS_DIR / "roo_modes_sync"
+for path in (SCRIPTS_DIR, PKG_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -10,12 +10,10 @@ import os
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
-import sys
-script_dir = Path(__file__).resolve().parent.parent / "scripts" / "roo_modes_sync"
-sys.path.insert(0, str(script_dir))
-
 from core.backup import BackupManager, BackupError
 
+from roo_modes_sync.core.yaml_loaders import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 class TestBackupManagerCorrected:
     """Test backup system with correct file structure understanding."""
@@ -34,7 +32,7 @@ class TestBackupManagerCorrected:
             ]
         }
         with open(local_roomodes_file, 'w') as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=_SafeDumper)
         
         # Initialize backup manager
         backup_manager = BackupManager(tmp_path)
@@ -49,7 +47,7 @@ class TestBackupManagerCorrected:
         
         # Verify backup content
         with open(backup_path, 'r') as f:
-            backup_content = yaml.safe_load(f)
+            backup_content = yaml.load(f, Loader=_SafeLoader)
         assert backup_content == test_config
     
     def test_backup_local_roomodes_fails_when_file_missing(self, tmp_path):
@@ -86,7 +84,7 @@ class TestBackupManagerCorrected:
             ]
         }
         with open(mock_global_config, 'w') as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=_SafeDumper)
         
         # Initialize backup manager with project root
         project_root = tmp_path / "project"
@@ -104,7 +102,7 @@ class TestBackupManagerCorrected:
         
         # Verify backup content
         with open(backup_path, 'r') as f:
-            backup_content = yaml.safe_load(f)
+            backup_content = yaml.load(f, Loader=_SafeLoader)
         assert backup_content == test_config
     
     @patch('os.path.expanduser')
@@ -152,7 +150,7 @@ class TestBackupManagerCorrected:
         }
         backup_path = backup_manager.local_backup_dir / '.roomodes_1'
         with open(backup_path, 'w') as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=_SafeDumper)
         
         # Restore from backup
         restored_path = backup_manager.restore_local_roomodes(backup_path)
@@ -164,7 +162,7 @@ class TestBackupManagerCorrected:
         
         # Verify restored content
         with open(restored_path, 'r') as f:
-            restored_content = yaml.safe_load(f)
+            restored_content = yaml.load(f, Loader=_SafeLoader)
         assert restored_content == test_config
         
         # Verify backup file was removed after successful restore
@@ -201,7 +199,7 @@ class TestBackupManagerCorrected:
         }
         backup_path = backup_manager.global_backup_dir / 'custom_modes_1.yaml'
         with open(backup_path, 'w') as f:
-            yaml.dump(test_config, f)
+            yaml.dump(test_config, f, Dumper=_SafeDumper)
         
         # Restore from backup
         restored_path = backup_manager.restore_global_roomodes(backup_path)
@@ -213,7 +211,7 @@ class TestBackupManagerCorrected:
         
         # Verify restored content
         with open(restored_path, 'r') as f:
-            restored_content = yaml.safe_load(f)
+            restored_content = yaml.load(f, Loader=_SafeLoader)
         assert restored_content == test_config
         
         # Verify backup file was removed after successful restore
@@ -232,7 +230,7 @@ class TestBackupManagerCorrected:
         # Write test content to backup files
         for backup_file in [local_backup1, local_backup2, global_backup1, global_backup2]:
             with open(backup_file, 'w') as f:
-                yaml.dump({'test': 'content'}, f)
+                yaml.dump({'test': 'content'}, f, Dumper=_SafeDumper)
         
         # List backups
         all_backups = backup_manager.list_available_backups()
@@ -254,7 +252,7 @@ class TestBackupManagerCorrected:
         # Create only local file
         local_roomodes = tmp_path / '.roomodes'
         with open(local_roomodes, 'w') as f:
-            yaml.dump({'local': 'config'}, f)
+            yaml.dump({'local': 'config'}, f, Dumper=_SafeDumper)
         
         # Mock global config to not exist
         with patch('os.path.expanduser') as mock_expanduser:
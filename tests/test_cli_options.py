@@ -3,42 +3,67 @@
 Tests for CLI short options and argument parsing.
 """
 
+import copy
+import types
 import pytest
 import tempfile
-import yaml
 import argparse
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-import sys
 
-# Add the sync package to path for imports
-script_dir = Path(__file__).resolve().parent.parent / "scripts" / "roo_modes_sync"
-sys.path.insert(0, str(script_dir))
-
-from cli import main, parse_strategy_argument
+from cli import main, build_parser, parse_strategy_argument, sync_global, sync_local
 from core.sync import ModeSync
 from core.backup import BackupManager
 from exceptions import SyncError
 
+# Pre-serialized mode files, so tests write bytes instead of running yaml.dump
+TEST_MODE_YAML = {
+    "test-mode": (
+        b"groups:\n"
+        b"- read\n"
+        b"name: Test Mode\n"
+        b"roleDefinition: A test mode\n"
+        b"slug: test-mode\n"
+    ),
+    "cli-test": (
+        b"groups:\n"
+        b"- read\n"
+        b"name: CLI Test Mode\n"
+        b"roleDefinition: A mode for CLI testing\n"
+        b"slug: cli-test\n"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Build the CLI parser once; parse_args keeps no state between calls."""
+    return build_parser()
+
 
 class TestCLIShortOptions:
     """Test CLI short options functionality."""
     
-    def test_global_sync_short_options(self, tmp_path):
+    @pytest.fixture
+    def base_args(self):
+        """Pre-configured args template; tests copy it and set command-specific fields."""
+        return types.SimpleNamespace(
+            modes_dir=None,
+            strategy=None,
+            dry_run=False,
+            no_backup=False,
+            no_recurse=False,
+            config=None
+        )
+    
+    def test_global_sync_short_options(self, tmp_path, base_args, mocker):
         """Test that short options work for sync-global command."""
         # Create test modes directory
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         
         # Create a simple test mode
-        test_mode = {
-            'slug': 'test-mode',
-            'name': 'Test Mode',
-            'roleDefinition': 'A test mode',
-            'groups': ['read']
-        }
-        with open(modes_dir / "test-mode.yaml", 'w') as f:
-            yaml.dump(test_mode, f)
+        (modes_dir / "test-mode.yaml").write_bytes(TEST_MODE_YAML["test-mode"])
         
         # Test with short options: -m, -s, -d, -b
         test_args = [
@@ -49,33 +74,29 @@ class TestCLIShortOptions:
             '-b'   # no-backup
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_global') as mock_sync_global:
-                mock_sync_global.return_value = 0
-                
-                # Mock the argument parsing to capture the parsed args
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    # Create a mock args object with the expected attributes
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-global'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.strategy = 'alphabetical'
-                    mock_args.dry_run = True
-                    mock_args.no_backup = True
-                    mock_args.config = None
-                    mock_args.no_recurse = False
-                    mock_args.func = mock_sync_global
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    # Call main function
-                    result = main()
-                    
-                    # Verify the function was called with correct arguments
-                    mock_sync_global.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_sync_global = mocker.patch('cli.sync_global', return_value=0)
+        
+        # Create an args object with the expected attributes
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'sync-global'
+        mock_args.modes_dir = Path(str(modes_dir))
+        mock_args.strategy = 'alphabetical'
+        mock_args.dry_run = True
+        mock_args.no_backup = True
+        mock_args.func = mock_sync_global
+        
+        # Mock the argument parsing to capture the parsed args
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        # Call main function
+        result = main()
+        
+        # Verify the function was called with correct arguments
+        mock_sync_global.assert_called_once_with(mock_args)
+        assert result == 0
     
-    def test_local_sync_short_options(self, tmp_path):
+    def test_local_sync_short_options(self, tmp_path, base_args, mocker):
         """Test that short options work for sync-local command."""
         # Create test modes directory
         modes_dir = tmp_path / "modes"
@@ -93,29 +114,26 @@ class TestCLIShortOptions:
             '-b'   # no-backup
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_local') as mock_sync_local:
-                mock_sync_local.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-local'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.project_dir = str(project_dir)
-                    mock_args.strategy = 'strategic'
-                    mock_args.dry_run = True
-                    mock_args.no_backup = True
-                    mock_args.no_recurse = False
-                    mock_args.func = mock_sync_local
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    result = main()
-                    
-                    mock_sync_local.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_sync_local = mocker.patch('cli.sync_local', return_value=0)
+        
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'sync-local'
+        mock_args.modes_dir = Path(str(modes_dir))
+        mock_args.project_dir = str(project_dir)
+        mock_args.strategy = 'strategic'
+        mock_args.dry_run = True
+        mock_args.no_backup = True
+        mock_args.func = mock_sync_local
+        
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        result = main()
+        
+        mock_sync_local.assert_called_once_with(mock_args)
+        assert result == 0
     
-    def test_backup_short_options(self, tmp_path):
+    def test_backup_short_options(self, tmp_path, base_args, mocker):
         """Test that short options work for backup command."""
         test_args = [
             'backup',
@@ -123,25 +141,23 @@ class TestCLIShortOptions:
             '-p', str(tmp_path)
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.backup_files') as mock_backup:
-                mock_backup.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'backup'
-                    mock_args.type = 'local'
-                    mock_args.project_dir = str(tmp_path)
-                    mock_args.func = mock_backup
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    result = main()
-                    
-                    mock_backup.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_backup = mocker.patch('cli.backup_files', return_value=0)
+        
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'backup'
+        mock_args.type = 'local'
+        mock_args.project_dir = str(tmp_path)
+        mock_args.func = mock_backup
+        
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        result = main()
+        
+        mock_backup.assert_called_once_with(mock_args)
+        assert result == 0
     
-    def test_restore_short_options(self, tmp_path):
+    def test_restore_short_options(self, tmp_path, base_args, mocker):
         """Test that short options work for restore command."""
         test_args = [
             'restore',
@@ -150,50 +166,46 @@ class TestCLIShortOptions:
             '-p', str(tmp_path)
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.restore_files') as mock_restore:
-                mock_restore.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'restore'
-                    mock_args.type = 'global'
-                    mock_args.backup_file = 'custom_modes_2.yaml'
-                    mock_args.project_dir = str(tmp_path)
-                    mock_args.func = mock_restore
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    result = main()
-                    
-                    mock_restore.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_restore = mocker.patch('cli.restore_files', return_value=0)
+        
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'restore'
+        mock_args.type = 'global'
+        mock_args.backup_file = 'custom_modes_2.yaml'
+        mock_args.project_dir = str(tmp_path)
+        mock_args.func = mock_restore
+        
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        result = main()
+        
+        mock_restore.assert_called_once_with(mock_args)
+        assert result == 0
     
-    def test_list_backups_short_options(self, tmp_path):
+    def test_list_backups_short_options(self, tmp_path, base_args, mocker):
         """Test that short options work for list-backups command."""
         test_args = [
             'list-backups',
             '-p', str(tmp_path)
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.list_backups') as mock_list:
-                mock_list.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'list-backups'
-                    mock_args.project_dir = str(tmp_path)
-                    mock_args.func = mock_list
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    result = main()
-                    
-                    mock_list.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_list = mocker.patch('cli.list_backups', return_value=0)
+        
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'list-backups'
+        mock_args.project_dir = str(tmp_path)
+        mock_args.func = mock_list
+        
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        result = main()
+        
+        mock_list.assert_called_once_with(mock_args)
+        assert result == 0
     
-    def test_no_recurse_short_option(self, tmp_path):
+    def test_no_recurse_short_option(self, tmp_path, base_args, mocker):
         """Test that -n (--no-recurse) short option works."""
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
@@ -204,64 +216,45 @@ class TestCLIShortOptions:
             '-n'  # no-recurse
         ]
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.list_modes') as mock_list:
-                mock_list.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'list'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.no_recurse = True
-                    mock_args.func = mock_list
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    result = main()
-                    
-                    mock_list.assert_called_once_with(mock_args)
-                    assert result == 0
+        mocker.patch('sys.argv', ['cli.py'] + test_args)
+        mock_list = mocker.patch('cli.list_modes', return_value=0)
+        
+        mock_args = copy.copy(base_args)
+        mock_args.command = 'list'
+        mock_args.modes_dir = Path(str(modes_dir))
+        mock_args.no_recurse = True
+        mock_args.func = mock_list
+        
+        mocker.patch('argparse.ArgumentParser.parse_args', return_value=mock_args)
+        
+        result = main()
+        
+        mock_list.assert_called_once_with(mock_args)
+        assert result == 0
 
 
 class TestCLIArgumentParsing:
     """Test detailed argument parsing functionality."""
     
-    def test_sync_global_config_short_option(self, tmp_path):
+    def test_sync_global_config_short_option(self, tmp_path, parser):
         """Test that -c (--config) short option works for sync-global."""
         config_file = tmp_path / "custom_config.yaml"
         config_file.touch()
         
-        test_args = [
-            'sync-global',
-            '-c', str(config_file)
-        ]
+        args = parser.parse_args(['sync-global', '-c', str(config_file)])
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_global') as mock_sync:
-                mock_sync.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-global'
-                    mock_args.config = str(config_file)
-                    mock_args.func = mock_sync
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    main()
-                    
-                    # Verify the config argument was passed correctly
-                    called_args = mock_sync.call_args[0][0]
-                    assert called_args.config == str(config_file)
+        assert args.command == 'sync-global'
+        assert args.config == str(config_file)
+        assert args.func is sync_global
     
-    def test_combined_short_options(self, tmp_path):
+    def test_combined_short_options(self, tmp_path, parser):
         """Test that multiple short options can be combined effectively."""
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         project_dir = tmp_path / "project"
         project_dir.mkdir()
         
-        test_args = [
+        args = parser.parse_args([
             'sync-local',
             str(project_dir),
             '-m', str(modes_dir),
@@ -269,105 +262,42 @@ class TestCLIArgumentParsing:
             '-d',
             '-b',
             '-n'
-        ]
+        ])
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_local') as mock_sync:
-                mock_sync.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-local'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.project_dir = str(project_dir)
-                    mock_args.strategy = 'alphabetical'
-                    mock_args.dry_run = True
-                    mock_args.no_backup = True
-                    mock_args.no_recurse = True
-                    mock_args.func = mock_sync
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    main()
-                    
-                    called_args = mock_sync.call_args[0][0]
-                    assert called_args.strategy == 'alphabetical'
-                    assert called_args.dry_run is True
-                    assert called_args.no_backup is True
-                    assert called_args.no_recurse is True
+        assert args.command == 'sync-local'
+        assert args.modes_dir == modes_dir
+        assert args.project_dir == str(project_dir)
+        assert args.strategy == 'alphabetical'
+        assert args.dry_run is True
+        assert args.no_backup is True
+        assert args.no_recurse is True
+        assert args.func is sync_local
 
 
 class TestCLIBackwardCompatibility:
     """Test that long options still work alongside short options."""
     
-    def test_long_options_still_work(self, tmp_path):
-        """Test that long options continue to work for backward compatibility."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        test_args = [
-            'sync-global',
-            '--modes-dir', str(modes_dir),
-            '--strategy', 'strategic',
-            '--dry-run',
-            '--no-backup',
-            '--no-recurse'
-        ]
-        
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_global') as mock_sync:
-                mock_sync.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-global'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.strategy = 'strategic'
-                    mock_args.dry_run = True
-                    mock_args.no_backup = True
-                    mock_args.no_recurse = True
-                    mock_args.func = mock_sync
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    main()
-                    
-                    mock_sync.assert_called_once_with(mock_args)
-    
-    def test_mixed_long_and_short_options(self, tmp_path):
-        """Test that long and short options can be mixed."""
+    @pytest.mark.parametrize("argv", [
+        # Long options only
+        ['sync-global', '--modes-dir', '{modes_dir}', '--strategy', 'strategic',
+         '--dry-run', '--no-backup', '--no-recurse'],
+        # Long and short options mixed
+        ['sync-global', '-m', '{modes_dir}', '--strategy', 'strategic', '-d', '--no-backup'],
+    ], ids=['long', 'mixed'])
+    def test_option_forms_equivalent(self, tmp_path, parser, argv):
+        """Test that long and mixed long/short option forms parse to the same values."""
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
+        argv = [arg.format(modes_dir=modes_dir) for arg in argv]
         
-        test_args = [
-            'sync-global',
-            '-m', str(modes_dir),
-            '--strategy', 'strategic',
-            '-d',
-            '--no-backup'
-        ]
+        args = parser.parse_args(argv)
         
-        with patch('sys.argv', ['cli.py'] + test_args):
-            with patch('cli.sync_global') as mock_sync:
-                mock_sync.return_value = 0
-                
-                with patch('argparse.ArgumentParser.parse_args') as mock_parse:
-                    mock_args = MagicMock()
-                    mock_args.command = 'sync-global'
-                    mock_args.modes_dir = Path(str(modes_dir))
-                    mock_args.strategy = 'strategic'
-                    mock_args.dry_run = True
-                    mock_args.no_backup = True
-                    mock_args.func = mock_sync
-                    
-                    mock_parse.return_value = mock_args
-                    
-                    main()
-                    
-                    called_args = mock_sync.call_args[0][0]
-                    assert called_args.strategy == 'strategic'
-                    assert called_args.dry_run is True
-                    assert called_args.no_backup is True
+        assert args.command == 'sync-global'
+        assert args.modes_dir == modes_dir
+        assert args.strategy == 'strategic'
+        assert args.dry_run is True
+        assert args.no_backup is True
+        assert args.func is sync_global
 
 
 class TestCLIIntegration:
@@ -375,21 +305,12 @@ class TestCLIIntegration:
     
     def test_real_argument_parsing_sync_global(self, tmp_path):
         """Test actual argument parsing for sync-global with short options."""
-        import argparse
-        from cli import main
         
         modes_dir = tmp_path / "modes"
         modes_dir.mkdir()
         
         # Create a simple test mode
-        test_mode = {
-            'slug': 'cli-test',
-            'name': 'CLI Test Mode',
-            'roleDefinition': 'A mode for CLI testing',
-            'groups': ['read']
-        }
-        with open(modes_dir / "cli-test.yaml", 'w') as f:
-            yaml.dump(test_mode, f)
+        (modes_dir / "cli-test.yaml").write_bytes(TEST_MODE_YAML["cli-test"])
         
         # Test that the parser actually accepts short options
         with patch('sys.argv', [
@@ -471,13 +392,12 @@ class TestCLIErrorHandling:
                 # Should return error code
                 assert result == 1
     
-    def test_missing_required_argument(self, tmp_path):
+    def test_missing_required_argument(self, parser):
         """Test that missing required arguments are handled properly."""
         # sync-local requires a project_dir argument
-        with patch('sys.argv', ['cli.py', 'sync-local']):
-            with pytest.raises(SystemExit):
-                # argparse should exit with error for missing required argument
-                main()
+        with pytest.raises(SystemExit):
+            # argparse should exit with error for missing required argument
+            parser.parse_args(['sync-local'])
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ from unittest.mock import patch
 
 from roo_modes_sync.core.sync import ModeSync
 from roo_modes_sync.core.validation import ModeValidator
+from roo_modes_sync.core.yaml_loaders import SafeDumper as _SafeDumper
 
 
 class TestSyncIntegration:
@@ -34,7 +35,7 @@ class TestSyncIntegration:
         
         mode_file = modes_dir / "test-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=_SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
@@ -70,7 +71,7 @@ class TestSyncIntegration:
         
         mode_file = modes_dir / "dev-test.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=_SafeDumper)
         
         # Initialize validator
         validator = ModeValidator()
@@ -112,7 +113,7 @@ class TestSyncIntegration:
             
             mode_file = modes_dir / f"{slug}.yaml"
             with open(mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+                yaml.dump(mode_config, f, Dumper=_SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
@@ -147,7 +148,7 @@ class TestSyncIntegration:
         
         mode_file = modes_dir / "clean-mode.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(clean_mode_config, f)
+            yaml.dump(clean_mode_config, f, Dumper=_SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
@@ -182,7 +183,7 @@ class TestSyncIntegration:
         
         mode_file = modes_dir / "unknown-meta.yaml"
         with open(mode_file, 'w') as f:
-            yaml.dump(mode_config, f)
+            yaml.dump(mode_config, f, Dumper=_SafeDumper)
         
         # Initialize sync system
         sync = ModeSync(modes_dir)
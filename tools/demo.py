@@ -6,77 +6,61 @@ Demo script to show the improved YAML output format for custom_modes.yaml
 import sys
 from pathlib import Path
 
+import yaml
+
 # Add the scripts directory to path to import our module
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from sync import ModeConfigSyncEnhanced as ModeConfigSync
+from roo_modes_sync.core.validation import ModeValidator
+from roo_modes_sync.core.yaml_loaders import SafeDumper
+
+# Example modes based on the schema; built once at import and shared by every run
+DEMO_CONFIG = {
+    'customModes': [
+        {
+            'slug': 'docs-writer',
+            'name': 'Documentation Writer',
+            'roleDefinition': 'You are a technical writer specializing in clear, concise developer documentation.\nYou focus on giving examples and step-by-step guides.',
+            'whenToUse': 'Use this mode whenever generating or editing user-facing docs.',
+            'customInstructions': '• Always include code snippets in fenced blocks.\n• Validate all YAML examples before publishing.',
+            'groups': [
+                'read',
+                'edit',
+                ['edit', {'fileRegex': r'\.(md|mdx)$', 'description': 'Markdown and MDX files only'}],
+                'browser'
+            ],
+            'source': 'global'
+        },
+        {
+            'slug': 'security-review',
+            'name': 'Security Reviewer',
+            'roleDefinition': 'You are a security expert reviewing code for vulnerabilities,\ninjection flaws, and insecure configurations.',
+            'whenToUse': 'Use this mode during code reviews for security audits.',
+            'groups': ['read', 'browser', 'command'],
+            'source': 'global'
+        }
+    ]
+}
+
 
-def demo_yaml_output():
+def demo_yaml_output(config=DEMO_CONFIG):
     """Demonstrate the corrected YAML output format."""
-    sync = ModeConfigSync()
-    
-    # Example modes based on the schema
-    test_config = {
-        'customModes': [
-            {
-                'slug': 'docs-writer',
-                'name': 'Documentation Writer',
-                'roleDefinition': 'You are a technical writer specializing in clear, concise developer documentation.\nYou focus on giving examples and step-by-step guides.',
-                'whenToUse': 'Use this mode whenever generating or editing user-facing docs.',
-                'customInstructions': '• Always include code snippets in fenced blocks.\n• Validate all YAML examples before publishing.',
-                'groups': [
-                    'read',
-                    'edit',
-                    ['edit', {'fileRegex': r'\.(md|mdx)$', 'description': 'Markdown and MDX files only'}],
-                    'browser'
-                ],
-                'source': 'global'
-            },
-            {
-                'slug': 'security-review',
-                'name': 'Security Reviewer',
-                'roleDefinition': 'You are a security expert reviewing code for vulnerabilities,\ninjection flaws, and insecure configurations.',
-                'whenToUse': 'Use this mode during code reviews for security audits.',
-                'groups': ['read', 'browser', 'command'],
-                'source': 'global'
-            }
-        ]
-    }
+    # One validator is built up front and reused for every mode
+    validator = ModeValidator()
     
     print("🎯 Enhanced YAML Output Format Demo")
     print("=" * 50)
     print()
     
-    # Generate the YAML output
-    # Create the config and get the YAML representation
-    config = test_config
-    
-    # Use the sync manager's formatting method to get YAML output
-    yaml_lines = ["customModes:"]
-    for mode in config['customModes']:
-        yaml_lines.append(f"  - slug: {mode['slug']}")
-        yaml_lines.append(f"    name: {sync.format_multiline_string(mode['name'], 4)}")
-        yaml_lines.append(f"    roleDefinition: {sync.format_multiline_string(mode['roleDefinition'], 4)}")
-        
-        if 'whenToUse' in mode:
-            yaml_lines.append(f"    whenToUse: {sync.format_multiline_string(mode['whenToUse'], 4)}")
-        
-        if 'customInstructions' in mode:
-            yaml_lines.append(f"    customInstructions: {sync.format_multiline_string(mode['customInstructions'], 4)}")
-        
-        yaml_lines.append("    groups:")
-        for group in mode['groups']:
-            if isinstance(group, str):
-                yaml_lines.append(f"      - {group}")
-            elif isinstance(group, list) and len(group) == 2:
-                yaml_lines.append(f"      - - {group[0]}")
-                yaml_lines.append(f"        - fileRegex: {group[1]['fileRegex']}")
-                if 'description' in group[1]:
-                    yaml_lines.append(f"          description: {group[1]['description']}")
-        
-        yaml_lines.append(f"    source: {mode['source']}")
-    
-    yaml_output = "\n".join(yaml_lines)
+    # Serialize the whole config in one pass, with libyaml's emitter when available
+    yaml_output = yaml.dump(
+        config,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        width=4096
+    )
     
     print("Generated custom_modes.yaml:")
     print("-" * 30)
@@ -88,7 +72,7 @@ def demo_yaml_output():
     is_valid = True
     try:
         for mode in config['customModes']:
-            sync.validate_mode_schema(mode, mode['slug'])
+            validator.validate_mode_config(mode, f"{mode['slug']}.yaml")
         print("✅ All modes passed validation")
     except Exception as e:
         print(f"❌ Validation failed: {e}")